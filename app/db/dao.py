@@ -2,7 +2,7 @@
 数据访问对象(DAO)模块 - 升级版
 Data Access Object Module - 提供各表的CRUD操作
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field
 from .db import get_db, Database
 import json
@@ -217,6 +217,19 @@ class IndicatorCategoryDAO(BaseDAO):
         self.db.commit()
         return cursor.lastrowid
     
+    def create_many(self, categories: List[IndicatorCategory]) -> List[int]:
+        """批量创建分类（保存点内写入、单次提交），返回新ID列表"""
+        ids = []
+        with self.db.savepoint("category_create_many"):
+            for category in categories:
+                cursor = self.db.execute(
+                    "INSERT INTO indicator_category (name, desc) VALUES (?, ?)",
+                    (category.name, category.desc)
+                )
+                ids.append(cursor.lastrowid)
+        self.db.commit()
+        return ids
+    
     def update(self, category: IndicatorCategory) -> bool:
         self.db.execute(
             "UPDATE indicator_category SET name=?, desc=? WHERE id=?",
@@ -435,6 +448,18 @@ class FMEAItemDAO(BaseDAO):
         self.db.commit()
         return cursor.lastrowid
     
+    def bulk_create(self, items: List[FMEAItem]) -> int:
+        """批量创建FMEA条目（保存点内executemany、单次提交），返回写入条数"""
+        if not items:
+            return 0
+        with self.db.savepoint("fmea_bulk_create"):
+            self.db.executemany(
+                "INSERT INTO fmea_item (mission_id, system, failure_mode, effect, cause, control, S, O, D) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(i.mission_id, i.system, i.failure_mode, i.effect, i.cause, i.control, i.S, i.O, i.D) for i in items]
+            )
+        self.db.commit()
+        return len(items)
+    
     def update(self, item: FMEAItem) -> bool:
         self.db.execute(
             "UPDATE fmea_item SET mission_id=?, system=?, failure_mode=?, effect=?, cause=?, control=?, S=?, O=?, D=? WHERE id=?",
@@ -462,6 +487,47 @@ class FMEAItemDAO(BaseDAO):
         rows = self.db.fetchall("SELECT * FROM fmea_item WHERE mission_id=? ORDER BY id", (mission_id,))
         return [FMEAItem(**dict(row)) for row in rows]
     
+    def get_all_with_mission_name(self, mission_id: Optional[int] = None,
+                                  limit: Optional[int] = None, offset: int = 0) -> List[Tuple[FMEAItem, str, int]]:
+        """
+        一次JOIN查询FMEA条目、所属任务名称及RPN，返回 [(item, mission_name, rpn), ...]
+        
+        RPN（S×O×D）在SQL中计算。
+        
+        Args:
+            mission_id: 只查询该任务的条目，None 表示全部
+            limit/offset: 分页参数，limit 为 None 时不分页
+        """
+        sql = """SELECT f.*, m.name AS mission_name, f.S * f.O * f.D AS rpn FROM fmea_item f
+                 LEFT JOIN mission m ON f.mission_id = m.id"""
+        params: tuple = ()
+        if mission_id is not None:
+            sql += " WHERE f.mission_id=?"
+            params = (mission_id,)
+        sql += " ORDER BY f.id"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += (limit, offset)
+        rows = self.db.fetchall(sql, params)
+        result = []
+        for row in rows:
+            data = dict(row)
+            mission_name = data.pop('mission_name') or ""
+            rpn = data.pop('rpn')
+            result.append((FMEAItem(**data), mission_name, rpn))
+        return result
+    
+    def get_rpn_stats(self, mission_id: Optional[int] = None, high_rpn: int = 300) -> Tuple[int, int, int]:
+        """在数据库端汇总RPN统计，返回 (条目数, RPN总和, RPN超过high_rpn的条目数)"""
+        sql = """SELECT COUNT(*) AS cnt, COALESCE(SUM(S*O*D), 0) AS total_rpn,
+                        COALESCE(SUM(S*O*D > ?), 0) AS high_cnt FROM fmea_item"""
+        params: tuple = (high_rpn,)
+        if mission_id is not None:
+            sql += " WHERE mission_id=?"
+            params += (mission_id,)
+        row = self.db.fetchone(sql, params)
+        return row['cnt'], row['total_rpn'], row['high_cnt']
+    
     def count(self) -> int:
         row = self.db.fetchone("SELECT COUNT(*) as cnt FROM fmea_item")
         return row['cnt'] if row else 0
@@ -704,6 +770,21 @@ class FTANodeDAO(BaseDAO):
         self.db.commit()
         return cursor.lastrowid
     
+    def create_many(self, nodes: List[FTANode]) -> List[int]:
+        """批量创建节点（保存点内写入、单次提交），返回新ID列表"""
+        ids = []
+        with self.db.savepoint("fta_node_create_many"):
+            for node in nodes:
+                cursor = self.db.execute(
+                    """INSERT INTO fta_node (mission_id, name, node_type, gate_type, 
+                       probability, severity, desc) VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                    (node.mission_id, node.name, node.node_type, node.gate_type,
+                     node.probability, node.severity, node.desc)
+                )
+                ids.append(cursor.lastrowid)
+        self.db.commit()
+        return ids
+    
     def update(self, node: FTANode) -> bool:
         self.db.execute(
             """UPDATE fta_node SET mission_id=?, name=?, node_type=?, gate_type=?,
@@ -770,6 +851,18 @@ class FTAEdgeDAO(BaseDAO):
         self.db.commit()
         return cursor.lastrowid
     
+    def bulk_create(self, edges: List[FTAEdge]) -> int:
+        """批量创建边（保存点内executemany、单次提交），返回写入条数"""
+        if not edges:
+            return 0
+        with self.db.savepoint("fta_edge_bulk_create"):
+            self.db.executemany(
+                "INSERT INTO fta_edge (parent_id, child_id) VALUES (?, ?)",
+                [(e.parent_id, e.child_id) for e in edges]
+            )
+        self.db.commit()
+        return len(edges)
+    
     def delete(self, edge_id: int) -> bool:
         self.db.execute("DELETE FROM fta_edge WHERE id=?", (edge_id,))
         self.db.commit()
@@ -791,6 +884,17 @@ class FTAEdgeDAO(BaseDAO):
         rows = self.db.fetchall("SELECT child_id FROM fta_edge WHERE parent_id=?", (parent_id,))
         return [row['child_id'] for row in rows]
     
+    def get_edges_for_nodes(self, parent_ids: List[int]) -> List[Tuple[int, int]]:
+        """一次查询给定父节点的全部出边，返回 [(parent_id, child_id), ...]"""
+        if not parent_ids:
+            return []
+        placeholders = ",".join("?" * len(parent_ids))
+        rows = self.db.fetchall(
+            f"SELECT parent_id, child_id FROM fta_edge WHERE parent_id IN ({placeholders}) ORDER BY id",
+            tuple(parent_ids)
+        )
+        return [(row['parent_id'], row['child_id']) for row in rows]
+    
     def get_parent(self, child_id: int) -> Optional[int]:
         row = self.db.fetchone("SELECT parent_id FROM fta_edge WHERE child_id=?", (child_id,))
         if row:
@@ -805,6 +909,23 @@ class FTAEdgeDAO(BaseDAO):
             (mission_id,)
         )
         return [FTAEdge(**dict(row)) for row in rows]
+    
+    def get_edges_with_names(self, mission_id: int) -> List[Tuple[int, str, str]]:
+        """
+        获取任务的全部边及父/子节点名称，返回 [(edge_id, parent_name, child_name), ...]
+        
+        节点名称在SQL中连接得到；子节点缺失时以其ID代替名称。
+        """
+        rows = self.db.fetchall(
+            """SELECT e.id, p.name AS parent_name,
+                      COALESCE(c.name, CAST(e.child_id AS TEXT)) AS child_name
+               FROM fta_edge e
+               JOIN fta_node p ON e.parent_id = p.id
+               LEFT JOIN fta_node c ON e.child_id = c.id
+               WHERE p.mission_id=? ORDER BY e.id""",
+            (mission_id,)
+        )
+        return [(row['id'], row['parent_name'], row['child_name']) for row in rows]
 
 
 class ModelConfigDAO(BaseDAO):
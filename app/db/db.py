@@ -4,6 +4,8 @@ Database Connection and Initialization Module
 """
 import sqlite3
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
@@ -12,9 +14,18 @@ DB_DIR = Path(__file__).parent.parent.parent / "data"
 DB_PATH = DB_DIR / "risk_assessment.db"
 SCHEMA_PATH = Path(__file__).parent / "schema.sql"
 
+# 等待其他线程释放写锁的最长时间（秒）；批量导入按批提交，单批持锁时间很短
+BUSY_TIMEOUT = 30.0
+
 
 class Database:
-    """数据库连接管理类"""
+    """
+    数据库连接管理类
+    
+    每个线程使用各自的sqlite连接与事务状态：后台线程（导入、评估、线程池任务）
+    处于 transaction() 中时，其他线程的写入照常各自提交，不会被并入或随之回滚。
+    sqlite同一时间只允许一个写事务，其他线程的写入最多等待 BUSY_TIMEOUT 秒。
+    """
     
     _instance: Optional['Database'] = None
     
@@ -27,21 +38,45 @@ class Database:
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         
         self.db_path = db_path
-        self.conn: Optional[sqlite3.Connection] = None
+        # 线程本地状态：conn（本线程的连接）、tx_depth（transaction() 嵌套深度）、
+        # generation（连接所属的代次，close()后其他线程的旧连接在下次使用时重建）。
+        # 线程结束时其本地状态被释放，连接随之关闭。
+        self._local = threading.local()
+        self._generation = 0
+    
+    @property
+    def conn(self) -> Optional[sqlite3.Connection]:
+        """当前线程的连接（尚未连接时为None）"""
+        if getattr(self._local, 'generation', None) != self._generation:
+            return None
+        return self._local.conn
+    
+    @property
+    def _tx_depth(self) -> int:
+        return getattr(self._local, 'tx_depth', 0)
+    
+    @_tx_depth.setter
+    def _tx_depth(self, value: int):
+        self._local.tx_depth = value
         
     def connect(self) -> sqlite3.Connection:
-        """获取数据库连接"""
-        if self.conn is None:
-            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            self.conn.row_factory = sqlite3.Row  # 返回字典形式的结果
-            self.conn.execute("PRAGMA foreign_keys = ON")  # 启用外键约束
-        return self.conn
+        """获取当前线程的数据库连接（首次使用时创建）"""
+        conn = self.conn
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT)
+            conn.row_factory = sqlite3.Row  # 返回字典形式的结果
+            conn.execute("PRAGMA foreign_keys = ON")  # 启用外键约束
+            self._local.conn = conn
+            self._local.generation = self._generation
+        return conn
     
     def close(self):
-        """关闭数据库连接"""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+        """关闭当前线程的连接，并使其他线程的连接在下次使用时重建"""
+        conn = self.conn
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+        self._generation += 1
     
     def init_schema(self):
         """初始化数据库Schema"""
@@ -65,10 +100,49 @@ class Database:
         return cursor
     
     def commit(self):
-        """提交事务"""
-        if self.conn:
+        """提交事务（处于 transaction() 中时推迟到退出时统一提交）"""
+        if self.conn and self._tx_depth == 0:
             self.conn.commit()
     
+    @contextmanager
+    def transaction(self):
+        """
+        事务上下文：期间DAO各自的commit被合并为退出时的一次提交，
+        发生异常则整体回滚
+        """
+        self._tx_depth += 1
+        try:
+            yield self
+        except Exception:
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                self.rollback()
+            raise
+        self._tx_depth -= 1
+        self.commit()
+    
+    @contextmanager
+    def savepoint(self, name: str):
+        """
+        保存点：异常时只撤销保存点之后的修改，之前未提交的修改保留
+        
+        可嵌套在 transaction() 中使用；保存点释放后不会自行提交，
+        仍由随后的commit（或外层transaction退出）统一提交。
+        DAO的批量写入方法（create_many/bulk_create）用它包裹本批插入，
+        失败时只撤销本批，不影响同一事务中此前的修改。
+        """
+        conn = self.connect()
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield self
+        except Exception:
+            conn.execute(f"ROLLBACK TO {name}")
+            conn.execute(f"RELEASE {name}")
+            raise
+        conn.execute(f"RELEASE {name}")
+    
     def rollback(self):
         """回滚事务"""
         if self.conn:
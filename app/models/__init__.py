@@ -15,12 +15,34 @@ from .base import (
     ModelRegistry, register_model
 )
 
-# Core models
-from .risk_matrix import RiskMatrixModel
-from .fmea import FMEAModel
-from .sensitivity import SensitivityModel
+# 模型实现按需加载：首次访问时才导入对应子模块（注册由 ModelRegistry 查询时完成）
+_LAZY_EXPORTS = {
+    # Core models
+    "RiskMatrixModel": "risk_matrix",
+    "FMEAModel": "fmea",
+    "SensitivityModel": "sensitivity",
+    # New models for upgraded system
+    "FTAModel": "fta",
+    "AHPImprovedModel": "ahp_improved",
+    "MonteCarloModel": "monte_carlo",
+    "MCEventStats": "monte_carlo",
+    "MCGlobalStats": "monte_carlo",
+    "MCAHPStats": "monte_carlo",
+    # Shared mission data loader
+    "MissionArrays": "mission_data",
+    "load_mission_arrays": "mission_data",
+}
 
-# New models for upgraded system
-from .fta import FTAModel
-from .ahp_improved import AHPImprovedModel
-from .monte_carlo import MonteCarloModel, MCEventStats, MCGlobalStats, MCAHPStats
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
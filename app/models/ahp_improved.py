@@ -4,11 +4,13 @@ Improved AHP Model with Normal Distribution Density Weight Correction
 """
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
+from functools import cached_property
 import math
 import json
 import numpy as np
 
 from .base import ModelBase, ModelResult, ParamSpec, ParamType, register_model
+from .types import DISPLAY_NAME_LEN
 from ..db.dao import (
     Indicator, IndicatorDAO, IndicatorValue, IndicatorValueDAO,
     RiskDataset, RiskDatasetDAO
@@ -29,6 +31,11 @@ class AHPIndicatorResult:
     z_score: float            # z分数
     mu: float                  # 参考均值
     sigma: float               # 参考标准差
+    
+    @cached_property
+    def display_name(self) -> str:
+        """截断后的指标显示名称（首次访问时计算）"""
+        return self.indicator_name[:DISPLAY_NAME_LEN]
 
 
 @dataclass
@@ -51,6 +58,7 @@ class AHPResult:
                 {
                     "indicator_id": r.indicator_id,
                     "indicator_name": r.indicator_name,
+                    "display_name": r.display_name,
                     "raw_value": r.raw_value,
                     "normalized_value": r.normalized_value,
                     "original_weight": r.original_weight,
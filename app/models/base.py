@@ -178,11 +178,18 @@ class ModelRegistry:
     """
     模型注册器 - 管理所有可用的风险评估模型
     
-    使用单例模式确保全局唯一
+    使用单例模式确保全局唯一。内置模型模块在首次查询时才导入（导入即通过
+    @register_model 完成注册），应用启动时不加载模型实现。
     """
     
+    # 内置模型所在的 app.models 子模块
+    BUILTIN_MODULES = (
+        "risk_matrix", "fmea", "sensitivity", "fta", "ahp_improved", "monte_carlo"
+    )
+    
     _instance = None
     _models: Dict[str, ModelBase] = {}
+    _builtin_loaded = False
     
     def __new__(cls):
         if cls._instance is None:
@@ -190,6 +197,21 @@ class ModelRegistry:
             cls._instance._models = {}
         return cls._instance
     
+    def _load_builtin(self) -> None:
+        """导入尚未加载的内置模型模块"""
+        if ModelRegistry._builtin_loaded:
+            return
+        ModelRegistry._builtin_loaded = True
+        from importlib import import_module
+        for module_name in self.BUILTIN_MODULES:
+            import_module(f"{__package__}.{module_name}")
+        # 部分模型可能已被直接导入而先行注册，按内置顺序重排，保证列表顺序稳定
+        order = {f"{__package__}.{m}": i for i, m in enumerate(self.BUILTIN_MODULES)}
+        self._models = dict(sorted(
+            self._models.items(),
+            key=lambda item: order.get(type(item[1]).__module__, len(order))
+        ))
+    
     def register(self, model: ModelBase) -> None:
         """注册一个模型"""
         self._models[model.model_id] = model
@@ -201,26 +223,32 @@ class ModelRegistry:
     
     def get(self, model_id: str) -> Optional[ModelBase]:
         """获取指定模型实例"""
+        self._load_builtin()
         return self._models.get(model_id)
     
     def get_all(self) -> List[ModelBase]:
         """获取所有已注册模型"""
+        self._load_builtin()
         return list(self._models.values())
     
     def get_model_ids(self) -> List[str]:
         """获取所有已注册模型ID"""
+        self._load_builtin()
         return list(self._models.keys())
     
     def get_models_by_category(self, category: str) -> List[ModelBase]:
         """按分类获取模型"""
+        self._load_builtin()
         return [m for m in self._models.values() if m.category == category]
     
     def get_all_info(self) -> List[Dict[str, Any]]:
         """获取所有模型的信息"""
+        self._load_builtin()
         return [m.get_info() for m in self._models.values()]
     
     def list_models(self) -> Dict[str, Dict[str, Any]]:
         """列出所有模型及其信息"""
+        self._load_builtin()
         result = {}
         for model_id, model in self._models.items():
             result[model_id] = {
@@ -2,7 +2,8 @@
 FMEA计算模型
 FMEA Model - Severity × Occurrence × Detection = RPN
 """
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 from ..db.dao import FMEAItem, FMEAItemDAO
 from .types import FMEARiskLevel, FMEAItemResult, FMEAResult
 from .base import ModelBase, ModelResult, ParamSpec, ParamType, register_model
@@ -59,7 +60,8 @@ class FMEAModel(ModelBase):
         运行FMEA评估
         
         Args:
-            context: 包含mission_id和params的字典
+            context: 包含mission_id和params的字典，
+                     可选data（load_mission_arrays的结果，提供时不再查询数据库）
             
         Returns:
             ModelResult: 包含所有评估结果的对象
@@ -78,7 +80,8 @@ class FMEAModel(ModelBase):
         
         try:
             # 获取该任务的所有FMEA条目
-            items = self.dao.get_by_mission(mission_id)
+            data = context.get("data")
+            items = list(data.fmea_items) if data is not None else self.dao.get_by_mission(mission_id)
             
             if not items:
                 return ModelResult(
@@ -173,60 +176,82 @@ class FMEAModel(ModelBase):
         """
         根据FMEA结果生成建议
         
+        建议只取决于高/极高RPN条目与Top-N条目的O/D值，
+        以其字段元组为键缓存，重复评估同一任务时直接复用。
+        
         Args:
             result: FMEA评估结果
             
         Returns:
             建议列表
         """
-        recommendations = []
-        
-        # 统计高RPN条目
-        extreme_items = [i for i in result.items if i.level == "Extreme"]
-        high_items = [i for i in result.items if i.level == "High"]
+        high_key = tuple(
+            (i.level, i.failure_mode, i.system, i.RPN, i.S, i.O, i.D)
+            for i in result.items if i.level in ("Extreme", "High")
+        )
+        top_key = tuple((i.failure_mode, i.O, i.D) for i in result.top_n)
+        return list(_fmea_recommendations(high_key, top_key))
+
+
+@lru_cache(maxsize=16)
+def _fmea_recommendations(
+        high_key: Tuple[Tuple[str, str, str, int, int, int, int], ...],
+        top_key: Tuple[Tuple[str, int, int], ...]) -> Tuple[str, ...]:
+    """
+    生成FMEA建议（带缓存）
+    
+    Args:
+        high_key: 高/极高RPN条目的 (level, failure_mode, system, RPN, S, O, D) 元组
+        top_key: Top-N条目的 (failure_mode, O, D) 元组
+    """
+    recommendations = []
+    
+    # 统计高RPN条目
+    extreme_items = [i for i in high_key if i[0] == "Extreme"]
+    high_items = [i for i in high_key if i[0] == "High"]
+    
+    if extreme_items:
+        recommendations.append(
+            f"存在 {len(extreme_items)} 个极高RPN条目（RPN>600），需紧急处理："
+        )
+        recommendations.append("　• 立即评估是否需要更改设计")
+        recommendations.append("　• 增加冗余检测手段，降低D值")
+        recommendations.append("　• 加强工艺控制，降低O值")
         
-        if extreme_items:
+        for _, mode, system, rpn, s, o, d in extreme_items[:3]:
             recommendations.append(
-                f"存在 {len(extreme_items)} 个极高RPN条目（RPN>600），需紧急处理："
+                f"　　- 【{mode}】({system}) RPN={rpn} (S={s}, O={o}, D={d})"
             )
-            recommendations.append("　• 立即评估是否需要更改设计")
-            recommendations.append("　• 增加冗余检测手段，降低D值")
-            recommendations.append("　• 加强工艺控制，降低O值")
-            
-            for i in extreme_items[:3]:
-                recommendations.append(
-                    f"　　- 【{i.failure_mode}】({i.system}) RPN={i.RPN} (S={i.S}, O={i.O}, D={i.D})"
-                )
+    
+    if high_items:
+        recommendations.append(
+            f"存在 {len(high_items)} 个高RPN条目（RPN 301-600），建议优化："
+        )
+        recommendations.append("　• 评估增加检测环节的可行性")
+        recommendations.append("　• 考虑增加预防性维护措施")
+        recommendations.append("　• 加强操作人员培训")
         
-        if high_items:
+        for _, mode, system, rpn, s, o, d in high_items[:3]:
             recommendations.append(
-                f"存在 {len(high_items)} 个高RPN条目（RPN 301-600），建议优化："
+                f"　　- 【{mode}】({system}) RPN={rpn} (S={s}, O={o}, D={d})"
             )
-            recommendations.append("　• 评估增加检测环节的可行性")
-            recommendations.append("　• 考虑增加预防性维护措施")
-            recommendations.append("　• 加强操作人员培训")
-            
-            for i in high_items[:3]:
-                recommendations.append(
-                    f"　　- 【{i.failure_mode}】({i.system}) RPN={i.RPN} (S={i.S}, O={i.O}, D={i.D})"
-                )
-        
-        # 针对高O值和高D值给出具体建议
-        high_o_items = [i for i in result.top_n if i.O >= 7]
-        high_d_items = [i for i in result.top_n if i.D >= 7]
-        
-        if high_o_items:
-            recommendations.append(f"以下条目发生度(O)较高，建议通过工艺改进降低：")
-            for i in high_o_items[:2]:
-                recommendations.append(f"　　- {i.failure_mode}: O={i.O}")
-        
-        if high_d_items:
-            recommendations.append(f"以下条目检测度(D)较高，建议增加检测手段：")
-            for i in high_d_items[:2]:
-                recommendations.append(f"　　- {i.failure_mode}: D={i.D}")
-        
-        if not extreme_items and not high_items:
-            recommendations.append("当前FMEA状态良好，无极高或高RPN条目。")
-            recommendations.append("　• 建议定期复查并更新FMEA分析")
-        
-        return recommendations
+    
+    # 针对高O值和高D值给出具体建议
+    high_o_items = [(mode, o) for mode, o, _ in top_key if o >= 7]
+    high_d_items = [(mode, d) for mode, _, d in top_key if d >= 7]
+    
+    if high_o_items:
+        recommendations.append(f"以下条目发生度(O)较高，建议通过工艺改进降低：")
+        for mode, o in high_o_items[:2]:
+            recommendations.append(f"　　- {mode}: O={o}")
+    
+    if high_d_items:
+        recommendations.append(f"以下条目检测度(D)较高，建议增加检测手段：")
+        for mode, d in high_d_items[:2]:
+            recommendations.append(f"　　- {mode}: D={d}")
+    
+    if not extreme_items and not high_items:
+        recommendations.append("当前FMEA状态良好，无极高或高RPN条目。")
+        recommendations.append("　• 建议定期复查并更新FMEA分析")
+    
+    return tuple(recommendations)
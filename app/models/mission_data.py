@@ -0,0 +1,54 @@
+"""
+任务数据加载器
+Mission Data Loader - 一次评估中多个模型共享同一份风险事件/FMEA数据
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from ..db.dao import RiskEventDAO, FMEAItemDAO
+
+
+MissionArrays = namedtuple("MissionArrays", [
+    "mission_id",
+    "events",       # Tuple[RiskEvent, ...]
+    "fmea_items",   # Tuple[FMEAItem, ...]
+    "risk_L",       # 各风险事件的可能性
+    "risk_S",       # 各风险事件的严重度
+    "fmea_S",
+    "fmea_O",
+    "fmea_D",
+    "event_ids",
+    "event_names",
+])
+
+
+def _frozen_array(values) -> np.ndarray:
+    """构造只读数组（同一份结果在多个模型/线程间共享，禁止原地修改）"""
+    arr = np.array(values, dtype=np.int32)
+    arr.flags.writeable = False
+    return arr
+
+
+def load_mission_arrays(mission_id: int) -> MissionArrays:
+    """
+    加载任务的风险事件与FMEA条目
+
+    风险矩阵、FMEA、蒙特卡洛、敏感性分析都以 data= 接收该结果，
+    一次评估只查询一次数据库。
+    """
+    events = tuple(RiskEventDAO().get_by_mission(mission_id))
+    items = tuple(FMEAItemDAO().get_by_mission(mission_id))
+
+    return MissionArrays(
+        mission_id=mission_id,
+        events=events,
+        fmea_items=items,
+        risk_L=_frozen_array([e.likelihood for e in events]),
+        risk_S=_frozen_array([e.severity for e in events]),
+        fmea_S=_frozen_array([i.S for i in items]),
+        fmea_O=_frozen_array([i.O for i in items]),
+        fmea_D=_frozen_array([i.D for i in items]),
+        event_ids=_frozen_array([e.id for e in events]),
+        event_names=np.array([e.name for e in events], dtype=object),
+    )
@@ -5,10 +5,13 @@ Monte Carlo Uncertainty Analysis Model with Distribution-based Sampling
 import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
+from functools import cached_property
 import json
 import math
 
 from .base import ModelBase, ModelResult, ParamSpec, ParamType, register_model
+from .mission_data import load_mission_arrays
+from .types import DISPLAY_NAME_LEN
 from ..db.dao import (
     RiskEvent, FMEAItem, RiskEventDAO, FMEAItemDAO,
     RiskDataset, RiskDatasetDAO, Indicator, IndicatorDAO
@@ -27,6 +30,11 @@ class MCEventStats:
     p90: float
     p95: float
     prob_high: float
+    
+    @cached_property
+    def display_name(self) -> str:
+        """截断后的显示名称（首次访问时计算）"""
+        return self.event_name[:DISPLAY_NAME_LEN]
 
 
 @dataclass
@@ -63,7 +71,15 @@ class MonteCarloResult:
     event_stats: List[MCEventStats] = field(default_factory=list)
     global_stats: Optional[MCGlobalStats] = None
     ahp_stats: Optional[MCAHPStats] = None
-    histogram_data: List[float] = field(default_factory=list)
+    # 全局指标的原始样本（float32，直接交给直方图分箱）
+    samples: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.float32), repr=False, compare=False
+    )
+    
+    @property
+    def histogram_data(self) -> List[float]:
+        """全局指标样本列表（兼容旧接口）"""
+        return self.samples.tolist()
     
     def to_dict(self) -> Dict[str, Any]:
         result = {
@@ -82,7 +98,7 @@ class MonteCarloResult:
                     "prob_high": s.prob_high
                 } for s in self.event_stats
             ],
-            "histogram_data": self.histogram_data[:100]  # 限制输出大小
+            "histogram_data": self.samples[:100].tolist()  # 限制输出大小
         }
         
         if self.global_stats:
@@ -214,12 +230,16 @@ class MonteCarloModel(ModelBase):
             if seed >= 0:
                 np.random.seed(seed)
             
-            if params.get("run_risk_matrix", True):
-                rm_result = self.run_risk_matrix(mission_id, n_samples)
+            rm_result, fmea_result = self.run_combined(
+                mission_id,
+                run_rm=params.get("run_risk_matrix", True),
+                run_fmea=params.get("run_fmea", True),
+                n_samples=n_samples,
+                seed=seed if seed >= 0 else None
+            )
+            if rm_result:
                 results["risk_matrix"] = rm_result.to_dict()
-            
-            if params.get("run_fmea", True):
-                fmea_result = self.run_fmea(mission_id, n_samples)
+            if fmea_result:
                 results["fmea"] = fmea_result.to_dict()
             
             if params.get("run_ahp", True):
@@ -241,29 +261,31 @@ class MonteCarloModel(ModelBase):
                 error_message=f"{str(e)}\n{traceback.format_exc()}"
             )
     
-    def _sample_discrete(self, nominal: int, min_val: int, max_val: int) -> int:
-        """离散抽样：以名义值为中心，允许±1波动"""
-        candidates = []
-        probs = []
-        
-        candidates.append(nominal)
-        probs.append(0.6)
-        
-        if nominal - 1 >= min_val:
-            candidates.append(nominal - 1)
-            probs.append(0.2)
+    @staticmethod
+    def _discrete_offsets(u: np.ndarray, nominal: np.ndarray,
+                          min_val: int, max_val: int) -> np.ndarray:
+        """
+        离散抽样（向量化）：以名义值为中心，允许±1波动
         
-        if nominal + 1 <= max_val:
-            candidates.append(nominal + 1)
-            probs.append(0.2)
+        名义值概率0.6，±1各0.2；越界的一侧剔除后重新归一化。
         
-        total_prob = sum(probs)
-        probs = [p / total_prob for p in probs]
+        Args:
+            u: (n_samples, n_vars) 的 [0, 1) 均匀随机数
+            nominal: (n_vars,) 名义值
         
-        return np.random.choice(candidates, p=probs)
+        Returns:
+            int8 采样矩阵（等级取值不超过10）
+        """
+        p_minus = np.where(nominal - 1 >= min_val, 0.2, 0.0)
+        p_plus = np.where(nominal + 1 <= max_val, 0.2, 0.0)
+        total = 0.6 + p_minus + p_plus
+        lower = p_minus / total             # u < lower        -> -1
+        upper = (p_minus + 0.6) / total     # u >= upper       -> +1
+        return (nominal.astype(np.int8)
+                + (u >= upper).view(np.int8) - (u < lower).view(np.int8))
     
     def _sample_by_distribution(self, dist_type: str, params: Dict, 
-                                 default_value: float) -> float:
+                                 default_value: float, size: Optional[int] = None):
         """
         按分布类型采样
         
@@ -271,27 +293,28 @@ class MonteCarloModel(ModelBase):
             dist_type: 分布类型
             params: 分布参数
             default_value: 默认值（当参数缺失时使用）
+            size: 采样数量；为None时返回单个值，否则返回 (size,) 数组
         """
         if dist_type == "normal":
             mu = params.get("mu", default_value)
             sigma = params.get("sigma", max(1e-6, abs(default_value) * 0.1))
-            return np.random.normal(mu, sigma)
+            return np.random.normal(mu, sigma, size)
         
         elif dist_type == "lognormal":
             mu = params.get("mu", math.log(max(1e-6, default_value)))
             sigma = params.get("sigma", 0.5)
-            return np.random.lognormal(mu, sigma)
+            return np.random.lognormal(mu, sigma, size)
         
         elif dist_type == "uniform":
             low = params.get("low", default_value * 0.8)
             high = params.get("high", default_value * 1.2)
-            return np.random.uniform(low, high)
+            return np.random.uniform(low, high, size)
         
         elif dist_type == "triangular":
             low = params.get("low", default_value * 0.8)
             mode = params.get("mode", default_value)
             high = params.get("high", default_value * 1.2)
-            return np.random.triangular(low, mode, high)
+            return np.random.triangular(low, mode, high, size)
         
         elif dist_type == "discrete":
             values = params.get("values", [default_value])
@@ -299,151 +322,146 @@ class MonteCarloModel(ModelBase):
             if len(probs) != len(values):
                 probs = [1.0 / len(values)] * len(values)
             probs = np.array(probs) / sum(probs)
-            return np.random.choice(values, p=probs)
+            return np.random.choice(values, size=size, p=probs)
         
         else:  # categorical or unknown
             # 默认添加±10%扰动
-            return np.random.normal(default_value, max(1e-6, abs(default_value) * 0.1))
+            return np.random.normal(default_value, max(1e-6, abs(default_value) * 0.1), size)
     
-    def run_risk_matrix(self, mission_id: int, n_samples: int = None) -> MonteCarloResult:
-        """运行风险矩阵的蒙特卡洛分析"""
-        if n_samples is None:
-            n_samples = self.n_samples
+    def run_combined(self, mission_id: int, run_rm: bool = True, run_fmea: bool = True,
+                     n_samples: int = None, seed: Optional[int] = None, data=None
+                     ) -> Tuple[Optional[MonteCarloResult], Optional[MonteCarloResult]]:
+        """
+        一次性运行风险矩阵与FMEA的蒙特卡洛分析
         
-        events = self.risk_dao.get_by_mission(mission_id)
+        所有事件的L/S与所有FMEA条目的S/O/D拼成一个 (n_samples, K) 矩阵，
+        用一次随机数调用完成采样，再切片分别计算R与RPN。
         
-        if not events:
-            return MonteCarloResult(
-                model_type="risk_matrix",
-                n_samples=n_samples,
-                global_stats=MCGlobalStats(
-                    indicator_name="Total Risk",
-                    nominal_value=0, mean=0, std=0, p50=0, p90=0, p95=0, prob_high=0
-                )
-            )
+        Args:
+            data: 预加载的任务数据（load_mission_arrays），提供时不再查询数据库
         
-        all_r_samples = [[] for _ in events]
-        total_risk_samples = []
-        
-        for _ in range(n_samples):
-            r_values = []
-            for i, event in enumerate(events):
-                l = self._sample_discrete(event.likelihood, 1, 5)
-                s = self._sample_discrete(event.severity, 1, 5)
-                r = l * s
-                r_values.append(r)
-                all_r_samples[i].append(r)
-            total_risk_samples.append(sum(r_values))
-        
-        event_stats = []
-        for i, event in enumerate(events):
-            samples = np.array(all_r_samples[i])
-            nominal_r = event.likelihood * event.severity
-            event_stats.append(MCEventStats(
-                event_id=event.id,
-                event_name=event.name,
-                nominal_R=nominal_r,
-                mean=round(float(np.mean(samples)), 2),
-                std=round(float(np.std(samples)), 2),
-                p50=round(float(np.percentile(samples, 50)), 2),
-                p90=round(float(np.percentile(samples, 90)), 2),
-                p95=round(float(np.percentile(samples, 95)), 2),
-                prob_high=round(float(np.mean(samples >= 10)), 4)
-            ))
-        
-        total_samples = np.array(total_risk_samples)
-        nominal_total = sum(e.likelihood * e.severity for e in events)
-        high_threshold = 10 * len(events)
+        Returns:
+            (风险矩阵MC结果, FMEA MC结果)，未运行的一项为None
+        """
+        if n_samples is None:
+            n_samples = self.n_samples
         
-        global_stats = MCGlobalStats(
-            indicator_name="Total Risk (sum of R)",
-            nominal_value=float(nominal_total),
-            mean=round(float(np.mean(total_samples)), 2),
-            std=round(float(np.std(total_samples)), 2),
-            p50=round(float(np.percentile(total_samples, 50)), 2),
-            p90=round(float(np.percentile(total_samples, 90)), 2),
-            p95=round(float(np.percentile(total_samples, 95)), 2),
-            prob_high=round(float(np.mean(total_samples >= high_threshold)), 4)
-        )
+        if data is None:
+            data = load_mission_arrays(mission_id)
+        events = data.events if run_rm else ()
+        items = data.fmea_items if run_fmea else ()
+        n_ev, n_fm = len(events), len(items)
+        
+        rng = np.random.default_rng(seed)
+        u = rng.random((n_samples, 2 * n_ev + 3 * n_fm), dtype=np.float32)
+        
+        rm_result = None
+        if run_rm:
+            if events:
+                nominal = np.concatenate([data.risk_L, data.risk_S])
+                ls = self._discrete_offsets(u[:, :2 * n_ev], nominal, 1, 5)
+                r_samples = ls[:, :n_ev] * ls[:, n_ev:]         # R ≤ 25，int8足够
+                rm_result = self._build_result(
+                    "risk_matrix", n_samples, events,
+                    names=[e.name for e in events],
+                    nominal=(data.risk_L * data.risk_S).tolist(),
+                    samples=r_samples, high=10,
+                    global_name="Total Risk (sum of R)"
+                )
+            else:
+                rm_result = self._empty_result("risk_matrix", n_samples, "Total Risk")
+        
+        fmea_result = None
+        if run_fmea:
+            if items:
+                nominal = np.concatenate([data.fmea_S, data.fmea_O, data.fmea_D])
+                sod = self._discrete_offsets(u[:, 2 * n_ev:], nominal, 1, 10).astype(np.int16)
+                rpn_samples = sod[:, :n_fm] * sod[:, n_fm:2 * n_fm] * sod[:, 2 * n_fm:]  # RPN ≤ 1000
+                fmea_result = self._build_result(
+                    "fmea", n_samples, items,
+                    names=[i.failure_mode for i in items],
+                    nominal=(data.fmea_S * data.fmea_O * data.fmea_D).tolist(),
+                    samples=rpn_samples, high=300,
+                    global_name="Total RPN"
+                )
+            else:
+                fmea_result = self._empty_result("fmea", n_samples, "Total RPN")
         
+        return rm_result, fmea_result
+    
+    @staticmethod
+    def _empty_result(model_type: str, n_samples: int, indicator_name: str) -> MonteCarloResult:
         return MonteCarloResult(
-            model_type="risk_matrix",
+            model_type=model_type,
             n_samples=n_samples,
-            event_stats=event_stats,
-            global_stats=global_stats,
-            histogram_data=total_risk_samples
+            global_stats=MCGlobalStats(
+                indicator_name=indicator_name,
+                nominal_value=0, mean=0, std=0, p50=0, p90=0, p95=0, prob_high=0
+            )
         )
     
-    def run_fmea(self, mission_id: int, n_samples: int = None) -> MonteCarloResult:
-        """运行FMEA的蒙特卡洛分析"""
-        if n_samples is None:
-            n_samples = self.n_samples
-        
-        items = self.fmea_dao.get_by_mission(mission_id)
+    @staticmethod
+    def _build_result(model_type: str, n_samples: int, rows: list, names: List[str],
+                      nominal: List[int], samples: np.ndarray, high: int,
+                      global_name: str) -> MonteCarloResult:
+        """
+        由采样矩阵计算事件统计与全局统计
         
-        if not items:
-            return MonteCarloResult(
-                model_type="fmea",
-                n_samples=n_samples,
-                global_stats=MCGlobalStats(
-                    indicator_name="Total RPN",
-                    nominal_value=0, mean=0, std=0, p50=0, p90=0, p95=0, prob_high=0
-                )
+        Args:
+            samples: (n_samples, n) 每个事件的采样风险值（int8/int16整数）
+            high: 单个事件的高风险阈值，全局阈值为 high × n
+        """
+        mean = samples.mean(axis=0)
+        std = samples.std(axis=0)
+        p50, p90, p95 = np.percentile(samples, [50, 90, 95], axis=0)
+        prob_high = (samples >= high).mean(axis=0)
+        
+        event_stats = [
+            MCEventStats(
+                event_id=row.id,
+                event_name=names[k],
+                nominal_R=nominal[k],
+                mean=round(float(mean[k]), 2),
+                std=round(float(std[k]), 2),
+                p50=round(float(p50[k]), 2),
+                p90=round(float(p90[k]), 2),
+                p95=round(float(p95[k]), 2),
+                prob_high=round(float(prob_high[k]), 4)
             )
+            for k, row in enumerate(rows)
+        ]
         
-        all_rpn_samples = [[] for _ in items]
-        total_rpn_samples = []
-        
-        for _ in range(n_samples):
-            rpn_values = []
-            for i, item in enumerate(items):
-                s = self._sample_discrete(item.S, 1, 10)
-                o = self._sample_discrete(item.O, 1, 10)
-                d = self._sample_discrete(item.D, 1, 10)
-                rpn = s * o * d
-                rpn_values.append(rpn)
-                all_rpn_samples[i].append(rpn)
-            total_rpn_samples.append(sum(rpn_values))
-        
-        event_stats = []
-        for i, item in enumerate(items):
-            samples = np.array(all_rpn_samples[i])
-            nominal_rpn = item.S * item.O * item.D
-            event_stats.append(MCEventStats(
-                event_id=item.id,
-                event_name=item.failure_mode,
-                nominal_R=nominal_rpn,
-                mean=round(float(np.mean(samples)), 2),
-                std=round(float(np.std(samples)), 2),
-                p50=round(float(np.percentile(samples, 50)), 2),
-                p90=round(float(np.percentile(samples, 90)), 2),
-                p95=round(float(np.percentile(samples, 95)), 2),
-                prob_high=round(float(np.mean(samples >= 300)), 4)
-            ))
-        
-        total_samples = np.array(total_rpn_samples)
-        nominal_total = sum(i.S * i.O * i.D for i in items)
-        high_threshold = 300 * len(items)
-        
+        total_samples = samples.sum(axis=1, dtype=np.int32)
+        g50, g90, g95 = np.percentile(total_samples, [50, 90, 95])
         global_stats = MCGlobalStats(
-            indicator_name="Total RPN",
-            nominal_value=float(nominal_total),
-            mean=round(float(np.mean(total_samples)), 2),
-            std=round(float(np.std(total_samples)), 2),
-            p50=round(float(np.percentile(total_samples, 50)), 2),
-            p90=round(float(np.percentile(total_samples, 90)), 2),
-            p95=round(float(np.percentile(total_samples, 95)), 2),
-            prob_high=round(float(np.mean(total_samples >= high_threshold)), 4)
+            indicator_name=global_name,
+            nominal_value=float(sum(nominal)),
+            mean=round(float(total_samples.mean()), 2),
+            std=round(float(total_samples.std()), 2),
+            p50=round(float(g50), 2),
+            p90=round(float(g90), 2),
+            p95=round(float(g95), 2),
+            prob_high=round(float(np.mean(total_samples >= high * len(rows))), 4)
         )
         
         return MonteCarloResult(
-            model_type="fmea",
+            model_type=model_type,
             n_samples=n_samples,
             event_stats=event_stats,
             global_stats=global_stats,
-            histogram_data=total_rpn_samples
+            samples=total_samples.astype(np.float32)
         )
     
+    def run_risk_matrix(self, mission_id: int, n_samples: int = None,
+                        seed: Optional[int] = None, data=None) -> MonteCarloResult:
+        """运行风险矩阵的蒙特卡洛分析"""
+        return self.run_combined(mission_id, True, False, n_samples, seed, data)[0]
+    
+    def run_fmea(self, mission_id: int, n_samples: int = None,
+                 seed: Optional[int] = None, data=None) -> MonteCarloResult:
+        """运行FMEA的蒙特卡洛分析"""
+        return self.run_combined(mission_id, False, True, n_samples, seed, data)[1]
+    
     def run_ahp_score(self, mission_id: int, n_samples: int = None) -> MonteCarloResult:
         """
         运行AHP综合得分的蒙特卡洛分析
@@ -494,32 +512,21 @@ class MonteCarloModel(ModelBase):
         # 计算名义综合得分
         nominal_score = self._calc_ahp_score(all_indicators)
         
-        # 蒙特卡洛采样
-        score_samples = []
-        
-        for _ in range(n_samples):
-            # 采样每个指标
-            sampled_indicators = []
-            for ind in all_indicators:
-                dist_type = ind.get("distribution_type", "normal")
-                dist_params = ind.get("dist_params", {})
-                if not dist_params:
-                    dist_params = {"mu": ind.get("mu", ind["value"]), 
-                                   "sigma": ind.get("sigma", 1.0)}
-                
-                sampled_value = self._sample_by_distribution(
-                    dist_type, dist_params, ind["value"]
-                )
-                
-                sampled_ind = ind.copy()
-                sampled_ind["value"] = sampled_value
-                sampled_indicators.append(sampled_ind)
+        # 蒙特卡洛采样：每个指标一次抽取全部样本，得到 (n_samples, n_indicators) 矩阵
+        values = np.empty((n_samples, len(all_indicators)))
+        for k, ind in enumerate(all_indicators):
+            dist_type = ind.get("distribution_type", "normal")
+            dist_params = ind.get("dist_params", {})
+            if not dist_params:
+                dist_params = {"mu": ind.get("mu", ind["value"]), 
+                               "sigma": ind.get("sigma", 1.0)}
             
-            # 计算采样得分
-            score = self._calc_ahp_score(sampled_indicators)
-            score_samples.append(score)
+            values[:, k] = self._sample_by_distribution(
+                dist_type, dist_params, ind["value"], size=n_samples
+            )
         
-        score_arr = np.array(score_samples)
+        # 一次计算所有样本的得分
+        score_arr = self._calc_ahp_scores(all_indicators, values)
         
         ahp_stats = MCAHPStats(
             nominal_score=round(nominal_score, 4),
@@ -536,7 +543,7 @@ class MonteCarloModel(ModelBase):
             model_type="ahp_score",
             n_samples=n_samples,
             ahp_stats=ahp_stats,
-            histogram_data=score_samples
+            samples=score_arr.astype(np.float32)
         )
     
     def _calc_ahp_score(self, indicators: List[Dict]) -> float:
@@ -544,39 +551,49 @@ class MonteCarloModel(ModelBase):
         if not indicators:
             return 0
         
-        total_weight = sum(ind.get("weight", 1.0) for ind in indicators)
-        if total_weight == 0:
-            total_weight = len(indicators)
-        
-        score = 0
-        weight_correction_sum = 0
-        
-        results = []
-        for ind in indicators:
-            x = ind.get("value", 0)
-            w = ind.get("weight", 1.0) / total_weight
-            mu = ind.get("mu", x)
-            sigma = ind.get("sigma", max(1e-6, abs(x) * 0.1))
-            
-            if sigma < 1e-10:
-                sigma = 1e-6
-            
-            z = (x - mu) / sigma
-            c = (1.0 / (sigma * math.sqrt(2 * math.pi))) * math.exp(-0.5 * z * z)
-            
-            weight_correction_sum += w * c
-            results.append({"w": w, "c": c, "z": z})
+        values = np.array([[ind.get("value", 0) for ind in indicators]], dtype=float)
+        return float(self._calc_ahp_scores(indicators, values)[0])
+    
+    @staticmethod
+    def _calc_ahp_scores(indicators: List[Dict], values: np.ndarray) -> np.ndarray:
+        """
+        批量计算AHP综合得分（向量化）
         
-        for i, r in enumerate(results):
-            if weight_correction_sum > 0:
-                w_prime = (r["w"] * r["c"]) / weight_correction_sum
-            else:
-                w_prime = 1.0 / len(results)
-            
-            r_i = 1 / (1 + math.exp(-r["z"]))  # sigmoid映射
-            score += w_prime * r_i
+        Args:
+            indicators: 指标定义（权重、mu、sigma）
+            values: (n_samples, n_indicators) 各样本的指标取值
         
-        return score
+        Returns:
+            (n_samples,) 综合得分
+        """
+        n = len(indicators)
+        weights = np.array([ind.get("weight", 1.0) for ind in indicators], dtype=float)
+        total_weight = weights.sum()
+        if total_weight == 0:
+            total_weight = n
+        w = weights / total_weight
+        
+        # 未给出mu/sigma的指标按当前取值推导（mu=x，sigma=|x|×10%）
+        has_mu = np.array(["mu" in ind for ind in indicators])
+        has_sigma = np.array(["sigma" in ind for ind in indicators])
+        mu_const = np.array([ind.get("mu", 0.0) for ind in indicators], dtype=float)
+        sigma_const = np.array([ind.get("sigma", 0.0) for ind in indicators], dtype=float)
+        
+        mu = np.where(has_mu, mu_const, values)
+        sigma = np.where(has_sigma, sigma_const, np.maximum(1e-6, np.abs(values) * 0.1))
+        sigma = np.where(sigma < 1e-10, 1e-6, sigma)
+        
+        with np.errstate(over="ignore"):
+            z = (values - mu) / sigma
+            c = (1.0 / (sigma * math.sqrt(2 * math.pi))) * np.exp(-0.5 * z * z)
+            r = 1 / (1 + np.exp(-z))  # sigmoid映射
+        
+        wc = w * c
+        weight_correction_sum = wc.sum(axis=1, keepdims=True)
+        positive = weight_correction_sum > 0
+        w_prime = np.where(positive, wc / np.where(positive, weight_correction_sum, 1.0), 1.0 / n)
+        
+        return (w_prime * r).sum(axis=1)
     
     @staticmethod
     def generate_recommendations(result: MonteCarloResult) -> List[str]:
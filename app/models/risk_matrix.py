@@ -2,7 +2,8 @@
 风险矩阵计算模型
 Risk Matrix Model - Likelihood × Severity
 """
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 from ..db.dao import RiskEvent, RiskEventDAO
 from .types import RiskLevel, RiskEventResult, RiskMatrixResult
 from .base import ModelBase, ModelResult, ParamSpec, ParamType, register_model
@@ -59,7 +60,8 @@ class RiskMatrixModel(ModelBase):
         运行风险矩阵评估
         
         Args:
-            context: 包含mission_id和params的字典
+            context: 包含mission_id和params的字典，
+                     可选data（load_mission_arrays的结果，提供时不再查询数据库）
             
         Returns:
             ModelResult: 包含所有评估结果的对象
@@ -78,7 +80,8 @@ class RiskMatrixModel(ModelBase):
         
         try:
             # 获取该任务的所有风险事件
-            events = self.dao.get_by_mission(mission_id)
+            data = context.get("data")
+            events = list(data.events) if data is not None else self.dao.get_by_mission(mission_id)
             
             if not events:
                 # 返回空结果
@@ -196,44 +199,63 @@ class RiskMatrixModel(ModelBase):
         """
         根据风险矩阵结果生成建议
         
+        建议只取决于高/极高风险事件，以其字段元组为键缓存，
+        重复评估同一任务时直接复用。
+        
         Args:
             result: 风险矩阵评估结果
             
         Returns:
             建议列表
         """
-        recommendations = []
-        
-        # 统计高风险和极高风险事件
-        extreme_events = [e for e in result.events if e.level == "Extreme"]
-        high_events = [e for e in result.events if e.level == "High"]
-        
-        if extreme_events:
-            recommendations.append(
-                f"存在 {len(extreme_events)} 个极高风险事件，建议立即采取以下措施："
-            )
-            recommendations.append("　• 启动终止系统或紧急预案")
-            recommendations.append("　• 增加冗余设计和备份系统")
-            recommendations.append("　• 加强操作复核和安全检查")
-            recommendations.append("　• 严格落区管控，确保人员安全疏散")
-            
-            for e in extreme_events[:3]:  # 只列出前3个
-                recommendations.append(f"　　- 【{e.name}】(L={e.likelihood}, S={e.severity}, R={e.risk_score})")
-        
-        if high_events:
-            recommendations.append(
-                f"存在 {len(high_events)} 个高风险事件，建议采取以下措施："
-            )
-            recommendations.append("　• 增加测试验证次数")
-            recommendations.append("　• 实施操作人员二次复核")
-            recommendations.append("　• 建立实时监控和预警机制")
-            
-            for e in high_events[:3]:
-                recommendations.append(f"　　- 【{e.name}】(L={e.likelihood}, S={e.severity}, R={e.risk_score})")
+        key = tuple(
+            (e.level, e.name, e.likelihood, e.severity, e.risk_score)
+            for e in result.events if e.level in ("Extreme", "High")
+        )
+        return list(_risk_matrix_recommendations(key))
+
+
+@lru_cache(maxsize=16)
+def _risk_matrix_recommendations(
+        key: Tuple[Tuple[str, str, int, int, int], ...]) -> Tuple[str, ...]:
+    """
+    生成风险矩阵建议（带缓存）
+    
+    Args:
+        key: 高/极高风险事件的 (level, name, L, S, R) 元组，按事件顺序排列
+    """
+    recommendations = []
+    
+    # 统计高风险和极高风险事件
+    extreme_events = [e for e in key if e[0] == "Extreme"]
+    high_events = [e for e in key if e[0] == "High"]
+    
+    if extreme_events:
+        recommendations.append(
+            f"存在 {len(extreme_events)} 个极高风险事件，建议立即采取以下措施："
+        )
+        recommendations.append("　• 启动终止系统或紧急预案")
+        recommendations.append("　• 增加冗余设计和备份系统")
+        recommendations.append("　• 加强操作复核和安全检查")
+        recommendations.append("　• 严格落区管控，确保人员安全疏散")
         
-        if not extreme_events and not high_events:
-            recommendations.append("当前无极高或高风险事件，风险状态良好。")
-            recommendations.append("　• 建议继续保持现有安全措施")
-            recommendations.append("　• 定期复查风险评估结果")
+        for _, name, l, s, r in extreme_events[:3]:  # 只列出前3个
+            recommendations.append(f"　　- 【{name}】(L={l}, S={s}, R={r})")
+    
+    if high_events:
+        recommendations.append(
+            f"存在 {len(high_events)} 个高风险事件，建议采取以下措施："
+        )
+        recommendations.append("　• 增加测试验证次数")
+        recommendations.append("　• 实施操作人员二次复核")
+        recommendations.append("　• 建立实时监控和预警机制")
         
-        return recommendations
+        for _, name, l, s, r in high_events[:3]:
+            recommendations.append(f"　　- 【{name}】(L={l}, S={s}, R={r})")
+    
+    if not extreme_events and not high_events:
+        recommendations.append("当前无极高或高风险事件，风险状态良好。")
+        recommendations.append("　• 建议继续保持现有安全措施")
+        recommendations.append("　• 定期复查风险评估结果")
+    
+    return tuple(recommendations)
@@ -3,8 +3,11 @@
 Sensitivity Analysis Model - One-at-a-Time (OAT)
 """
 from typing import List, Dict, Any
+
+import numpy as np
+
 from ..db.dao import RiskEvent, FMEAItem, RiskEventDAO, FMEAItemDAO
-from .types import SensitivityResult, SensitivityFactor
+from .types import SensitivityResult, SensitivityFactor, DISPLAY_NAME_LEN
 from .base import ModelBase, ModelResult, ParamSpec, ParamType, register_model
 
 
@@ -99,7 +102,7 @@ class SensitivityModel(ModelBase):
                 error_message=str(e)
             )
     
-    def run_risk_matrix(self, mission_id: int) -> SensitivityResult:
+    def run_risk_matrix(self, mission_id: int, data=None) -> SensitivityResult:
         """
         运行风险矩阵的敏感性分析
         
@@ -107,11 +110,12 @@ class SensitivityModel(ModelBase):
         
         Args:
             mission_id: 任务ID
+            data: 预加载的任务数据（load_mission_arrays），可选
             
         Returns:
             SensitivityResult: 敏感性分析结果
         """
-        events = self.risk_dao.get_by_mission(mission_id)
+        events = list(data.events) if data is not None else self.risk_dao.get_by_mission(mission_id)
         
         if not events:
             return SensitivityResult(
@@ -122,73 +126,19 @@ class SensitivityModel(ModelBase):
                 top_n=[]
             )
         
-        # 计算基准总风险
-        base_total = sum(e.likelihood * e.severity for e in events)
-        
-        factors: List[SensitivityFactor] = []
-        
-        for event in events:
-            # 分析 L 参数
-            base_r = event.likelihood * event.severity
-            
-            # L-1
-            l_minus = max(1, event.likelihood - 1)
-            r_l_minus = l_minus * event.severity
-            total_l_minus = base_total - base_r + r_l_minus
-            
-            # L+1
-            l_plus = min(5, event.likelihood + 1)
-            r_l_plus = l_plus * event.severity
-            total_l_plus = base_total - base_r + r_l_plus
-            
-            impact_l = max(abs(total_l_minus - base_total), abs(total_l_plus - base_total))
-            
-            factors.append(SensitivityFactor(
-                factor_name=f"{event.name}_L",
-                base_value=float(base_total),
-                minus_value=float(total_l_minus),
-                plus_value=float(total_l_plus),
-                impact_score=float(impact_l),
-                event_id=event.id,
-                param_type="L"
-            ))
-            
-            # 分析 S 参数
-            # S-1
-            s_minus = max(1, event.severity - 1)
-            r_s_minus = event.likelihood * s_minus
-            total_s_minus = base_total - base_r + r_s_minus
-            
-            # S+1
-            s_plus = min(5, event.severity + 1)
-            r_s_plus = event.likelihood * s_plus
-            total_s_plus = base_total - base_r + r_s_plus
-            
-            impact_s = max(abs(total_s_minus - base_total), abs(total_s_plus - base_total))
-            
-            factors.append(SensitivityFactor(
-                factor_name=f"{event.name}_S",
-                base_value=float(base_total),
-                minus_value=float(total_s_minus),
-                plus_value=float(total_s_plus),
-                impact_score=float(impact_s),
-                event_id=event.id,
-                param_type="S"
-            ))
-        
-        # 按影响分数排序
-        sorted_factors = sorted(factors, key=lambda x: x.impact_score, reverse=True)
-        top_n_factors = sorted_factors[:self.top_n]
+        if data is not None:
+            params = np.column_stack([data.risk_L, data.risk_S])
+        else:
+            params = np.array([[e.likelihood, e.severity] for e in events])
         
-        return SensitivityResult(
-            model_type="risk_matrix",
-            global_indicator="Total Risk",
-            base_global_value=float(base_total),
-            factors=factors,
-            top_n=top_n_factors
+        # 分析每个事件的 L 和 S 参数
+        return self._oat_analysis(
+            "risk_matrix", "Total Risk", params, perturb_cols=[0, 1],
+            labels=["L", "S"], max_level=5,
+            names=[e.name for e in events], ids=[e.id for e in events]
         )
     
-    def run_fmea(self, mission_id: int) -> SensitivityResult:
+    def run_fmea(self, mission_id: int, data=None) -> SensitivityResult:
         """
         运行FMEA的敏感性分析
         
@@ -196,11 +146,12 @@ class SensitivityModel(ModelBase):
         
         Args:
             mission_id: 任务ID
+            data: 预加载的任务数据（load_mission_arrays），可选
             
         Returns:
             SensitivityResult: 敏感性分析结果
         """
-        items = self.fmea_dao.get_by_mission(mission_id)
+        items = list(data.fmea_items) if data is not None else self.fmea_dao.get_by_mission(mission_id)
         
         if not items:
             return SensitivityResult(
@@ -211,63 +162,72 @@ class SensitivityModel(ModelBase):
                 top_n=[]
             )
         
-        # 计算基准总RPN
-        base_total = sum(item.S * item.O * item.D for item in items)
+        if data is not None:
+            params = np.column_stack([data.fmea_S, data.fmea_O, data.fmea_D])
+        else:
+            params = np.array([[i.S, i.O, i.D] for i in items])
         
-        factors: List[SensitivityFactor] = []
+        # 分析 O 参数（发生度，最常被改进）与 D 参数（检测度）
+        return self._oat_analysis(
+            "fmea", "Total RPN", params, perturb_cols=[1, 2],
+            labels=["O", "D"], max_level=10,
+            names=[i.failure_mode[:DISPLAY_NAME_LEN] for i in items], ids=[i.id for i in items]
+        )
+    
+    def _oat_analysis(self, model_type: str, global_indicator: str,
+                      params: np.ndarray, perturb_cols: List[int], labels: List[str],
+                      max_level: int, names: List[str], ids: List[int]) -> SensitivityResult:
+        """
+        One-at-a-Time分析（向量化）
         
-        for item in items:
-            base_rpn = item.S * item.O * item.D
-            
-            # 分析 O 参数（发生度，最常被改进）
-            o_minus = max(1, item.O - 1)
-            rpn_o_minus = item.S * o_minus * item.D
-            total_o_minus = base_total - base_rpn + rpn_o_minus
-            
-            o_plus = min(10, item.O + 1)
-            rpn_o_plus = item.S * o_plus * item.D
-            total_o_plus = base_total - base_rpn + rpn_o_plus
-            
-            impact_o = max(abs(total_o_minus - base_total), abs(total_o_plus - base_total))
-            
-            factors.append(SensitivityFactor(
-                factor_name=f"{item.failure_mode[:15]}_O",
-                base_value=float(base_total),
-                minus_value=float(total_o_minus),
-                plus_value=float(total_o_plus),
-                impact_score=float(impact_o),
-                event_id=item.id,
-                param_type="O"
-            ))
-            
-            # 分析 D 参数（检测度）
-            d_minus = max(1, item.D - 1)
-            rpn_d_minus = item.S * item.O * d_minus
-            total_d_minus = base_total - base_rpn + rpn_d_minus
-            
-            d_plus = min(10, item.D + 1)
-            rpn_d_plus = item.S * item.O * d_plus
-            total_d_plus = base_total - base_rpn + rpn_d_plus
-            
-            impact_d = max(abs(total_d_minus - base_total), abs(total_d_plus - base_total))
-            
-            factors.append(SensitivityFactor(
-                factor_name=f"{item.failure_mode[:15]}_D",
+        每行风险值为该行各参数之积，全局指标为各行风险值之和。
+        对 perturb_cols 中的每个参数做±1变化（限制在 [1, max_level]），
+        一次广播计算所有行、所有参数的扰动结果。
+        
+        Args:
+            params: (n_rows, n_params) 参数矩阵
+            perturb_cols: 需要扰动的参数列
+            labels: 各扰动参数的名称后缀，与 perturb_cols 一一对应
+            names: 各行名称
+            ids: 各行ID
+        """
+        params = params.astype(np.int64)
+        base_rows = params.prod(axis=1)
+        base_total = int(base_rows.sum())
+        
+        # 其余参数之积：(n_rows, n_perturb)
+        others = np.column_stack([
+            np.delete(params, c, axis=1).prod(axis=1) for c in perturb_cols
+        ])
+        p = params[:, perturb_cols]
+        rest = base_total - base_rows[:, None]
+        minus = rest + others * np.maximum(p - 1, 1)
+        plus = rest + others * np.minimum(p + 1, max_level)
+        impact = np.maximum(np.abs(minus - base_total), np.abs(plus - base_total))
+        
+        # 按行展开，保持 [行0参数a, 行0参数b, 行1参数a, ...] 的顺序
+        minus, plus, impact = minus.ravel(), plus.ravel(), impact.ravel()
+        n_perturb = len(perturb_cols)
+        factors: List[SensitivityFactor] = [
+            SensitivityFactor(
+                factor_name=f"{names[k // n_perturb]}_{labels[k % n_perturb]}",
                 base_value=float(base_total),
-                minus_value=float(total_d_minus),
-                plus_value=float(total_d_plus),
-                impact_score=float(impact_d),
-                event_id=item.id,
-                param_type="D"
-            ))
+                minus_value=float(minus[k]),
+                plus_value=float(plus[k]),
+                impact_score=float(impact[k]),
+                event_id=ids[k // n_perturb],
+                param_type=labels[k % n_perturb]
+            )
+            for k in range(len(impact))
+        ]
         
-        # 按影响分数排序
-        sorted_factors = sorted(factors, key=lambda x: x.impact_score, reverse=True)
-        top_n_factors = sorted_factors[:self.top_n]
+        # 按影响分数降序排序（稳定排序，同分保持原顺序）
+        order = np.argsort(-impact, kind="stable")[:self.top_n]
+        top_n_factors = [factors[k] for k in order]
         
         return SensitivityResult(
-            model_type="fmea",
-            global_indicator="Total RPN",
+            model_type=model_type,
+            global_indicator=global_indicator,
             base_global_value=float(base_total),
             factors=factors,
             top_n=top_n_factors
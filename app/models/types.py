@@ -3,10 +3,15 @@
 Type Definitions for Risk Assessment Models
 """
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Dict, Any, Optional
 from enum import Enum
 
 
+# 界面表格/图表中名称的最大显示长度（display_name 截断长度）
+DISPLAY_NAME_LEN = 15
+
+
 class RiskLevel(Enum):
     """风险矩阵等级（基于 L×S = R）"""
     LOW = "Low"         # 1-4
@@ -82,6 +87,11 @@ class RiskEventResult:
     level: str       # RiskLevel.value
     hazard_type: str = ""
     desc: str = ""
+    
+    @cached_property
+    def display_name(self) -> str:
+        """截断后的显示名称（首次访问时计算）"""
+        return self.name[:DISPLAY_NAME_LEN]
 
 
 @dataclass
@@ -136,6 +146,11 @@ class FMEAItemResult:
     D: int  # 检测度 1-10
     RPN: int  # RPN = S × O × D
     level: str  # FMEARiskLevel.value
+    
+    @cached_property
+    def display_name(self) -> str:
+        """截断后的失效模式显示名称（首次访问时计算）"""
+        return self.failure_mode[:DISPLAY_NAME_LEN]
 
 
 @dataclass
@@ -294,6 +309,10 @@ class EvaluationResult:
     ahp_result: Optional[Dict[str, Any]] = None  # 改进AHP综合评估结果
     figures: Dict[str, str] = field(default_factory=dict)  # 图表文件路径
     recommendations: List[str] = field(default_factory=list)  # 建议列表
+    created_at_safe: str = field(init=False, repr=False)  # 可用作目录名的时间戳（不序列化）
+    
+    def __post_init__(self):
+        self.created_at_safe = self.created_at.replace(":", "-").replace(" ", "_")
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为可JSON序列化的字典"""
@@ -161,10 +161,6 @@ class MainWindow(QMainWindow):
             self.page_fmea.refresh_all()
         elif index == 3:
             self.page_targets.refresh_missions()
-        elif index == 4:
-            self.page_fusion.refresh_missions()
-        elif index == 5:
-            self.page_fta.refresh_missions()
         elif index == 6:
             self.page_model.refresh_missions()
         elif index == 7:
@@ -183,8 +179,8 @@ class MainWindow(QMainWindow):
             self.page_data.refresh_all()
             self.page_fmea.refresh_all()
             self.page_targets.refresh_missions()
-            self.page_fusion.refresh_missions()
-            self.page_fta.refresh_missions()
+            self.page_fusion.reload()
+            self.page_fta.reload()
             self.page_model.refresh_missions()
             self.page_eval.refresh_missions()
             
@@ -201,8 +197,8 @@ class MainWindow(QMainWindow):
         self.page_eval.refresh_missions()
         # 刷新新页面
         self.page_targets.refresh_missions()
-        self.page_fusion.refresh_missions()
-        self.page_fta.refresh_missions()
+        self.page_fusion.reload()
+        self.page_fta.reload()
         self.status_bar.showMessage("数据已更新", 3000)
     
     def _on_evaluation_completed(self):
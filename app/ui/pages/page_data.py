@@ -20,9 +20,8 @@ from ...db.dao import (
     IndicatorValue, IndicatorValueDAO,
     RiskEvent, RiskEventDAO
 )
-from ...utils.excel_import import (
-    ExcelTemplate, ExcelImporter, DataBatchImporter
-)
+from ...utils.excel_import import ExcelTemplate
+from ..widgets.import_runner import ImportRunner
 
 
 class BaseEditDialog(QDialog):
@@ -235,8 +234,17 @@ class DataManagementPage(QWidget):
     
     data_changed = pyqtSignal()
     
+    # 导入类型 -> (数据名称, 数据库错误标题)
+    _IMPORT_LABELS = {
+        'missions': ("任务", "数据库错误"),
+        'categories': ("指标分类", "数据库提示"),
+        'indicators': ("指标", "数据库错误"),
+        'risk_events': ("风险事件", "数据库错误"),
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._import_runner = ImportRunner(self)
         self._init_ui()
         self.refresh_all()
     
@@ -789,161 +797,38 @@ class DataManagementPage(QWidget):
             except Exception as e:
                 QMessageBox.critical(self, "错误", f"生成模板时发生错误:\n{str(e)}")
     
+    def _start_import(self, kind: str, title: str):
+        """选择文件（可多选）并在后台线程中执行解析与入库"""
+        label, db_label = self._IMPORT_LABELS[kind]
+        self._import_runner.start(kind, title, label,
+                                  lambda: self._on_imported(kind), db_label=db_label)
+    
+    def _on_imported(self, kind: str):
+        """导入成功后刷新对应的表格"""
+        if kind == 'missions':
+            self._refresh_missions()
+            self.data_changed.emit()
+        elif kind == 'categories':
+            self._refresh_categories()
+        elif kind == 'indicators':
+            self._refresh_indicators()
+            self._refresh_categories()  # 可能创建了新分类
+        elif kind == 'risk_events':
+            self._refresh_risks()
+            self.data_changed.emit()
+    
     def _import_missions(self):
         """导入任务数据"""
-        filename, _ = QFileDialog.getOpenFileName(
-            self, "选择任务数据文件", os.getcwd(),
-            "Excel/CSV文件 (*.xlsx *.xls *.csv)"
-        )
-        if not filename:
-            return
-        
-        try:
-            # 解析文件
-            importer = ExcelImporter()
-            missions, errors = importer.import_missions(filename)
-            
-            if not missions and errors:
-                QMessageBox.warning(self, "导入失败", 
-                    "文件解析失败:\n" + "\n".join(errors[:5]))
-                return
-            
-            # 批量导入数据库
-            batch_importer = DataBatchImporter()
-            success_count, db_errors = batch_importer.batch_import_missions(missions)
-            
-            # 显示结果
-            msg = f"成功导入 {success_count}/{len(missions)} 条任务"
-            if errors:
-                msg += f"\n\n解析警告 ({len(errors)}):\n" + "\n".join(errors[:3])
-            if db_errors:
-                msg += f"\n\n数据库错误 ({len(db_errors)}):\n" + "\n".join(db_errors[:3])
-            
-            if success_count > 0:
-                QMessageBox.information(self, "导入完成", msg)
-                self._refresh_missions()
-                self.data_changed.emit()
-            else:
-                QMessageBox.warning(self, "导入失败", msg)
-                
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"导入过程出错:\n{str(e)}")
+        self._start_import('missions', "选择任务数据文件")
     
     def _import_categories(self):
         """导入指标分类数据"""
-        filename, _ = QFileDialog.getOpenFileName(
-            self, "选择指标分类数据文件", os.getcwd(),
-            "Excel/CSV文件 (*.xlsx *.xls *.csv)"
-        )
-        if not filename:
-            return
-        
-        try:
-            # 解析文件
-            importer = ExcelImporter()
-            categories, errors = importer.import_indicator_categories(filename)
-            
-            if not categories and errors:
-                QMessageBox.warning(self, "导入失败",
-                    "文件解析失败:\n" + "\n".join(errors[:5]))
-                return
-            
-            # 批量导入数据库
-            batch_importer = DataBatchImporter()
-            success_count, db_errors = batch_importer.batch_import_indicator_categories(categories)
-            
-            # 显示结果
-            msg = f"成功导入 {success_count}/{len(categories)} 条指标分类"
-            if errors:
-                msg += f"\n\n解析警告 ({len(errors)}):\n" + "\n".join(errors[:3])
-            if db_errors:
-                msg += f"\n\n数据库提示 ({len(db_errors)}):\n" + "\n".join(db_errors[:3])
-            
-            if success_count > 0:
-                QMessageBox.information(self, "导入完成", msg)
-                self._refresh_categories()
-            else:
-                QMessageBox.warning(self, "导入失败", msg)
-                
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"导入过程出错:\n{str(e)}")
+        self._start_import('categories', "选择指标分类数据文件")
     
     def _import_indicators(self):
         """导入指标数据"""
-        filename, _ = QFileDialog.getOpenFileName(
-            self, "选择指标数据文件", os.getcwd(),
-            "Excel/CSV文件 (*.xlsx *.xls *.csv)"
-        )
-        if not filename:
-            return
-        
-        try:
-            # 解析文件
-            importer = ExcelImporter()
-            indicators, errors = importer.import_indicators(filename)
-            
-            if not indicators and errors:
-                QMessageBox.warning(self, "导入失败",
-                    "文件解析失败:\n" + "\n".join(errors[:5]))
-                return
-            
-            # 批量导入数据库
-            batch_importer = DataBatchImporter()
-            success_count, db_errors = batch_importer.batch_import_indicators(indicators)
-            
-            # 显示结果
-            msg = f"成功导入 {success_count}/{len(indicators)} 条指标"
-            if errors:
-                msg += f"\n\n解析警告 ({len(errors)}):\n" + "\n".join(errors[:3])
-            if db_errors:
-                msg += f"\n\n数据库错误 ({len(db_errors)}):\n" + "\n".join(db_errors[:3])
-            
-            if success_count > 0:
-                QMessageBox.information(self, "导入完成", msg)
-                self._refresh_indicators()
-                self._refresh_categories()  # 可能创建了新分类
-            else:
-                QMessageBox.warning(self, "导入失败", msg)
-                
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"导入过程出错:\n{str(e)}")
+        self._start_import('indicators', "选择指标数据文件")
     
     def _import_risk_events(self):
         """导入风险事件数据"""
-        filename, _ = QFileDialog.getOpenFileName(
-            self, "选择风险事件数据文件", os.getcwd(),
-            "Excel/CSV文件 (*.xlsx *.xls *.csv)"
-        )
-        if not filename:
-            return
-        
-        try:
-            # 解析文件
-            importer = ExcelImporter()
-            events, errors = importer.import_risk_events(filename)
-            
-            if not events and errors:
-                QMessageBox.warning(self, "导入失败",
-                    "文件解析失败:\n" + "\n".join(errors[:5]))
-                return
-            
-            # 批量导入数据库
-            batch_importer = DataBatchImporter()
-            success_count, db_errors = batch_importer.batch_import_risk_events(events)
-            
-            # 显示结果
-            msg = f"成功导入 {success_count}/{len(events)} 条风险事件"
-            if errors:
-                msg += f"\n\n解析警告 ({len(errors)}):\n" + "\n".join(errors[:3])
-            if db_errors:
-                msg += f"\n\n数据库错误 ({len(db_errors)}):\n" + "\n".join(db_errors[:3])
-            
-            if success_count > 0:
-                QMessageBox.information(self, "导入完成", msg)
-                self._refresh_risks()
-                self.data_changed.emit()
-            else:
-                QMessageBox.warning(self, "导入失败", msg)
-                
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"导入过程出错:\n{str(e)}")
+        self._start_import('risk_events', "选择风险事件数据文件")
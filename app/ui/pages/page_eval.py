@@ -4,47 +4,282 @@ Evaluation Page - One-click Risk Assessment
 """
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QPushButton,
-    QComboBox, QCheckBox, QTableWidget, QTableWidgetItem, QMessageBox,
+    QComboBox, QCheckBox, QTableView, QMessageBox,
     QSplitter, QTabWidget, QProgressBar, QTextEdit, QScrollArea,
-    QFrame, QAbstractItemView
+    QFrame, QAbstractItemView, QApplication
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QThread
-from PyQt5.QtGui import QColor, QFont
-from typing import Optional, Dict, Any
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, pyqtSlot, QObject, QThread, QTimer
+)
+from PyQt5.QtGui import QBrush, QColor, QFont
+from typing import Optional, Dict, Any, List
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import partial
+from itertools import chain
+from operator import itemgetter
+import html
 import json
 import os
+import time
 from pathlib import Path
 
 from ...db.dao import (
     Mission, MissionDAO, RiskEventDAO, FMEAItemDAO, 
-    ResultSnapshot, ResultSnapshotDAO, FTANodeDAO
-)
-from ...models import (
-    RiskMatrixModel, FMEAModel, MonteCarloModel, SensitivityModel,
-    EvaluationResult
+    ResultSnapshot, ResultSnapshotDAO, FTANodeDAO, FTAEdgeDAO
 )
-from ...models.fta import FTAModel
-from ...models.ahp_improved import AHPImprovedModel
+from ...models import EvaluationResult
+from ...models.mission_data import load_mission_arrays
 from ..widgets.matplotlib_widget import (
     RiskMatrixChart, TopNBarChart, SensitivityBarChart, HistogramChart,
     FTATreeChart, FTAContributionChart, FTASensitivityChart,
-    AHPRadarChart, AHPContributionChart
+    AHPRadarChart, AHPContributionChart,
+    OffscreenRiskMatrixChart, OffscreenTopNBarChart,
+    OffscreenSensitivityBarChart, OffscreenHistogramChart
+)
+from ..widgets.table_view import DataclassTableModel, TableColumn, frozen_table
+from ..widgets.pool_task import PoolTaskSignals, start_pool_task
+
+
+# 任务下拉框中保存任务名称的数据角色（Qt.UserRole 保存任务ID）
+MISSION_NAME_ROLE = Qt.UserRole + 1
+
+# 评估快照图表的输出目录与分辨率
+REPORTS_ROOT = Path(__file__).resolve().parents[3] / "reports" / "output"
+SNAPSHOT_DPI = 90
+
+
+# 建议文本模板（模块加载时绑定str.format）
+_HIGH_LEVELS = frozenset(("High", "Extreme"))
+_FTA_REC_TMPL = (
+    "FTA故障树分析显示顶事件概率为{p:.2e}，"
+    "风险等级为{lvl}，建议优先降低关键基本事件的发生概率。"
+).format
+_AHP_REC_TMPL = "改进AHP综合评估显示风险得分为{s:.4f}，等级为{lvl}。".format
+_AHP_HIGH_REC = "建议优先改进高贡献度指标对应的管理/工艺/监测措施。"
+
+# 一次取出建议所需的字段（模型结果通常包含全部字段，缺失时回退到.get默认值）
+_FTA_KEYS = itemgetter("risk_level", "top_event_probability")
+_AHP_KEYS = itemgetter("total_score", "risk_level")
+
+
+def _format_fta_recs(fta_data: Dict[str, Any]) -> List[str]:
+    """生成FTA建议"""
+    try:
+        lvl, p = _FTA_KEYS(fta_data)
+    except KeyError:
+        lvl = fta_data.get("risk_level", "Low")
+        p = fta_data.get("top_event_probability", 0)
+    if lvl not in _HIGH_LEVELS:
+        return []
+    return [_FTA_REC_TMPL(p=p, lvl=lvl)]
+
+
+def _format_ahp_recs(ahp_data: Dict[str, Any]) -> List[str]:
+    """生成AHP建议"""
+    try:
+        score, lvl = _AHP_KEYS(ahp_data)
+    except KeyError:
+        score = ahp_data.get("total_score", 0)
+        lvl = ahp_data.get("risk_level", "Low")
+    recommendations = [_AHP_REC_TMPL(s=score, lvl=lvl)]
+    if lvl in _HIGH_LEVELS:
+        recommendations.append(_AHP_HIGH_REC)
+    return recommendations
+
+
+# 结果表格的等级背景画刷（模块加载时创建一次，各行共享）
+_LEVEL_BRUSH = {
+    lvl: QBrush(QColor(hex_)) for lvl, hex_ in
+    {"Low": "#f5f5f5", "Medium": "#e8e8e8", "High": "#d8d8d8", "Extreme": "#c8c8c8"}.items()
+}
+_DEFAULT_BRUSH = QBrush(QColor("#FFFFFF"))
+
+
+def _level_brush(row) -> QBrush:
+    """按结果行的level取背景画刷"""
+    return _LEVEL_BRUSH.get(row.level, _DEFAULT_BRUSH)
+
+
+# 风险等级指示器样式：等级 -> (背景色, 文字色)，样式表字符串预先生成
+_RISK_INDICATOR_COLORS = {
+    "Low": ("#d0d0d0", "#333"),
+    "Medium": ("#a0a0a0", "#222"),
+    "High": ("#707070", "#fff"),
+    "Extreme": ("#404040", "#fff")
+}
+_INDICATOR_STYLE = """
+    QLabel {{
+        font-size: {size}px;
+        font-weight: bold;
+        padding: {padding}px;
+        border-radius: {radius}px;
+        background-color: {bg};
+        color: {fg};
+    }}
+""".format
+_FTA_RISK_STYLES = {
+    lvl: _INDICATOR_STYLE(size=16, padding=15, radius=5, bg=bg, fg=fg)
+    for lvl, (bg, fg) in _RISK_INDICATOR_COLORS.items()
+}
+_FTA_DEFAULT_STYLE = _INDICATOR_STYLE(size=16, padding=15, radius=5, bg="#f0f0f0", fg="#333")
+_FTA_EMPTY_STYLE = _INDICATOR_STYLE(size=16, padding=15, radius=5, bg="#f0f0f0", fg="#666")
+_AHP_RISK_STYLES = {
+    lvl: _INDICATOR_STYLE(size=16, padding=18, radius=8, bg=bg, fg=fg)
+    for lvl, (bg, fg) in _RISK_INDICATOR_COLORS.items()
+}
+_AHP_DEFAULT_STYLE = _INDICATOR_STYLE(size=16, padding=18, radius=8, bg="#f0f0f0", fg="#333")
+_AHP_EMPTY_STYLE = _INDICATOR_STYLE(size=18, padding=20, radius=8, bg="#f0f0f0", fg="#666")
+_AHP_RISK_DESC = {
+    "Low": "低风险 - 系统运行正常",
+    "Medium": "中等风险 - 需要关注",
+    "High": "高风险 - 需要采取措施",
+    "Extreme": "极高风险 - 紧急处理"
+}
+
+
+# 结果表格列定义（行直接使用模型结果对象）
+_MATRIX_TOP_COLUMNS = (
+    TableColumn("排名"),
+    TableColumn("事件名称", "name"),
+    TableColumn("L", "likelihood"),
+    TableColumn("S", "severity"),
+    TableColumn("R", "risk_score", {Qt.BackgroundRole: _level_brush}),
+)
+_FMEA_TOP_COLUMNS = (
+    TableColumn("排名"),
+    TableColumn("系统", "system"),
+    TableColumn("失效模式", "display_name"),
+    TableColumn("S", "S"),
+    TableColumn("O", "O"),
+    TableColumn("D", "D"),
+    TableColumn("RPN", "RPN", {Qt.BackgroundRole: _level_brush}),
+)
+_SENS_COLUMNS = (
+    TableColumn("因素", "factor_name"),
+    TableColumn("基准值", "{0.base_value:.1f}".format),
+    TableColumn("-1变化", "{0.minus_value:.1f}".format),
+    TableColumn("+1变化", "{0.plus_value:.1f}".format),
+    TableColumn("影响分数", "{0.impact_score:.1f}".format),
+)
+_MC_GLOBAL_COLUMNS = (
+    TableColumn("指标", "indicator_name"),
+    TableColumn("名义值", "{0.nominal_value:.1f}".format),
+    TableColumn("均值", "{0.mean:.1f}".format),
+    TableColumn("标准差", "{0.std:.1f}".format),
+    TableColumn("P50", "{0.p50:.1f}".format),
+    TableColumn("P90", "{0.p90:.1f}".format),
+    TableColumn("P(High)", "{0.prob_high:.2%}".format),
+)
+_MC_EVENT_COLUMNS = (
+    TableColumn("ID", "event_id"),
+    TableColumn("名称", "display_name"),
+    TableColumn("名义R/RPN", "nominal_R"),
+    TableColumn("均值", "{0.mean:.1f}".format),
+    TableColumn("标准差", "{0.std:.1f}".format),
+    TableColumn("P50", "{0.p50:.1f}".format),
+    TableColumn("P90", "{0.p90:.1f}".format),
+    TableColumn("P(High)", "{0.prob_high:.2%}".format),
+)
+# (指标, 数值) 二元组
+_INFO_COLUMNS = (
+    TableColumn("指标", itemgetter(0)),
+    TableColumn("数值", itemgetter(1)),
+)
+# (事件名称, 概率, 重要度, 贡献度) 元组
+_FTA_EVENT_COLUMNS = (
+    TableColumn("排名"),
+    TableColumn("事件名称", itemgetter(0)),
+    TableColumn("概率", "{0[1]:.2e}".format),
+    TableColumn("重要度", "{0[2]:.2e}".format),
+    TableColumn("贡献度", "{0[3]:.2%}".format),
+)
+# AHP指标结果字典
+_AHP_DETAIL_COLUMNS = (
+    TableColumn("指标", lambda r: r.get("indicator_name", "")),
+    TableColumn("原始权重", lambda r: f"{r.get('original_weight', 0):.4f}"),
+    TableColumn("修正权重", lambda r: f"{r.get('corrected_weight', 0):.4f}"),
+    TableColumn("归一化得分", lambda r: f"{r.get('normalized_value', 0):.4f}"),
+    TableColumn("贡献度", lambda r: f"{r.get('contribution', 0):.4f}"),
+    TableColumn("z-score", lambda r: f"{r.get('z_score', 0):.2f}"),
 )
 
 
-class EvaluationWorker(QThread):
-    """评估计算工作线程"""
+def _fill_table(table: QTableView, rows):
+    """整体替换结果表格的数据（填充期间冻结视图）"""
+    with frozen_table(table):
+        table.model().set_rows(rows)
+
+
+# ---- 图表绘制：结果Tab中的图表组件与保存快照用的离屏图表共用 ----
+
+def _plot_risk_matrix(matrix_chart, bar_chart, result: EvaluationResult):
+    """绘制风险矩阵热力图与Top-10条形图"""
+    rm = result.risk_matrix
+    matrix_chart.plot_matrix(
+        rm.matrix_data, rm.matrix_events,
+        f"风险矩阵 - {result.mission_name}"
+    )
+    bar_chart.plot_top_risks(
+        [e.display_name for e in rm.top_n],
+        [e.risk_score for e in rm.top_n],
+        [e.level for e in rm.top_n],
+        "Top-10 风险事件 (R=L×S)",
+        "风险分数 R"
+    )
+
+
+def _plot_sensitivity(chart, sens_result, mode: str):
+    """绘制敏感性分析条形图（mode: "matrix" 或 "fmea"）"""
+    chart.plot_sensitivity(
+        [f.factor_name for f in sens_result.top_n],
+        [f.impact_score for f in sens_result.top_n],
+        f"敏感性分析 - {'风险矩阵' if mode == 'matrix' else 'FMEA'}"
+    )
+
+
+def _plot_mc_histogram(chart, prepared: Dict[str, Any]):
+    """绘制蒙特卡洛直方图（prepared 为 _prepare_mc 的结果）"""
+    chart.plot_histogram(
+        prepared["samples"], prepared["hist_title"],
+        prepared["indicator_name"], "频次"
+    )
+
+
+class EvaluationWorker(QObject):
+    """
+    评估计算工作对象
+    
+    由EvaluationPage移入一个常驻QThread，通过信号触发run()，
+    多次评估复用同一线程。
+    """
     
     progress = pyqtSignal(str)
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
     
-    def __init__(self, mission_id: int, mission_name: str, 
-                 run_matrix: bool, run_fmea: bool, 
-                 run_mc: bool, run_sens: bool,
-                 run_fta: bool = False, run_ahp: bool = False):
+    # 进度消息的最小发送间隔（秒），避免刷屏占用界面线程
+    PROGRESS_INTERVAL = 0.05
+    
+    def __init__(self):
         super().__init__()
+        self._last_emit = 0.0
+        self.mission_id = 0
+        self.mission_name = ""
+        self.run_matrix = False
+        self.run_fmea = False
+        self.run_mc = False
+        self.run_sens = False
+        self.run_fta = False
+        self.run_ahp = False
+        self._data = None
+    
+    @pyqtSlot(int, str, bool, bool, bool, bool, bool, bool)
+    def run(self, mission_id: int, mission_name: str,
+            run_matrix: bool, run_fmea: bool,
+            run_mc: bool, run_sens: bool,
+            run_fta: bool, run_ahp: bool):
         self.mission_id = mission_id
         self.mission_name = mission_name
         self.run_matrix = run_matrix
@@ -53,8 +288,7 @@ class EvaluationWorker(QThread):
         self.run_sens = run_sens
         self.run_fta = run_fta
         self.run_ahp = run_ahp
-    
-    def run(self):
+        self._data = None
         try:
             result = EvaluationResult(
                 mission_id=self.mission_id,
@@ -63,122 +297,212 @@ class EvaluationWorker(QThread):
                 model_set=[]
             )
             
-            # 运行风险矩阵
-            if self.run_matrix:
-                self.progress.emit("正在计算风险矩阵...")
-                rm_model = RiskMatrixModel()
-                context = {"mission_id": self.mission_id, "params": rm_model.get_default_params()}
-                rm_result = rm_model.run(context)
-                if rm_result.success and rm_result.data:
-                    result.risk_matrix = rm_result.data.get("result")
-                    result.model_set.append("risk_matrix")
-                    
-                    # 生成建议
-                    if result.risk_matrix:
-                        result.recommendations.extend(
-                            rm_model.generate_recommendations(result.risk_matrix)
-                        )
+            # 风险事件/FMEA条目只查询一次，供各模型共享
+            if self.run_matrix or self.run_fmea:
+                self._data = load_mission_arrays(self.mission_id)
             
-            # 运行FMEA
+            # 各模型仅依赖 mission_id，彼此独立，可并行运行
+            # （DAO读库与NumPy计算均会释放GIL）
+            tasks = []
+            if self.run_matrix:
+                tasks.append(("风险矩阵", self._run_matrix))
             if self.run_fmea:
-                self.progress.emit("正在计算FMEA...")
-                fmea_model = FMEAModel()
-                context = {"mission_id": self.mission_id, "params": fmea_model.get_default_params()}
-                fmea_result = fmea_model.run(context)
-                if fmea_result.success and fmea_result.data:
-                    result.fmea = fmea_result.data.get("result")
-                    result.model_set.append("fmea")
-                    
-                    # 生成建议
-                    if result.fmea:
-                        result.recommendations.extend(
-                            fmea_model.generate_recommendations(result.fmea)
-                        )
-            
-            # 运行蒙特卡洛
+                tasks.append(("FMEA", self._run_fmea))
             if self.run_mc:
-                self.progress.emit("正在进行蒙特卡洛模拟...")
-                mc_model = MonteCarloModel(n_samples=2000)
-                
-                if self.run_matrix:
-                    result.monte_carlo_rm = mc_model.run_risk_matrix(self.mission_id)
-                if self.run_fmea:
-                    result.monte_carlo_fmea = mc_model.run_fmea(self.mission_id)
-                
-                result.model_set.append("monte_carlo")
-            
-            # 运行敏感性分析
+                tasks.append(("蒙特卡洛模拟", self._run_mc))
             if self.run_sens:
-                self.progress.emit("正在进行敏感性分析...")
-                sens_model = SensitivityModel()
-                
-                if self.run_matrix:
-                    result.sensitivity_rm = sens_model.run_risk_matrix(self.mission_id)
-                if self.run_fmea:
-                    result.sensitivity_fmea = sens_model.run_fmea(self.mission_id)
-                
-                result.model_set.append("sensitivity")
-            
-            # 运行FTA故障树分析
+                tasks.append(("敏感性分析", self._run_sens))
             if self.run_fta:
-                self.progress.emit("正在进行FTA故障树分析...")
-                fta_model = FTAModel()
-                context = {"mission_id": self.mission_id, "params": fta_model.get_default_params()}
-                fta_result = fta_model.run(context)
-                if fta_result.success:
-                    result.fta_result = fta_result.data
-                    result.model_set.append("fta")
-                    # 生成FTA建议
-                    if fta_result.data:
-                        from ...models.fta import FTAResult as FTAResultData
-                        fta_data = fta_result.data
-                        risk_level = fta_data.get("risk_level", "Low")
-                        if risk_level in ["High", "Extreme"]:
-                            result.recommendations.append(
-                                f"FTA故障树分析显示顶事件概率为{fta_data.get('top_event_probability', 0):.2e}，"
-                                f"风险等级为{risk_level}，建议优先降低关键基本事件的发生概率。"
-                            )
-            
-            # 运行改进AHP综合评估
+                tasks.append(("FTA故障树分析", self._run_fta))
             if self.run_ahp:
-                self.progress.emit("正在进行改进AHP综合评估...")
-                ahp_model = AHPImprovedModel()
-                context = {"mission_id": self.mission_id, "params": ahp_model.get_default_params()}
-                ahp_result = ahp_model.run(context)
-                if ahp_result.success:
-                    result.ahp_result = ahp_result.data
-                    result.model_set.append("ahp_improved")
-                    # 生成AHP建议
-                    if ahp_result.data:
-                        ahp_data = ahp_result.data
-                        score = ahp_data.get("total_score", 0)
-                        level = ahp_data.get("risk_level", "Low")
-                        result.recommendations.append(
-                            f"改进AHP综合评估显示风险得分为{score:.4f}，等级为{level}。"
-                        )
-                        if level in ["High", "Extreme"]:
-                            result.recommendations.append(
-                                "建议优先改进高贡献度指标对应的管理/工艺/监测措施。"
-                            )
+                tasks.append(("改进AHP综合评估", self._run_ahp))
+            
+            outputs = {}
+            if tasks:
+                self._emit_progress(f"正在并行运行 {len(tasks)} 个模型...", force=True)
+                with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                    futures = {executor.submit(func): label for label, func in tasks}
+                    for future in as_completed(futures):
+                        label = futures[future]
+                        outputs[label] = future.result()
+                        self._emit_progress(f"{label} 完成")
+            
+            # 按固定顺序汇总，保证模型列表与建议顺序稳定
+            for label, _ in tasks:
+                fields, model_tags, _ = outputs[label]
+                for name, value in fields.items():
+                    setattr(result, name, value)
+                result.model_set.extend(model_tags)
+            result.recommendations = list(chain.from_iterable(
+                outputs[label][2] for label, _ in tasks
+            ))
             
-            self.progress.emit("评估完成！")
+            self._emit_progress("评估完成！", force=True)
             self.finished.emit(result)
             
         except Exception as e:
             self.error.emit(str(e))
+    
+    def _emit_progress(self, message: str, force: bool = False):
+        """发送进度消息（节流，force=True时总是发送）"""
+        now = time.monotonic()
+        if force or now - self._last_emit >= self.PROGRESS_INTERVAL:
+            self.progress.emit(message)
+            self._last_emit = now
+    
+    # 以下每个子任务返回 (结果字段, 模型标识列表, 建议列表)
+    
+    def _run_matrix(self):
+        """运行风险矩阵"""
+        from ...models.risk_matrix import RiskMatrixModel
+        
+        rm_model = RiskMatrixModel()
+        context = {"mission_id": self.mission_id, "params": rm_model.get_default_params(),
+                   "data": self._data}
+        rm_result = rm_model.run(context)
+        if not (rm_result.success and rm_result.data):
+            return {}, [], []
+        
+        risk_matrix = rm_result.data.get("result")
+        recommendations = []
+        if risk_matrix:
+            recommendations = rm_model.generate_recommendations(risk_matrix)
+        return {"risk_matrix": risk_matrix}, ["risk_matrix"], recommendations
+    
+    def _run_fmea(self):
+        """运行FMEA"""
+        from ...models.fmea import FMEAModel
+        
+        fmea_model = FMEAModel()
+        context = {"mission_id": self.mission_id, "params": fmea_model.get_default_params(),
+                   "data": self._data}
+        fmea_result = fmea_model.run(context)
+        if not (fmea_result.success and fmea_result.data):
+            return {}, [], []
+        
+        fmea = fmea_result.data.get("result")
+        recommendations = []
+        if fmea:
+            recommendations = fmea_model.generate_recommendations(fmea)
+        return {"fmea": fmea}, ["fmea"], recommendations
+    
+    def _run_mc(self):
+        """运行蒙特卡洛"""
+        from ...models.monte_carlo import MonteCarloModel
+        
+        mc_model = MonteCarloModel(n_samples=2000)
+        
+        # 风险矩阵与FMEA共用一次向量化采样
+        mc_rm, mc_fmea = mc_model.run_combined(
+            self.mission_id, run_rm=self.run_matrix, run_fmea=self.run_fmea,
+            data=self._data
+        )
+        return {"monte_carlo_rm": mc_rm, "monte_carlo_fmea": mc_fmea}, ["monte_carlo"], []
+    
+    def _run_sens(self):
+        """运行敏感性分析"""
+        from ...models.sensitivity import SensitivityModel
+        
+        sens_model = SensitivityModel()
+        
+        # 风险矩阵与FMEA的敏感性分析互不依赖，同时运行
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            f_rm = (executor.submit(sens_model.run_risk_matrix, self.mission_id, data=self._data)
+                    if self.run_matrix else None)
+            f_fmea = (executor.submit(sens_model.run_fmea, self.mission_id, data=self._data)
+                      if self.run_fmea else None)
+            fields = {}
+            if f_rm:
+                fields["sensitivity_rm"] = f_rm.result()
+            if f_fmea:
+                fields["sensitivity_fmea"] = f_fmea.result()
+        return fields, ["sensitivity"], []
+    
+    def _run_fta(self):
+        """运行FTA故障树分析"""
+        from ...models.fta import FTAModel
+        
+        fta_model = FTAModel()
+        context = {"mission_id": self.mission_id, "params": fta_model.get_default_params()}
+        fta_result = fta_model.run(context)
+        if not fta_result.success:
+            return {}, [], []
+        
+        fta_data = fta_result.data
+        recommendations = _format_fta_recs(fta_data) if fta_data else []
+        return {"fta_result": fta_data}, ["fta"], recommendations
+    
+    def _run_ahp(self):
+        """运行改进AHP综合评估"""
+        from ...models.ahp_improved import AHPImprovedModel
+        
+        ahp_model = AHPImprovedModel()
+        context = {"mission_id": self.mission_id, "params": ahp_model.get_default_params()}
+        ahp_result = ahp_model.run(context)
+        if not ahp_result.success:
+            return {}, [], []
+        
+        ahp_data = ahp_result.data
+        recommendations = _format_ahp_recs(ahp_data) if ahp_data else []
+        return {"ahp_result": ahp_data}, ["ahp_improved"], recommendations
 
 
 class EvaluationPage(QWidget):
     """评估计算页面"""
     
     evaluation_completed = pyqtSignal()
+    # (mission_id, mission_name, 风险矩阵, FMEA, 蒙特卡洛, 敏感性, FTA, AHP)
+    evaluation_requested = pyqtSignal(int, str, bool, bool, bool, bool, bool, bool)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_result: Optional[EvaluationResult] = None
+        self._edge_dao = FTAEdgeDAO()
+        # 风险指示器当前应用的样式表，未变化时不重复设置
+        self._indicator_styles: Dict[QLabel, str] = {}
+        # 延迟渲染：新结果到来时各Tab标记为待刷新，切换到该Tab时才绘制
+        self._display_result: Optional[EvaluationResult] = None
+        self._dirty_tabs = set()
+        self._render_scheduled = False
+        # 后台数据准备：代次计数用于丢弃旧结果的准备任务
+        self._prep_gen = 0
+        self._prepared: Dict[QWidget, Any] = {}
+        self._preparing = set()
+        self._prep_signals = PoolTaskSignals(self)
+        self._prep_signals.done.connect(self._on_tab_prepared, Qt.QueuedConnection)
+        self._prep_signals.failed.connect(self._on_tab_prepare_failed, Qt.QueuedConnection)
+        # 后台保存结果快照
+        self._snapshot_signals = PoolTaskSignals(self)
+        self._snapshot_signals.done.connect(self._on_snapshot_saved, Qt.QueuedConnection)
+        self._snapshot_signals.failed.connect(self._on_snapshot_failed, Qt.QueuedConnection)
         self._init_ui()
+        self._init_worker()
         self.refresh_missions()
     
+    def _init_worker(self):
+        """创建常驻评估线程"""
+        self._worker_thread = QThread(self)
+        self.worker = EvaluationWorker()
+        self.worker.moveToThread(self._worker_thread)
+        self._worker_thread.finished.connect(self.worker.deleteLater)
+        
+        # 跨线程信号显式排队，且每对信号/槽只连接一次
+        connection = Qt.QueuedConnection | Qt.UniqueConnection
+        self.evaluation_requested.connect(self.worker.run, connection)
+        self.worker.progress.connect(self._on_progress, connection)
+        self.worker.finished.connect(self._on_evaluation_finished, connection)
+        self.worker.error.connect(self._on_evaluation_error, connection)
+        self._worker_thread.start()
+        
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_worker)
+    
+    def _stop_worker(self):
+        """退出前结束评估线程"""
+        self._worker_thread.quit()
+        self._worker_thread.wait()
+    
     def _init_ui(self):
         """初始化UI"""
         layout = QVBoxLayout(self)
@@ -283,6 +607,20 @@ class EvaluationPage(QWidget):
         self.tab_rec = self._create_recommendations_tab()
         self.result_tabs.addTab(self.tab_rec, "改进建议")
         
+        self._tab_updaters = {
+            self.tab_matrix: self._update_matrix_tab,
+            self.tab_fmea: self._update_fmea_tab,
+            self.tab_sens: self._update_sensitivity_display,
+            self.tab_rec: self._update_recommendations_tab,
+        }
+        # 数据整理较重的Tab拆分为 (后台准备, 界面渲染)
+        self._tab_pipelines = {
+            self.tab_mc: (self._prepare_mc, self._render_mc),
+            self.tab_fta: (self._prepare_fta, self._render_fta),
+            self.tab_ahp: (self._prepare_ahp, self._render_ahp),
+        }
+        self.result_tabs.currentChanged.connect(self._on_tab_changed)
+        
         layout.addWidget(self.result_tabs)
     
     def _create_matrix_tab(self):
@@ -303,9 +641,9 @@ class EvaluationPage(QWidget):
         
         right_layout.addWidget(QLabel("<b>Top-10 高风险事件</b>"))
         
-        self.matrix_top_table = QTableWidget()
-        self.matrix_top_table.setColumnCount(5)
-        self.matrix_top_table.setHorizontalHeaderLabels(["排名", "事件名称", "L", "S", "R"])
+        self.matrix_top_model = DataclassTableModel([], _MATRIX_TOP_COLUMNS)
+        self.matrix_top_table = QTableView()
+        self.matrix_top_table.setModel(self.matrix_top_model)
         self.matrix_top_table.setMaximumHeight(200)
         self.matrix_top_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.matrix_top_table.horizontalHeader().setStretchLastSection(True)
@@ -340,11 +678,9 @@ class EvaluationPage(QWidget):
         left_layout = QVBoxLayout(left_widget)
         left_layout.addWidget(QLabel("<b>Top-10 高RPN条目</b>"))
         
-        self.fmea_top_table = QTableWidget()
-        self.fmea_top_table.setColumnCount(7)
-        self.fmea_top_table.setHorizontalHeaderLabels(
-            ["排名", "系统", "失效模式", "S", "O", "D", "RPN"]
-        )
+        self.fmea_top_model = DataclassTableModel([], _FMEA_TOP_COLUMNS)
+        self.fmea_top_table = QTableView()
+        self.fmea_top_table.setModel(self.fmea_top_model)
         self.fmea_top_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.fmea_top_table.horizontalHeader().setStretchLastSection(True)
         left_layout.addWidget(self.fmea_top_table)
@@ -391,11 +727,9 @@ class EvaluationPage(QWidget):
         self.sens_info_label = QLabel()
         left_layout.addWidget(self.sens_info_label)
         
-        self.sens_table = QTableWidget()
-        self.sens_table.setColumnCount(5)
-        self.sens_table.setHorizontalHeaderLabels(
-            ["因素", "基准值", "-1变化", "+1变化", "影响分数"]
-        )
+        self.sens_model = DataclassTableModel([], _SENS_COLUMNS)
+        self.sens_table = QTableView()
+        self.sens_table.setModel(self.sens_model)
         self.sens_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.sens_table.horizontalHeader().setStretchLastSection(True)
         left_layout.addWidget(self.sens_table)
@@ -422,11 +756,9 @@ class EvaluationPage(QWidget):
         stats_group = QGroupBox("全局风险指标统计")
         stats_layout = QHBoxLayout(stats_group)
         
-        self.mc_global_table = QTableWidget()
-        self.mc_global_table.setColumnCount(7)
-        self.mc_global_table.setHorizontalHeaderLabels(
-            ["指标", "名义值", "均值", "标准差", "P50", "P90", "P(High)"]
-        )
+        self.mc_global_model = DataclassTableModel([], _MC_GLOBAL_COLUMNS)
+        self.mc_global_table = QTableView()
+        self.mc_global_table.setModel(self.mc_global_model)
         self.mc_global_table.setMaximumHeight(100)
         self.mc_global_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.mc_global_table.horizontalHeader().setStretchLastSection(True)
@@ -441,11 +773,9 @@ class EvaluationPage(QWidget):
         left_layout = QVBoxLayout(left_widget)
         left_layout.addWidget(QLabel("<b>各风险事件/条目的不确定性统计</b>"))
         
-        self.mc_event_table = QTableWidget()
-        self.mc_event_table.setColumnCount(8)
-        self.mc_event_table.setHorizontalHeaderLabels(
-            ["ID", "名称", "名义R/RPN", "均值", "标准差", "P50", "P90", "P(High)"]
-        )
+        self.mc_event_model = DataclassTableModel([], _MC_EVENT_COLUMNS)
+        self.mc_event_table = QTableView()
+        self.mc_event_table.setModel(self.mc_event_model)
         self.mc_event_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.mc_event_table.horizontalHeader().setStretchLastSection(True)
         left_layout.addWidget(self.mc_event_table)
@@ -492,9 +822,9 @@ class EvaluationPage(QWidget):
         info_layout = QVBoxLayout(info_widget)
         info_layout.addWidget(QLabel("<b>FTA分析摘要</b>"))
         
-        self.fta_info_table = QTableWidget()
-        self.fta_info_table.setColumnCount(2)
-        self.fta_info_table.setHorizontalHeaderLabels(["指标", "数值"])
+        self.fta_info_model = DataclassTableModel([], _INFO_COLUMNS)
+        self.fta_info_table = QTableView()
+        self.fta_info_table.setModel(self.fta_info_model)
         self.fta_info_table.setMaximumHeight(200)
         self.fta_info_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.fta_info_table.horizontalHeader().setStretchLastSection(True)
@@ -537,11 +867,9 @@ class EvaluationPage(QWidget):
         
         # 关键基本事件表格
         contrib_layout.addWidget(QLabel("<b>关键事件排名</b>"))
-        self.fta_events_table = QTableWidget()
-        self.fta_events_table.setColumnCount(5)
-        self.fta_events_table.setHorizontalHeaderLabels(
-            ["排名", "事件名称", "概率", "重要度", "贡献度"]
-        )
+        self.fta_events_model = DataclassTableModel([], _FTA_EVENT_COLUMNS)
+        self.fta_events_table = QTableView()
+        self.fta_events_table.setModel(self.fta_events_model)
         self.fta_events_table.setMaximumHeight(180)
         self.fta_events_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.fta_events_table.horizontalHeader().setStretchLastSection(True)
@@ -586,9 +914,9 @@ class EvaluationPage(QWidget):
         result_layout = QVBoxLayout(result_widget)
         result_layout.addWidget(QLabel("<b>AHP综合评估结果</b>"))
         
-        self.ahp_result_table = QTableWidget()
-        self.ahp_result_table.setColumnCount(2)
-        self.ahp_result_table.setHorizontalHeaderLabels(["指标", "数值"])
+        self.ahp_result_model = DataclassTableModel([], _INFO_COLUMNS)
+        self.ahp_result_table = QTableView()
+        self.ahp_result_table.setModel(self.ahp_result_model)
         self.ahp_result_table.setMaximumHeight(180)
         self.ahp_result_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.ahp_result_table.horizontalHeader().setStretchLastSection(True)
@@ -633,11 +961,9 @@ class EvaluationPage(QWidget):
         details_layout = QVBoxLayout(details_widget)
         details_layout.addWidget(QLabel("<b>指标权重与得分详情</b>"))
         
-        self.ahp_details_table = QTableWidget()
-        self.ahp_details_table.setColumnCount(6)
-        self.ahp_details_table.setHorizontalHeaderLabels(
-            ["指标", "原始权重", "修正权重", "归一化得分", "贡献度", "z-score"]
-        )
+        self.ahp_details_model = DataclassTableModel([], _AHP_DETAIL_COLUMNS)
+        self.ahp_details_table = QTableView()
+        self.ahp_details_table.setModel(self.ahp_details_model)
         self.ahp_details_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.ahp_details_table.horizontalHeader().setStretchLastSection(True)
         details_layout.addWidget(self.ahp_details_table)
@@ -680,6 +1006,9 @@ class EvaluationPage(QWidget):
         self.mission_combo.clear()
         for m in missions:
             self.mission_combo.addItem(f"{m.name} ({m.date or 'N/A'})", m.id)
+            self.mission_combo.setItemData(
+                self.mission_combo.count() - 1, m.name, MISSION_NAME_ROLE
+            )
     
     def _run_evaluation(self):
         """运行评估"""
@@ -720,9 +1049,9 @@ class EvaluationPage(QWidget):
         self.btn_run.setEnabled(False)
         self.status_label.setText("正在评估...")
         
-        # 启动工作线程
-        mission_name = self.mission_combo.currentText().split(" (")[0]
-        self.worker = EvaluationWorker(
+        # 交给常驻工作线程执行
+        mission_name = self.mission_combo.currentData(MISSION_NAME_ROLE)
+        self.evaluation_requested.emit(
             mission_id, mission_name,
             self.chk_matrix.isChecked(),
             self.chk_fmea.isChecked(),
@@ -731,10 +1060,6 @@ class EvaluationPage(QWidget):
             self.chk_fta.isChecked(),
             self.chk_ahp.isChecked()
         )
-        self.worker.progress.connect(self._on_progress)
-        self.worker.finished.connect(self._on_evaluation_finished)
-        self.worker.error.connect(self._on_evaluation_error)
-        self.worker.start()
     
     def _on_progress(self, message: str):
         """进度更新"""
@@ -749,11 +1074,8 @@ class EvaluationPage(QWidget):
         # 先更新UI显示（绑定数据到图表）
         self._update_results_display(result)
         
-        # 然后保存结果快照（包含图表截图）
+        # 然后在后台保存结果快照（包含图表截图），保存完成后提示
         self._save_snapshot(result)
-        
-        self.evaluation_completed.emit()
-        QMessageBox.information(self, "完成", "风险评估已完成！")
     
     def _on_evaluation_error(self, error: str):
         """评估错误"""
@@ -762,94 +1084,166 @@ class EvaluationPage(QWidget):
         QMessageBox.critical(self, "错误", f"评估过程中发生错误：{error}")
     
     def _save_snapshot(self, result: EvaluationResult):
-        """保存结果快照"""
-        try:
-            # 保存图表
-            output_dir = Path(__file__).parent.parent.parent.parent / "reports" / "output"
-            output_dir = output_dir / str(result.mission_id) / result.created_at.replace(":", "-").replace(" ", "_")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            
-            figures = {}
-            
-            if result.risk_matrix:
-                try:
-                    fig_path = str(output_dir / "risk_matrix.png")
-                    self.matrix_chart.save_figure(fig_path)
-                    figures["risk_matrix"] = fig_path
-                    
-                    fig_path = str(output_dir / "risk_top10.png")
-                    self.matrix_bar_chart.save_figure(fig_path)
-                    figures["risk_top10"] = fig_path
-                except Exception as e:
-                    print(f"保存风险矩阵图表失败: {e}")
-            
-            if result.sensitivity_rm or result.sensitivity_fmea:
-                try:
-                    fig_path = str(output_dir / "sensitivity.png")
-                    self.sens_chart.save_figure(fig_path)
-                    figures["sensitivity"] = fig_path
-                except Exception as e:
-                    print(f"保存敏感性分析图表失败: {e}")
-            
-            if result.monte_carlo_rm or result.monte_carlo_fmea:
-                try:
-                    fig_path = str(output_dir / "mc_histogram.png")
-                    self.mc_histogram.save_figure(fig_path)
-                    figures["mc_histogram"] = fig_path
-                except Exception as e:
-                    print(f"保存蒙特卡洛直方图失败: {e}")
-            
-            result.figures = figures
-            
-            # 保存到数据库
-            snapshot = ResultSnapshot(
-                mission_id=result.mission_id,
-                created_at=result.created_at,
-                model_set="+".join(result.model_set),
-                result_json=json.dumps(result.to_dict(), ensure_ascii=False)
-            )
-            
-            dao = ResultSnapshotDAO()
-            dao.create(snapshot)
-        except Exception as e:
-            print(f"保存快照失败: {e}")
+        """在线程池中绘制快照图表并保存结果快照，完成后提示"""
+        start_pool_task(self._snapshot_signals, partial(self._write_snapshot, result), tag=result)
+    
+    def _write_snapshot(self, result: EvaluationResult):
+        """
+        绘制快照图表并写入结果快照（在线程池中运行，不访问界面组件）
+        
+        图表画在独立的离屏Figure上，与结果Tab是否已渲染无关。
+        """
+        output_dir = REPORTS_ROOT / str(result.mission_id) / result.created_at_safe
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # (图表键, 离屏图表, 说明)
+        charts = []
+        if result.risk_matrix:
+            matrix_chart, bar_chart = OffscreenRiskMatrixChart(), OffscreenTopNBarChart()
+            _plot_risk_matrix(matrix_chart, bar_chart, result)
+            charts.append(("risk_matrix", matrix_chart, "风险矩阵图表"))
+            charts.append(("risk_top10", bar_chart, "风险Top10图表"))
+        if result.sensitivity_rm or result.sensitivity_fmea:
+            sens_chart = OffscreenSensitivityBarChart()
+            if result.sensitivity_rm:
+                _plot_sensitivity(sens_chart, result.sensitivity_rm, "matrix")
+            else:
+                _plot_sensitivity(sens_chart, result.sensitivity_fmea, "fmea")
+            charts.append(("sensitivity", sens_chart, "敏感性分析图表"))
+        mc_prepared = self._prepare_mc(result)
+        if mc_prepared:
+            mc_chart = OffscreenHistogramChart()
+            _plot_mc_histogram(mc_chart, mc_prepared)
+            charts.append(("mc_histogram", mc_chart, "蒙特卡洛直方图"))
+        # 未绘制数据（空坐标轴或“无数据”提示）的图表不保存
+        charts = [c for c in charts if c[1].has_data]
+        
+        # 各图表独立的Agg渲染与PNG编码并行执行
+        figures = {}
+        if charts:
+            with ThreadPoolExecutor(max_workers=len(charts)) as executor:
+                futures = []
+                for key, chart, label in charts:
+                    fig_path = str(output_dir / f"{key}.png")
+                    future = executor.submit(chart.save_figure, fig_path, SNAPSHOT_DPI)
+                    futures.append((key, label, fig_path, future))
+                for key, label, fig_path, future in futures:
+                    try:
+                        future.result()
+                        figures[key] = fig_path
+                    except Exception as e:
+                        print(f"保存{label}失败: {e}")
+        
+        result.figures = figures
+        
+        # 保存到数据库
+        snapshot = ResultSnapshot(
+            mission_id=result.mission_id,
+            created_at=result.created_at,
+            model_set="+".join(result.model_set),
+            result_json=json.dumps(result.to_dict(), ensure_ascii=False)
+        )
+        
+        dao = ResultSnapshotDAO()
+        dao.create(snapshot)
+    
+    def _on_snapshot_saved(self, result: EvaluationResult, _):
+        """结果快照已保存"""
+        self.evaluation_completed.emit()
+        QMessageBox.information(self, "完成", "风险评估已完成！")
+    
+    def _on_snapshot_failed(self, result: EvaluationResult, error: Exception):
+        """结果快照保存失败"""
+        self.evaluation_completed.emit()
+        QMessageBox.warning(self, "完成", f"风险评估已完成，但结果快照保存失败：\n{error}")
     
     def _update_results_display(self, result: EvaluationResult):
-        """更新结果显示"""
-        # 更新风险矩阵Tab
+        """
+        更新结果显示
+        
+        所有Tab标记为待刷新，当前可见的Tab在下一轮事件循环中渲染，
+        其余Tab在首次切换到时再填表绘图。短时间内连续到达的多个结果
+        只渲染最后一个。
+        """
+        self._display_result = result
+        self._dirty_tabs = set(self._tab_updaters) | set(self._tab_pipelines)
+        self._prep_gen += 1
+        self._prepared.clear()
+        self._preparing.clear()
+        if not self._render_scheduled:
+            self._render_scheduled = True
+            QTimer.singleShot(0, self._flush_render)
+    
+    def _flush_render(self):
+        """为最新结果提交后台数据准备，并渲染当前Tab"""
+        self._render_scheduled = False
+        for tab, (prepare, _) in self._tab_pipelines.items():
+            if tab in self._dirty_tabs:
+                self._preparing.add(tab)
+                start_pool_task(self._prep_signals, partial(prepare, self._display_result),
+                                tag=(self._prep_gen, tab))
+        self._render_tab(self.result_tabs.currentWidget())
+    
+    def _on_tab_prepared(self, tag, prepared):
+        """后台数据准备完成"""
+        generation, tab = tag
+        if generation != self._prep_gen:
+            return  # 已有更新的结果，丢弃
+        self._preparing.discard(tab)
+        self._prepared[tab] = prepared
+        if tab is self.result_tabs.currentWidget():
+            self._render_tab(tab)
+    
+    def _on_tab_prepare_failed(self, tag, error: Exception):
+        """后台数据准备失败：当前Tab改为在界面线程中准备"""
+        generation, tab = tag
+        print(f"准备显示数据失败: {error}")
+        if generation != self._prep_gen:
+            return
+        self._preparing.discard(tab)
+        if tab is self.result_tabs.currentWidget():
+            self._render_tab(tab)
+    
+    def _on_tab_changed(self, index: int):
+        """切换结果Tab"""
+        self._render_tab(self.result_tabs.widget(index))
+    
+    def _render_tab(self, tab: QWidget):
+        """
+        渲染待刷新的Tab（已是最新则跳过）
+        
+        后台准备尚未完成时等待_on_tab_prepared渲染；准备失败的Tab在界面线程中准备。
+        """
+        if tab not in self._dirty_tabs or self._display_result is None:
+            return
+        
+        pipeline = self._tab_pipelines.get(tab)
+        if pipeline is None:
+            self._dirty_tabs.discard(tab)
+            self._tab_updaters[tab](self._display_result)
+            return
+        
+        prepare, render = pipeline
+        if tab in self._prepared:
+            prepared = self._prepared.pop(tab)
+        elif tab in self._preparing:
+            return
+        else:
+            prepared = prepare(self._display_result)
+        self._dirty_tabs.discard(tab)
+        render(prepared)
+    
+    def _update_matrix_tab(self, result: EvaluationResult):
+        """更新风险矩阵Tab"""
         if result.risk_matrix:
-            rm = result.risk_matrix
-            
-            # 热力图
-            self.matrix_chart.plot_matrix(
-                rm.matrix_data, rm.matrix_events,
-                f"风险矩阵 - {result.mission_name}"
-            )
+            # 热力图与条形图
+            _plot_risk_matrix(self.matrix_chart, self.matrix_bar_chart, result)
             
             # Top10表格
-            self.matrix_top_table.setRowCount(len(rm.top_n))
-            for i, e in enumerate(rm.top_n):
-                self.matrix_top_table.setItem(i, 0, QTableWidgetItem(str(i + 1)))
-                self.matrix_top_table.setItem(i, 1, QTableWidgetItem(e.name))
-                self.matrix_top_table.setItem(i, 2, QTableWidgetItem(str(e.likelihood)))
-                self.matrix_top_table.setItem(i, 3, QTableWidgetItem(str(e.severity)))
-                
-                r_item = QTableWidgetItem(str(e.risk_score))
-                colors = {"Low": "#f5f5f5", "Medium": "#e8e8e8", "High": "#d8d8d8", "Extreme": "#c8c8c8"}
-                r_item.setBackground(QColor(colors.get(e.level, "#FFFFFF")))
-                self.matrix_top_table.setItem(i, 4, r_item)
-            
-            # 条形图
-            names = [e.name[:15] for e in rm.top_n]
-            values = [e.risk_score for e in rm.top_n]
-            levels = [e.level for e in rm.top_n]
-            self.matrix_bar_chart.plot_top_risks(
-                names, values, levels, 
-                f"Top-10 风险事件 (R=L×S)",
-                "风险分数 R"
-            )
-        
-        # 更新FMEA Tab
+            _fill_table(self.matrix_top_table, result.risk_matrix.top_n)
+    
+    def _update_fmea_tab(self, result: EvaluationResult):
+        """更新FMEA Tab"""
         if result.fmea:
             fmea = result.fmea
             
@@ -862,22 +1256,10 @@ class EvaluationPage(QWidget):
             )
             
             # Top10表格
-            self.fmea_top_table.setRowCount(len(fmea.top_n))
-            for i, item in enumerate(fmea.top_n):
-                self.fmea_top_table.setItem(i, 0, QTableWidgetItem(str(i + 1)))
-                self.fmea_top_table.setItem(i, 1, QTableWidgetItem(item.system))
-                self.fmea_top_table.setItem(i, 2, QTableWidgetItem(item.failure_mode[:20]))
-                self.fmea_top_table.setItem(i, 3, QTableWidgetItem(str(item.S)))
-                self.fmea_top_table.setItem(i, 4, QTableWidgetItem(str(item.O)))
-                self.fmea_top_table.setItem(i, 5, QTableWidgetItem(str(item.D)))
-                
-                rpn_item = QTableWidgetItem(str(item.RPN))
-                colors = {"Low": "#f5f5f5", "Medium": "#e8e8e8", "High": "#d8d8d8", "Extreme": "#c8c8c8"}
-                rpn_item.setBackground(QColor(colors.get(item.level, "#FFFFFF")))
-                self.fmea_top_table.setItem(i, 6, rpn_item)
+            _fill_table(self.fmea_top_table, fmea.top_n)
             
             # 条形图
-            names = [f"{i.failure_mode[:12]}" for i in fmea.top_n]
+            names = [i.display_name for i in fmea.top_n]
             values = [i.RPN for i in fmea.top_n]
             levels = [i.level for i in fmea.top_n]
             self.fmea_bar_chart.plot_top_risks(
@@ -885,23 +1267,12 @@ class EvaluationPage(QWidget):
                 "Top-10 FMEA条目 (RPN=S×O×D)",
                 "RPN值"
             )
-        
-        # 更新敏感性Tab
-        self._update_sensitivity_display(result)
-        
-        # 更新蒙特卡洛Tab
-        self._update_mc_display(result)
-        
-        # 更新FTA Tab
-        self._update_fta_display(result)
-        
-        # 更新AHP Tab
-        self._update_ahp_display(result)
-        
-        # 更新建议Tab
-        rec_html = "<h3>风险改进建议</h3><hr>"
-        for rec in result.recommendations:
-            rec_html += f"<p>{rec}</p>"
+    
+    def _update_recommendations_tab(self, result: EvaluationResult):
+        """更新建议Tab"""
+        rec_html = "<h3>风险改进建议</h3><hr>" + "".join(
+            f"<p>{html.escape(rec)}</p>" for rec in result.recommendations
+        )
         self.rec_text.setHtml(rec_html)
     
     def _switch_sensitivity(self, mode: str):
@@ -918,7 +1289,7 @@ class EvaluationPage(QWidget):
         
         if not sens_result:
             self.sens_info_label.setText("无敏感性分析数据")
-            self.sens_table.setRowCount(0)
+            _fill_table(self.sens_table, [])
             return
         
         self.sens_info_label.setText(
@@ -926,78 +1297,54 @@ class EvaluationPage(QWidget):
         )
         
         # 表格
-        top_n = sens_result.top_n
-        self.sens_table.setRowCount(len(top_n))
-        for i, f in enumerate(top_n):
-            self.sens_table.setItem(i, 0, QTableWidgetItem(f.factor_name))
-            self.sens_table.setItem(i, 1, QTableWidgetItem(f"{f.base_value:.1f}"))
-            self.sens_table.setItem(i, 2, QTableWidgetItem(f"{f.minus_value:.1f}"))
-            self.sens_table.setItem(i, 3, QTableWidgetItem(f"{f.plus_value:.1f}"))
-            self.sens_table.setItem(i, 4, QTableWidgetItem(f"{f.impact_score:.1f}"))
+        _fill_table(self.sens_table, sens_result.top_n)
         
         # 图表
-        names = [f.factor_name for f in top_n]
-        scores = [f.impact_score for f in top_n]
-        title = f"敏感性分析 - {'风险矩阵' if mode == 'matrix' else 'FMEA'}"
-        self.sens_chart.plot_sensitivity(names, scores, title)
+        _plot_sensitivity(self.sens_chart, sens_result, mode)
     
-    def _update_mc_display(self, result: EvaluationResult):
-        """更新蒙特卡洛显示"""
+    def _set_indicator_style(self, label: QLabel, style: str):
+        """设置风险指示器样式；等级未变化时跳过，避免Qt重新解析样式表"""
+        if self._indicator_styles.get(label) == style:
+            return
+        label.setStyleSheet(style)
+        self._indicator_styles[label] = style
+    
+    # ---- 蒙特卡洛/FTA/AHP：_prepare_*在线程池中整理数据，_render_*在界面线程绘制 ----
+    
+    def _prepare_mc(self, result: EvaluationResult) -> Optional[Dict[str, Any]]:
+        """整理蒙特卡洛显示数据（不访问界面组件）"""
         mc_result = result.monte_carlo_rm or result.monte_carlo_fmea
         
         if not mc_result:
+            return None
+        
+        indicator_name = "总风险" if mc_result.model_type == "risk_matrix" else "总RPN"
+        return {
+            "global_rows": [mc_result.global_stats],
+            "event_rows": mc_result.event_stats,
+            "samples": mc_result.samples,
+            "hist_title": f"{indicator_name}分布直方图 (N={mc_result.n_samples})",
+            "indicator_name": indicator_name,
+        }
+    
+    def _render_mc(self, prepared: Optional[Dict[str, Any]]):
+        """更新蒙特卡洛显示"""
+        if not prepared:
             return
         
         # 全局统计表
-        self.mc_global_table.setRowCount(1)
-        gs = mc_result.global_stats
-        self.mc_global_table.setItem(0, 0, QTableWidgetItem(gs.indicator_name))
-        self.mc_global_table.setItem(0, 1, QTableWidgetItem(f"{gs.nominal_value:.1f}"))
-        self.mc_global_table.setItem(0, 2, QTableWidgetItem(f"{gs.mean:.1f}"))
-        self.mc_global_table.setItem(0, 3, QTableWidgetItem(f"{gs.std:.1f}"))
-        self.mc_global_table.setItem(0, 4, QTableWidgetItem(f"{gs.p50:.1f}"))
-        self.mc_global_table.setItem(0, 5, QTableWidgetItem(f"{gs.p90:.1f}"))
-        self.mc_global_table.setItem(0, 6, QTableWidgetItem(f"{gs.prob_high:.2%}"))
+        _fill_table(self.mc_global_table, prepared["global_rows"])
         
         # 事件统计表
-        stats = mc_result.event_stats
-        self.mc_event_table.setRowCount(len(stats))
-        for i, s in enumerate(stats):
-            self.mc_event_table.setItem(i, 0, QTableWidgetItem(str(s.event_id)))
-            self.mc_event_table.setItem(i, 1, QTableWidgetItem(s.event_name[:15]))
-            self.mc_event_table.setItem(i, 2, QTableWidgetItem(str(s.nominal_R)))
-            self.mc_event_table.setItem(i, 3, QTableWidgetItem(f"{s.mean:.1f}"))
-            self.mc_event_table.setItem(i, 4, QTableWidgetItem(f"{s.std:.1f}"))
-            self.mc_event_table.setItem(i, 5, QTableWidgetItem(f"{s.p50:.1f}"))
-            self.mc_event_table.setItem(i, 6, QTableWidgetItem(f"{s.p90:.1f}"))
-            self.mc_event_table.setItem(i, 7, QTableWidgetItem(f"{s.prob_high:.2%}"))
+        _fill_table(self.mc_event_table, prepared["event_rows"])
         
         # 直方图
-        indicator_name = "总风险" if mc_result.model_type == "risk_matrix" else "总RPN"
-        self.mc_histogram.plot_histogram(
-            mc_result.histogram_data,
-            f"{indicator_name}分布直方图 (N={mc_result.n_samples})",
-            indicator_name, "频次"
-        )
+        _plot_mc_histogram(self.mc_histogram, prepared)
     
-    def _update_fta_display(self, result: EvaluationResult):
-        """更新FTA故障树分析显示 - 增强版"""
+    def _prepare_fta(self, result: EvaluationResult) -> Optional[Dict[str, Any]]:
+        """整理FTA显示数据（不访问界面组件）"""
         if not hasattr(result, 'fta_result') or not result.fta_result:
-            self.fta_stats_label.setText("未运行FTA分析")
-            self.fta_info_table.setRowCount(0)
-            self.fta_events_table.setRowCount(0)
-            self.fta_risk_indicator.setText("无数据")
-            self.fta_risk_indicator.setStyleSheet("""
-                QLabel {
-                    font-size: 16px;
-                    font-weight: bold;
-                    padding: 15px;
-                    border-radius: 5px;
-                    background-color: #f0f0f0;
-                    color: #666;
-                }
-            """)
-            return
+            return None
         
         fta_data = result.fta_result
         
@@ -1011,147 +1358,123 @@ class EvaluationPage(QWidget):
         node_results = fta_data.get("node_results", [])
         sensitivity_data = fta_data.get("sensitivity", [])
         
-        # 统计各类型节点数量
-        basic_count = sum(1 for n in node_results if n.get("node_type") == "BASIC")
-        intermediate_count = sum(1 for n in node_results if n.get("node_type") == "INTERMEDIATE")
-        top_count = sum(1 for n in node_results if n.get("node_type") == "TOP")
+        # 统计各类型节点数量（一次遍历）
+        type_counts = Counter(n.get("node_type") for n in node_results)
+        basic_count, intermediate_count = type_counts["BASIC"], type_counts["INTERMEDIATE"]
+        
+        prepared = {
+            "stats_text": (
+                f" <b>FTA故障树分析</b> | 顶事件: {top_event_name} | "
+                f"顶事件概率: {top_prob:.2e} | "
+                f"风险等级: {risk_level} (L={likelihood} × S={severity} = R={risk_score}) | "
+                f"节点数: {len(node_results)} (基本事件:{basic_count}, 中间事件:{intermediate_count})"
+            ),
+            "indicator_text": f"风险等级: {risk_level}\n顶事件概率: {top_prob:.4e}",
+            "indicator_style": _FTA_RISK_STYLES.get(risk_level, _FTA_DEFAULT_STYLE),
+            # 基本信息表格
+            "info_items": [
+                ("顶事件名称", top_event_name),
+                ("顶事件概率", f"{top_prob:.4e}"),
+                ("可能性等级 (L)", f"{likelihood}"),
+                ("严重度等级 (S)", f"{severity}"),
+                ("风险分数 (R=L×S)", f"{risk_score}"),
+                ("风险等级", risk_level),
+                ("节点总数", str(len(node_results))),
+                ("基本事件数", str(basic_count)),
+                ("中间事件数", str(intermediate_count))
+            ],
+            "top_prob": top_prob,
+            "tree": None,
+            "tornado": None,
+            "contribution": None,
+            "event_rows": None,
+        }
         
-        self.fta_stats_label.setText(
-            f" <b>FTA故障树分析</b> | 顶事件: {top_event_name} | "
-            f"顶事件概率: {top_prob:.2e} | "
-            f"风险等级: {risk_level} (L={likelihood} × S={severity} = R={risk_score}) | "
-            f"节点数: {len(node_results)} (基本事件:{basic_count}, 中间事件:{intermediate_count})"
-        )
+        # 故障树结构图：节点字典直接使用模型输出，边数据一次查询
+        if node_results:
+            edges_for_chart = self._edge_dao.get_edges_for_nodes(
+                [n.get("node_id", 0) for n in node_results]
+            )
+            prepared["tree"] = (node_results, edges_for_chart, f"故障树: {top_event_name}")
+        
+        # 敏感性分析龙卷风图
+        if sensitivity_data:
+            prepared["tornado"] = tuple(map(list, zip(*[
+                (s.get("node_name", ""), s.get("base_probability", 0),
+                 s.get("minus_prob", 0), s.get("plus_prob", 0))
+                for s in sensitivity_data[:10]
+            ])))
+        
+        # 贡献度图
+        basic_events = [n for n in node_results if n.get("node_type") == "BASIC"]
+        if basic_events:
+            # 按贡献度排序
+            basic_events_sorted = sorted(basic_events, key=lambda x: x.get("contribution", 0), reverse=True)
+            prepared["contribution"] = tuple(map(list, zip(*[
+                (e.get("name", ""), e.get("contribution", 0), e.get("probability", 0))
+                for e in basic_events_sorted[:10]
+            ])))
+            
+            # 关键基本事件表格
+            # 重要度（使用敏感性数据中的impact_score），按节点ID一次建好索引
+            importance_by_id = {s.get("node_id"): s.get("impact_score", 0) for s in sensitivity_data}
+            prepared["event_rows"] = [
+                (event.get("name", ""), event.get("probability", 0),
+                 importance_by_id.get(event.get("node_id"), 0), event.get("contribution", 0))
+                for event in basic_events_sorted[:10]
+            ]
+        
+        return prepared
+    
+    def _render_fta(self, prepared: Optional[Dict[str, Any]]):
+        """更新FTA故障树分析显示 - 增强版"""
+        if not prepared:
+            self.fta_stats_label.setText("未运行FTA分析")
+            _fill_table(self.fta_info_table, [])
+            _fill_table(self.fta_events_table, [])
+            self.fta_risk_indicator.setText("无数据")
+            self._set_indicator_style(self.fta_risk_indicator, _FTA_EMPTY_STYLE)
+            return
+        
+        self.fta_stats_label.setText(prepared["stats_text"])
         
         # 风险等级指示器
-        risk_colors = {
-            "Low": ("#d0d0d0", "#333"),
-            "Medium": ("#a0a0a0", "#222"),
-            "High": ("#707070", "#fff"),
-            "Extreme": ("#404040", "#fff")
-        }
-        bg_color, text_color = risk_colors.get(risk_level, ("#f0f0f0", "#333"))
-        self.fta_risk_indicator.setText(f"风险等级: {risk_level}\n顶事件概率: {top_prob:.4e}")
-        self.fta_risk_indicator.setStyleSheet(f"""
-            QLabel {{
-                font-size: 16px;
-                font-weight: bold;
-                padding: 15px;
-                border-radius: 5px;
-                background-color: {bg_color};
-                color: {text_color};
-            }}
-        """)
+        self.fta_risk_indicator.setText(prepared["indicator_text"])
+        self._set_indicator_style(self.fta_risk_indicator, prepared["indicator_style"])
         
         # 基本信息表格
-        info_items = [
-            ("顶事件名称", top_event_name),
-            ("顶事件概率", f"{top_prob:.4e}"),
-            ("可能性等级 (L)", f"{likelihood}"),
-            ("严重度等级 (S)", f"{severity}"),
-            ("风险分数 (R=L×S)", f"{risk_score}"),
-            ("风险等级", risk_level),
-            ("节点总数", str(len(node_results))),
-            ("基本事件数", str(basic_count)),
-            ("中间事件数", str(intermediate_count))
-        ]
-        
-        self.fta_info_table.setRowCount(len(info_items))
-        for i, (label, value) in enumerate(info_items):
-            self.fta_info_table.setItem(i, 0, QTableWidgetItem(label))
-            self.fta_info_table.setItem(i, 1, QTableWidgetItem(value))
+        _fill_table(self.fta_info_table, prepared["info_items"])
         
         # 绘制故障树结构图
-        if node_results:
-            # 准备节点数据
-            nodes_for_chart = []
-            for n in node_results:
-                nodes_for_chart.append({
-                    "id": n.get("node_id", 0),
-                    "name": n.get("name", ""),
-                    "node_type": n.get("node_type", "BASIC"),
-                    "gate_type": n.get("gate_type", ""),
-                    "probability": n.get("probability", 0)
-                })
-            
-            # 获取边数据（从数据库）
-            from ...db.dao import FTAEdgeDAO
-            edge_dao = FTAEdgeDAO()
-            edges_for_chart = []
-            for n in node_results:
-                children = edge_dao.get_children(n.get("node_id", 0))
-                for child_id in children:
-                    edges_for_chart.append((n.get("node_id", 0), child_id))
-            
+        if prepared["tree"]:
+            node_results, edges_for_chart, title = prepared["tree"]
             self.fta_tree_chart.plot_fta_tree(
-                nodes_for_chart, edges_for_chart,
-                f"故障树: {top_event_name}"
+                node_results, edges_for_chart, title, id_key="node_id"
             )
         
         # 绘制敏感性分析龙卷风图
-        if sensitivity_data:
-            sens_names = [s.get("node_name", "") for s in sensitivity_data[:10]]
-            base_probs = [s.get("base_probability", 0) for s in sensitivity_data[:10]]
-            minus_probs = [s.get("minus_prob", 0) for s in sensitivity_data[:10]]
-            plus_probs = [s.get("plus_prob", 0) for s in sensitivity_data[:10]]
-            
+        if prepared["tornado"]:
+            sens_names, base_probs, minus_probs, plus_probs = prepared["tornado"]
             self.fta_sensitivity_chart.plot_tornado(
-                sens_names, base_probs, minus_probs, plus_probs, top_prob,
+                sens_names, base_probs, minus_probs, plus_probs, prepared["top_prob"],
                 "FTA敏感性分析 - 基本事件对顶事件的影响"
             )
         
         # 绘制贡献度图
-        basic_events = [n for n in node_results if n.get("node_type") == "BASIC"]
-        if basic_events:
-            # 按贡献度排序
-            basic_events_sorted = sorted(basic_events, key=lambda x: x.get("contribution", 0), reverse=True)
-            contrib_names = [e.get("name", "") for e in basic_events_sorted[:10]]
-            contrib_values = [e.get("contribution", 0) for e in basic_events_sorted[:10]]
-            contrib_probs = [e.get("probability", 0) for e in basic_events_sorted[:10]]
-            
+        if prepared["contribution"]:
+            contrib_names, contrib_values, contrib_probs = prepared["contribution"]
             self.fta_contribution_chart.plot_contribution(
                 contrib_names, contrib_values, contrib_probs,
                 "基本事件贡献度分析"
             )
             
             # 更新关键基本事件表格
-            self.fta_events_table.setRowCount(min(10, len(basic_events_sorted)))
-            for i, event in enumerate(basic_events_sorted[:10]):
-                self.fta_events_table.setItem(i, 0, QTableWidgetItem(str(i + 1)))
-                self.fta_events_table.setItem(i, 1, QTableWidgetItem(event.get("name", "")))
-                prob = event.get("probability", 0)
-                self.fta_events_table.setItem(i, 2, QTableWidgetItem(f"{prob:.2e}"))
-                
-                # 重要度（使用敏感性数据中的impact_score）
-                importance = 0
-                for s in sensitivity_data:
-                    if s.get("node_id") == event.get("node_id"):
-                        importance = s.get("impact_score", 0)
-                        break
-                self.fta_events_table.setItem(i, 3, QTableWidgetItem(f"{importance:.2e}"))
-                
-                contribution = event.get("contribution", 0)
-                self.fta_events_table.setItem(i, 4, QTableWidgetItem(f"{contribution:.2%}"))
+            _fill_table(self.fta_events_table, prepared["event_rows"])
     
-    def _update_ahp_display(self, result: EvaluationResult):
-        """更新改进AHP分析显示 - 增强版"""
+    def _prepare_ahp(self, result: EvaluationResult) -> Optional[Dict[str, Any]]:
+        """整理改进AHP显示数据（不访问界面组件）"""
         if not hasattr(result, 'ahp_result') or not result.ahp_result:
-            self.ahp_stats_label.setText("未运行改进AHP分析")
-            self.ahp_result_table.setRowCount(0)
-            self.ahp_details_table.setRowCount(0)
-            self.ahp_risk_indicator.setText("无数据")
-            self.ahp_risk_indicator.setStyleSheet("""
-                QLabel {
-                    font-size: 18px;
-                    font-weight: bold;
-                    padding: 20px;
-                    border-radius: 8px;
-                    background-color: #f0f0f0;
-                    color: #666;
-                }
-            """)
-            self.ahp_weight_check.setText("")
-            return
+            return None
         
         ahp_data = result.ahp_result
         
@@ -1162,35 +1485,9 @@ class EvaluationPage(QWidget):
         indicator_results = ahp_data.get("indicator_results", [])
         top_contributors = ahp_data.get("top_contributors", [])
         
-        # 统计信息
-        self.ahp_stats_label.setText(
-            f" <b>改进AHP综合评估</b> | 综合得分: {total_score:.4f} | "
-            f"风险等级: {risk_level} | 评估指标数: {len(indicator_results)}"
-        )
-        
-        # 风险等级指示器
-        risk_colors = {
-            "Low": ("#d0d0d0", "#333", "低风险 - 系统运行正常"),
-            "Medium": ("#a0a0a0", "#222", "中等风险 - 需要关注"),
-            "High": ("#707070", "#fff", "高风险 - 需要采取措施"),
-            "Extreme": ("#404040", "#fff", "极高风险 - 紧急处理")
-        }
-        bg_color, text_color, desc = risk_colors.get(risk_level, ("#f0f0f0", "#333", ""))
-        self.ahp_risk_indicator.setText(f"综合得分: {total_score:.4f}\n风险等级: {risk_level}\n{desc}")
-        self.ahp_risk_indicator.setStyleSheet(f"""
-            QLabel {{
-                font-size: 16px;
-                font-weight: bold;
-                padding: 18px;
-                border-radius: 8px;
-                background-color: {bg_color};
-                color: {text_color};
-            }}
-        """)
-        
         # 权重校验
         weight_status = "✓ 权重总和正常" if abs(weight_sum - 1.0) < 0.01 else f"⚠ 权重总和: {weight_sum:.4f}"
-        self.ahp_weight_check.setText(f"权重校验: {weight_status} | 指标数量: {len(indicator_results)}")
+        desc = _AHP_RISK_DESC.get(risk_level, "")
         
         # 综合结果表格
         result_items = [
@@ -1201,54 +1498,86 @@ class EvaluationPage(QWidget):
             ("修正权重总和", f"{weight_sum:.4f}")
         ]
         
-        # 如果有额外的统计信息
+        prepared = {
+            "stats_text": (
+                f" <b>改进AHP综合评估</b> | 综合得分: {total_score:.4f} | "
+                f"风险等级: {risk_level} | 评估指标数: {len(indicator_results)}"
+            ),
+            "indicator_text": f"综合得分: {total_score:.4f}\n风险等级: {risk_level}\n{desc}",
+            "indicator_style": _AHP_RISK_STYLES.get(risk_level, _AHP_DEFAULT_STYLE),
+            "weight_text": f"权重校验: {weight_status} | 指标数量: {len(indicator_results)}",
+            "result_items": result_items,
+            "indicator_results": indicator_results,
+            "radar": None,
+            "contribution": None,
+        }
+        
         if indicator_results:
+            # 如果有额外的统计信息
             avg_score = sum(r.get("normalized_value", 0) for r in indicator_results) / len(indicator_results)
             max_contrib = max(r.get("contribution", 0) for r in indicator_results)
             result_items.extend([
                 ("平均指标得分", f"{avg_score:.4f}"),
                 ("最大单项贡献", f"{max_contrib:.4f}")
             ])
+            
+            # 按贡献度排序：雷达图取前12个指标，贡献度图取前10个
+            sorted_results = sorted(indicator_results, key=lambda x: x.get("contribution", 0), reverse=True)
+            radar_data = sorted_results[:12]
+            prepared["radar"] = (
+                [r.get("display_name", "") for r in radar_data],
+                [r.get("corrected_weight", 0) for r in radar_data],
+                [r.get("normalized_value", 0) for r in radar_data],
+            )
+            top10 = sorted_results[:10]
+            prepared["contribution"] = (
+                [r.get("indicator_name", "") for r in top10],
+                [r.get("corrected_weight", 0) for r in top10],
+                [r.get("normalized_value", 0) for r in top10],
+                [r.get("contribution", 0) for r in top10],
+            )
+        
+        return prepared
+    
+    def _render_ahp(self, prepared: Optional[Dict[str, Any]]):
+        """更新改进AHP分析显示 - 增强版"""
+        if not prepared:
+            self.ahp_stats_label.setText("未运行改进AHP分析")
+            _fill_table(self.ahp_result_table, [])
+            _fill_table(self.ahp_details_table, [])
+            self.ahp_risk_indicator.setText("无数据")
+            self._set_indicator_style(self.ahp_risk_indicator, _AHP_EMPTY_STYLE)
+            self.ahp_weight_check.setText("")
+            return
         
-        self.ahp_result_table.setRowCount(len(result_items))
-        for i, (label, value) in enumerate(result_items):
-            self.ahp_result_table.setItem(i, 0, QTableWidgetItem(label))
-            self.ahp_result_table.setItem(i, 1, QTableWidgetItem(value))
+        # 统计信息
+        self.ahp_stats_label.setText(prepared["stats_text"])
+        
+        # 风险等级指示器
+        self.ahp_risk_indicator.setText(prepared["indicator_text"])
+        self._set_indicator_style(self.ahp_risk_indicator, prepared["indicator_style"])
+        
+        # 权重校验
+        self.ahp_weight_check.setText(prepared["weight_text"])
+        
+        # 综合结果表格
+        _fill_table(self.ahp_result_table, prepared["result_items"])
         
         # 绘制雷达图
-        if indicator_results:
-            # 取前12个指标绘制雷达图
-            radar_data = sorted(indicator_results, key=lambda x: x.get("contribution", 0), reverse=True)[:12]
-            radar_names = [r.get("indicator_name", "")[:10] for r in radar_data]
-            radar_weights = [r.get("corrected_weight", 0) for r in radar_data]
-            radar_scores = [r.get("normalized_value", 0) for r in radar_data]
-            
+        if prepared["radar"]:
+            radar_names, radar_weights, radar_scores = prepared["radar"]
             self.ahp_radar_chart.plot_radar(
                 radar_names, radar_weights, radar_scores,
                 "AHP指标权重与得分分布"
             )
         
-        # 绘制贡献度图
-        if indicator_results:
-            # 按贡献度排序
-            sorted_results = sorted(indicator_results, key=lambda x: x.get("contribution", 0), reverse=True)
-            contrib_names = [r.get("indicator_name", "") for r in sorted_results[:10]]
-            contrib_weights = [r.get("corrected_weight", 0) for r in sorted_results[:10]]
-            contrib_scores = [r.get("normalized_value", 0) for r in sorted_results[:10]]
-            contrib_values = [r.get("contribution", 0) for r in sorted_results[:10]]
-            
-            # 使用水平条形图对比
+        # 绘制贡献度图（水平条形图对比）
+        if prepared["contribution"]:
+            contrib_names, contrib_weights, contrib_scores, contrib_values = prepared["contribution"]
             self.ahp_contribution_chart.plot_horizontal_bar(
                 contrib_names, contrib_weights, contrib_scores, contrib_values,
                 "AHP Top-10 指标权重-得分-贡献度对比"
             )
         
         # 详情表格
-        self.ahp_details_table.setRowCount(len(indicator_results))
-        for i, r in enumerate(indicator_results):
-            self.ahp_details_table.setItem(i, 0, QTableWidgetItem(r.get("indicator_name", "")))
-            self.ahp_details_table.setItem(i, 1, QTableWidgetItem(f"{r.get('original_weight', 0):.4f}"))
-            self.ahp_details_table.setItem(i, 2, QTableWidgetItem(f"{r.get('corrected_weight', 0):.4f}"))
-            self.ahp_details_table.setItem(i, 3, QTableWidgetItem(f"{r.get('normalized_value', 0):.4f}"))
-            self.ahp_details_table.setItem(i, 4, QTableWidgetItem(f"{r.get('contribution', 0):.4f}"))
-            self.ahp_details_table.setItem(i, 5, QTableWidgetItem(f"{r.get('z_score', 0):.2f}"))
+        _fill_table(self.ahp_details_table, prepared["indicator_results"])
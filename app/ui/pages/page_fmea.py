@@ -3,24 +3,223 @@ FMEA管理页面
 FMEA Management Page
 """
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
-    QPushButton, QLabel, QComboBox, QDialog, QFormLayout, QLineEdit,
-    QSpinBox, QTextEdit, QMessageBox, QAbstractItemView, QDialogButtonBox,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, QPushButton,
+    QLabel, QComboBox, QDialog, QFormLayout, QLineEdit, QSpinBox, QTextEdit, QMessageBox, QAbstractItemView, QDialogButtonBox,
     QGroupBox, QFileDialog
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QColor
-from typing import Optional
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QTimer, QModelIndex, QSignalBlocker,
+    QAbstractItemModel, QSortFilterProxyModel
+)
+from PyQt5.QtGui import QBrush, QColor, QStandardItemModel, QStandardItem
+from typing import Optional, List, Dict, Tuple
+from bisect import bisect_left
+from collections import namedtuple
 import os
 
+import numpy as np
+
 from ...db.dao import FMEAItem, FMEAItemDAO, Mission, MissionDAO
-from ...utils.excel_import import ExcelTemplate, ExcelImporter, DataBatchImporter
+from ...utils.excel_import import ExcelTemplate
+from ..widgets.table_view import DataclassTableModel, TableColumn, frozen_table
+from ..widgets.import_runner import ImportRunner
+
+
+# RPN等级划分：(上限, 等级, 背景色)，RPN不超过上限即落入该档
+_RPN_BUCKETS = (
+    (100, "Low", QColor("#f5f5f5")),
+    (300, "Medium", QColor("#e8e8e8")),
+    (600, "High", QColor("#d8d8d8")),
+    (10 ** 9, "Extreme", QColor("#c8c8c8")),
+)
+_RPN_UPPER = tuple(b[0] for b in _RPN_BUCKETS)
+_RPN_LEVELS = tuple(b[1] for b in _RPN_BUCKETS)
+_RPN_BRUSHES = tuple(QBrush(b[2]) for b in _RPN_BUCKETS)
+_RPN_LABEL_STYLE = "font-size: 24px; font-weight: bold; color: #666;"
+
+
+def _rpn_bucket(rpn: int) -> int:
+    """单个RPN的等级下标（批量计算见 _rpn_buckets）"""
+    return bisect_left(_RPN_UPPER, rpn)
+
+
+def _rpn_buckets(rpn: np.ndarray) -> np.ndarray:
+    """RPN数组的等级下标，与 _rpn_bucket 逐个计算的结果一致"""
+    return np.digitize(rpn, _RPN_UPPER[:-1], right=True)
+
+
+# 高风险：High 及以上（RPN > 300）
+_HIGH_RPN = _RPN_UPPER[1]
+
+
+# FMEA表格行：level 为 _RPN_LEVELS 的下标
+FMEARow = namedtuple("FMEARow", "item mission_name rpn level")
+
+
+def _row_brush(row: FMEARow) -> QBrush:
+    return _RPN_BRUSHES[row.level]
+
+
+_FMEA_COLUMNS = (
+    TableColumn("ID", lambda row: row.item.id),
+    TableColumn("任务", "mission_name"),
+    TableColumn("系统", lambda row: row.item.system or ""),
+    TableColumn("失效模式", lambda row: row.item.failure_mode or ""),
+    TableColumn("S", lambda row: row.item.S),
+    TableColumn("O", lambda row: row.item.O),
+    TableColumn("D", lambda row: row.item.D),
+    TableColumn("RPN", "rpn", {Qt.BackgroundRole: _row_brush}),
+    TableColumn("等级", lambda row: _RPN_LEVELS[row.level], {Qt.BackgroundRole: _row_brush}),
+    TableColumn("控制措施", lambda row: row.item.control or ""),
+)
+
+
+def _build_rows(items) -> List[FMEARow]:
+    """
+    把 get_all_with_mission_name 返回的 (item, mission_name, rpn) 转换为表格行
+    
+    RPN已在SQL中算好，这里只对整批RPN做一次向量化分级。
+    """
+    rpn = np.fromiter((r for _, _, r in items), dtype=np.int32, count=len(items))
+    levels = _rpn_buckets(rpn)
+    return [
+        FMEARow(item, mission_name, r, lvl)
+        for (item, mission_name, r), lvl in zip(items, levels.tolist())
+    ]
+
+
+class FMEATableModel(DataclassTableModel):
+    """
+    FMEA条目表格模型，行为 FMEARow
+    
+    按页从数据库加载：load() 只取第一页，视图滚动到末尾时
+    通过 canFetchMore/fetchMore 追加下一页。
+    切换筛选时保留已加载的行，切回时直接复用；数据变化后由页面调用 clear_cache()。
+    """
+    
+    PAGE_SIZE = 200
+    
+    def __init__(self, dao: FMEAItemDAO, parent=None):
+        super().__init__([], _FMEA_COLUMNS, parent)
+        self._dao = dao
+        self._mission_id: Optional[int] = None
+        self._total = 0
+        self._loaded = False
+        # 筛选条件 -> (已加载的行, 总数)
+        self._cache: Dict[Optional[int], Tuple[List[FMEARow], int]] = {}
+    
+    def load(self, mission_id: Optional[int], total: int):
+        """
+        切换查询条件并加载第一页（该条件已有缓存时直接复用）
+        
+        Args:
+            mission_id: 筛选的任务ID，None 表示全部
+            total: 符合条件的条目总数
+        """
+        if self._loaded:
+            self._cache[self._mission_id] = (self._rows, self._total)
+        self._mission_id = mission_id
+        self._loaded = True
+        cached = self._cache.pop(mission_id, None)
+        if cached is not None:
+            rows, self._total = cached
+            self.set_rows(rows)
+            return
+        self._total = total
+        self.set_rows(self._fetch_page(0))
+    
+    def clear_cache(self):
+        """
+        丢弃所有筛选条件下缓存的行（数据已变化）
+        
+        当前已显示的行保留到下次load()，但不再存入缓存，
+        下次load()（包括同一筛选条件）会按新的总数重新取第一页。
+        """
+        self._cache.clear()
+        self._loaded = False
+    
+    def _fetch_page(self, offset: int) -> List[FMEARow]:
+        items = self._dao.get_all_with_mission_name(
+            self._mission_id, limit=self.PAGE_SIZE, offset=offset
+        )
+        if len(items) < self.PAGE_SIZE:
+            # 已到末尾（期间可能有条目被删除）
+            self._total = offset + len(items)
+        return _build_rows(items)
+    
+    def row_of(self, item_id: int) -> int:
+        """已加载行中指定条目所在的行号，未加载时返回-1"""
+        return next((r for r, row in enumerate(self._rows) if row.item.id == item_id), -1)
+    
+    def _matches(self, item: FMEAItem) -> bool:
+        return self._mission_id is None or item.mission_id == self._mission_id
+    
+    @staticmethod
+    def _make_row(item: FMEAItem, mission_name: str) -> FMEARow:
+        rpn = item.S * item.O * item.D
+        return FMEARow(item, mission_name, rpn, _rpn_bucket(rpn))
+    
+    def add_item(self, item: FMEAItem, mission_name: str):
+        """
+        新增条目后局部更新
+        
+        新条目ID最大、排在末尾：已加载到末尾时直接追加，否则只增加总数，
+        等滚动到末尾时随分页加载。
+        """
+        if not self._matches(item):
+            return
+        all_loaded = not self.canFetchMore()
+        self._total += 1
+        if all_loaded:
+            self.append_rows([self._make_row(item, mission_name)])
+    
+    def update_item(self, item: FMEAItem, mission_name: str):
+        """编辑条目后只更新该行；所属任务改为筛选范围之外时移除该行"""
+        r = self.row_of(item.id)
+        if r < 0:
+            return
+        if self._matches(item):
+            self.replace_row(r, self._make_row(item, mission_name))
+        else:
+            self.remove_item(item.id)
+    
+    def remove_item(self, item_id: int):
+        """删除条目后只移除该行"""
+        r = self.row_of(item_id)
+        if r >= 0:
+            self.remove_row(r)
+            self._total -= 1
+    
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self.rowCount() < self._total
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if not parent.isValid():
+            self.append_rows(self._fetch_page(self.rowCount()))
+    
+    def item_at(self, row: int) -> FMEAItem:
+        """获取指定行的FMEA条目"""
+        return self._rows[row].item
 
 
 class FMEAEditDialog(QDialog):
     """FMEA条目编辑对话框"""
     
+    # 文本字段：(FMEAItem属性, 编辑控件属性, 是否多行)
+    _FIELDS = (
+        ("system", "system_edit", False),
+        ("failure_mode", "failure_mode_edit", False),
+        ("effect", "effect_edit", True),
+        ("cause", "cause_edit", True),
+        ("control", "control_edit", True),
+    )
+    
     def __init__(self, item: FMEAItem = None, missions=None, parent=None):
+        """
+        Args:
+            missions: 任务列表，或页面共享的任务模型（QAbstractItemModel，
+                      各行Qt.UserRole为任务ID，ID为空的"全部任务"行会被过滤掉）
+        """
         super().__init__(parent)
         self.setWindowTitle("编辑FMEA条目" if item else "新增FMEA条目")
         self.setMinimumWidth(600)
@@ -34,11 +233,26 @@ class FMEAEditDialog(QDialog):
         basic_layout = QFormLayout(basic_group)
         
         self.mission_combo = QComboBox()
-        if missions:
-            for m in missions:
-                self.mission_combo.addItem(m.name, m.id)
-                if self.item.mission_id == m.id:
-                    self.mission_combo.setCurrentIndex(self.mission_combo.count() - 1)
+        if isinstance(missions, QAbstractItemModel):
+            # 直接复用共享模型（经代理过滤），无需逐项重建下拉框
+            proxy = QSortFilterProxyModel(self.mission_combo)
+            proxy.setSourceModel(missions)
+            proxy.setFilterRole(Qt.UserRole)
+            proxy.setFilterRegularExpression(".+")
+            with QSignalBlocker(self.mission_combo):
+                self.mission_combo.setModel(proxy)
+                idx = self.mission_combo.findData(self.item.mission_id)
+                if idx >= 0:
+                    self.mission_combo.setCurrentIndex(idx)
+        elif missions:
+            # 一次性添加全部名称，再逐项写入ID并按ID定位当前任务
+            with QSignalBlocker(self.mission_combo):
+                self.mission_combo.addItems([m.name for m in missions])
+                for i, m in enumerate(missions):
+                    self.mission_combo.setItemData(i, m.id)
+                idx = self.mission_combo.findData(self.item.mission_id)
+                if idx >= 0:
+                    self.mission_combo.setCurrentIndex(idx)
         
         self.system_edit = QLineEdit(self.item.system or "")
         self.system_edit.setPlaceholderText("如：推进系统、控制系统...")
@@ -114,7 +328,7 @@ class FMEAEditDialog(QDialog):
         rpn_layout = QVBoxLayout()
         rpn_layout.addWidget(QLabel("<b>RPN</b>"))
         self.rpn_label = QLabel()
-        self.rpn_label.setStyleSheet("font-size: 20px; font-weight: bold;")
+        self.rpn_label.setStyleSheet(_RPN_LABEL_STYLE)
         self.rpn_label.setMinimumWidth(100)
         rpn_layout.addWidget(self.rpn_label)
         self.rpn_level_label = QLabel()
@@ -143,28 +357,18 @@ class FMEAEditDialog(QDialog):
         o = self.o_spin.value()
         d = self.d_spin.value()
         rpn = s * o * d
-        
-        if rpn <= 100:
-            level, color = "Low", "#666"
-        elif rpn <= 300:
-            level, color = "Medium", "#666"
-        elif rpn <= 600:
-            level, color = "High", "#666"
-        else:
-            level, color = "Extreme", "#666"
+        level = _RPN_LEVELS[_rpn_bucket(rpn)]
         
         self.rpn_label.setText(str(rpn))
-        self.rpn_label.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {color};")
-        self.rpn_level_label.setText(f"<span style='color:{color}'>{level}</span>")
+        self.rpn_level_label.setText(f"<span style='color:#666'>{level}</span>")
     
     def get_data(self) -> FMEAItem:
         """获取表单数据"""
         self.item.mission_id = self.mission_combo.currentData()
-        self.item.system = self.system_edit.text().strip()
-        self.item.failure_mode = self.failure_mode_edit.text().strip()
-        self.item.effect = self.effect_edit.toPlainText().strip()
-        self.item.cause = self.cause_edit.toPlainText().strip()
-        self.item.control = self.control_edit.toPlainText().strip()
+        for attr, widget_name, multiline in self._FIELDS:
+            widget = getattr(self, widget_name)
+            text = widget.toPlainText() if multiline else widget.text()
+            setattr(self.item, attr, text.strip())
         self.item.S = self.s_spin.value()
         self.item.O = self.o_spin.value()
         self.item.D = self.d_spin.value()
@@ -187,6 +391,18 @@ class FMEAManagementPage(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._fmea_dao = FMEAItemDAO()
+        self._mission_dao = MissionDAO()
+        # 任务列表缓存：在 _refresh_filter 中更新（切换到本页时 refresh_all 会调用），
+        # 新增/编辑对话框直接复用
+        self._missions_cache: List[Mission] = []
+        # 任务下拉模型：筛选器与编辑对话框共用，首行为"全部任务"（ID为None）
+        self._mission_model = QStandardItemModel(self)
+        # 筛选条件 -> 统计结果 (条目数, RPN总和, 高风险数)，数据变化时清空
+        self._stats_cache: Dict[Optional[int], Tuple[int, int, int]] = {}
+        self._refresh_scheduled = False
+        self._refreshing = False
+        self._import_runner = ImportRunner(self)
         self._init_ui()
         self.refresh_all()
     
@@ -198,8 +414,9 @@ class FMEAManagementPage(QWidget):
         filter_layout = QHBoxLayout()
         filter_layout.addWidget(QLabel("按任务筛选:"))
         self.mission_filter = QComboBox()
+        self.mission_filter.setModel(self._mission_model)
         self.mission_filter.setMinimumWidth(200)
-        self.mission_filter.currentIndexChanged.connect(self._refresh_table)
+        self.mission_filter.currentIndexChanged.connect(self._schedule_refresh)
         filter_layout.addWidget(self.mission_filter)
         filter_layout.addStretch()
         
@@ -242,11 +459,9 @@ class FMEAManagementPage(QWidget):
         layout.addLayout(toolbar)
         
         # 表格
-        self.table = QTableWidget()
-        self.table.setColumnCount(10)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "任务", "系统", "失效模式", "S", "O", "D", "RPN", "等级", "控制措施"
-        ])
+        self.model = FMEATableModel(self._fmea_dao, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table.setAlternatingRowColors(True)
@@ -268,95 +483,91 @@ class FMEAManagementPage(QWidget):
     
     def _refresh_filter(self):
         """刷新任务筛选器"""
-        mission_dao = MissionDAO()
-        missions = mission_dao.get_all()
+        missions = self._mission_dao.get_all()
+        self._missions_cache = missions
         
-        self.mission_filter.blockSignals(True)
-        self.mission_filter.clear()
-        self.mission_filter.addItem("全部任务", None)
+        rows = [QStandardItem("全部任务")]
         for m in missions:
-            self.mission_filter.addItem(m.name, m.id)
-        self.mission_filter.blockSignals(False)
+            row = QStandardItem(m.name)
+            row.setData(m.id, Qt.UserRole)
+            rows.append(row)
+        
+        # QSignalBlocker 保证填充中途出错时也会恢复信号
+        with QSignalBlocker(self.mission_filter):
+            self._mission_model.clear()
+            self._mission_model.invisibleRootItem().appendRows(rows)
+            self.mission_filter.setCurrentIndex(0)
+    
+    def _schedule_refresh(self):
+        """
+        合并刷新请求：同一轮事件循环内的多次请求（如refresh_all与筛选切换、
+        快速切换筛选项）只在回到事件循环时刷新一次表格
+        """
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            QTimer.singleShot(0, self._flush_refresh)
+    
+    def _flush_refresh(self):
+        self._refresh_scheduled = False
+        self._refresh_table()
     
     def _refresh_table(self):
-        """刷新FMEA表格"""
-        dao = FMEAItemDAO()
-        mission_dao = MissionDAO()
-        missions = {m.id: m.name for m in mission_dao.get_all()}
-        
-        filter_mission_id = self.mission_filter.currentData()
-        
-        if filter_mission_id:
-            items = dao.get_by_mission(filter_mission_id)
-        else:
-            items = dao.get_all()
-        
-        # 统计
-        total_rpn = 0
-        high_count = 0
-        
-        self.table.setRowCount(len(items))
-        for i, item in enumerate(items):
-            rpn = item.S * item.O * item.D
-            total_rpn += rpn
-            
-            if rpn <= 100:
-                level, color = "Low", "#f5f5f5"
-            elif rpn <= 300:
-                level, color = "Medium", "#e8e8e8"
-            elif rpn <= 600:
-                level, color = "High", "#d8d8d8"
-                high_count += 1
-            else:
-                level, color = "Extreme", "#c8c8c8"
-                high_count += 1
-            
-            self.table.setItem(i, 0, QTableWidgetItem(str(item.id)))
-            self.table.setItem(i, 1, QTableWidgetItem(missions.get(item.mission_id, "")))
-            self.table.setItem(i, 2, QTableWidgetItem(item.system or ""))
-            self.table.setItem(i, 3, QTableWidgetItem(item.failure_mode or ""))
-            self.table.setItem(i, 4, QTableWidgetItem(str(item.S)))
-            self.table.setItem(i, 5, QTableWidgetItem(str(item.O)))
-            self.table.setItem(i, 6, QTableWidgetItem(str(item.D)))
-            
-            rpn_item = QTableWidgetItem(str(rpn))
-            rpn_item.setBackground(QColor(color))
-            self.table.setItem(i, 7, rpn_item)
-            
-            level_item = QTableWidgetItem(level)
-            level_item.setBackground(QColor(color))
-            self.table.setItem(i, 8, level_item)
-            
-            self.table.setItem(i, 9, QTableWidgetItem(item.control or ""))
-        
-        # 更新统计
-        avg_rpn = total_rpn / len(items) if items else 0
+        """刷新FMEA表格（刷新过程中被再次触发时直接忽略）"""
+        if self._refreshing:
+            return
+        self._refreshing = True
+        try:
+            # 表格只加载第一页，其余随滚动分页加载
+            count = self._refresh_stats()
+            with frozen_table(self.table):
+                self.model.load(self.mission_filter.currentData() or None, count)
+        finally:
+            self._refreshing = False
+    
+    def _refresh_stats(self) -> int:
+        """更新统计信息（在数据库端汇总，按筛选条件缓存），返回当前筛选下的条目数"""
+        mission_id = self.mission_filter.currentData() or None
+        stats = self._stats_cache.get(mission_id)
+        if stats is None:
+            stats = self._fmea_dao.get_rpn_stats(mission_id, _HIGH_RPN)
+            self._stats_cache[mission_id] = stats
+        count, total_rpn, high_count = stats
+        avg_rpn = total_rpn / count if count else 0
         self.stats_label.setText(
-            f"共 {len(items)} 条 | 平均RPN: {avg_rpn:.1f} | 高风险: {high_count} 条"
+            f"共 {count} 条 | 平均RPN: {avg_rpn:.1f} | 高风险: {high_count} 条"
         )
+        return count
+    
+    def _invalidate_cache(self):
+        """数据变化后清空各筛选条件的统计与行缓存"""
+        self._stats_cache.clear()
+        self.model.clear_cache()
+    
+    def _mission_name(self, mission_id: int) -> str:
+        return next((m.name for m in self._missions_cache if m.id == mission_id), "")
     
     def _get_selected_id(self) -> Optional[int]:
         """获取选中行的ID"""
-        selected = self.table.selectedItems()
+        selected = self.table.selectionModel().selectedRows()
         if selected:
-            return int(self.table.item(selected[0].row(), 0).text())
+            return self.model.item_at(selected[0].row()).id
         return None
     
     def _add_item(self):
         """新增FMEA条目"""
-        mission_dao = MissionDAO()
-        missions = mission_dao.get_all()
+        missions = self._missions_cache
         
         if not missions:
             QMessageBox.warning(self, "警告", "请先创建至少一个任务")
             return
         
-        dialog = FMEAEditDialog(missions=missions, parent=self)
+        dialog = FMEAEditDialog(missions=self._mission_model, parent=self)
         if dialog.exec_() == QDialog.Accepted:
             item = dialog.get_data()
-            dao = FMEAItemDAO()
-            dao.create(item)
-            self._refresh_table()
+            item.id = self._fmea_dao.create(item)
+            self._invalidate_cache()
+            self.model.add_item(item, self._mission_name(item.mission_id))
+            self._refresh_stats()
             self.data_changed.emit()
     
     def _edit_item(self):
@@ -366,17 +577,15 @@ class FMEAManagementPage(QWidget):
             QMessageBox.warning(self, "警告", "请先选择一个条目")
             return
         
-        dao = FMEAItemDAO()
-        item = dao.get_by_id(item_id)
-        
-        mission_dao = MissionDAO()
-        missions = mission_dao.get_all()
+        item = self._fmea_dao.get_by_id(item_id)
         
-        dialog = FMEAEditDialog(item, missions, parent=self)
+        dialog = FMEAEditDialog(item, self._mission_model, parent=self)
         if dialog.exec_() == QDialog.Accepted:
             item = dialog.get_data()
-            dao.update(item)
-            self._refresh_table()
+            self._fmea_dao.update(item)
+            self._invalidate_cache()
+            self.model.update_item(item, self._mission_name(item.mission_id))
+            self._refresh_stats()
             self.data_changed.emit()
     
     def _delete_item(self):
@@ -388,15 +597,17 @@ class FMEAManagementPage(QWidget):
         
         reply = QMessageBox.question(self, "确认", "确定删除该FMEA条目吗？")
         if reply == QMessageBox.Yes:
-            dao = FMEAItemDAO()
-            dao.delete(item_id)
-            self._refresh_table()
+            self._fmea_dao.delete(item_id)
+            self._invalidate_cache()
+            self.model.remove_item(item_id)
+            self._refresh_stats()
             self.data_changed.emit()
     
     def refresh_all(self):
         """刷新所有数据"""
+        self._invalidate_cache()
         self._refresh_filter()
-        self._refresh_table()
+        self._schedule_refresh()
     
     def _download_template(self):
         """下载FMEA导入模板"""
@@ -413,41 +624,11 @@ class FMEAManagementPage(QWidget):
                 QMessageBox.warning(self, "错误", "保存模板失败")
     
     def _import_fmea(self):
-        """导入FMEA数据"""
-        filename, _ = QFileDialog.getOpenFileName(
-            self, "选择FMEA数据文件", os.getcwd(),
-            "Excel/CSV文件 (*.xlsx *.xls *.csv)"
-        )
-        if not filename:
-            return
-        
-        try:
-            # 解析文件
-            importer = ExcelImporter()
-            fmea_items, errors = importer.import_fmea_items(filename)
-            
-            if not fmea_items and errors:
-                QMessageBox.warning(self, "导入失败",
-                    "文件解析失败:\n" + "\n".join(errors[:5]))
-                return
-            
-            # 批量导入数据库
-            batch_importer = DataBatchImporter()
-            success_count, db_errors = batch_importer.batch_import_fmea_items(fmea_items)
-            
-            # 显示结果
-            msg = f"成功导入 {success_count}/{len(fmea_items)} 条FMEA记录"
-            if errors:
-                msg += f"\n\n解析警告 ({len(errors)}):\n" + "\n".join(errors[:3])
-            if db_errors:
-                msg += f"\n\n数据库错误 ({len(db_errors)}):\n" + "\n".join(db_errors[:3])
-            
-            if success_count > 0:
-                QMessageBox.information(self, "导入完成", msg)
-                self._refresh_table()
-                self.data_changed.emit()
-            else:
-                QMessageBox.warning(self, "导入失败", msg)
-                
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"导入过程出错:\n{str(e)}")
+        """导入FMEA数据（在后台线程中完成解析与入库）"""
+        self._import_runner.start('fmea', "选择FMEA数据文件", "FMEA记录", self._on_imported)
+    
+    def _on_imported(self):
+        """导入成功后刷新表格与统计"""
+        self._invalidate_cache()
+        self._refresh_table()
+        self.data_changed.emit()
@@ -4,15 +4,47 @@ Fault Tree Analysis Page
 """
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QTableWidget, QTableWidgetItem, QLabel, QLineEdit,
+    QTableView, QAbstractItemView, QLabel, QLineEdit,
     QMessageBox, QHeaderView, QComboBox, QGroupBox,
-    QSplitter, QTextEdit, QDoubleSpinBox
+    QSplitter, QTextEdit, QDoubleSpinBox, QFileDialog
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QSignalBlocker
+from functools import partial
 import json
+import os
 
-from ...db.dao import FTANodeDAO, FTAEdgeDAO, MissionDAO
-from ...models.fta import FTAModel
+from ...db.dao import FTANode, FTAEdge, FTANodeDAO, FTAEdgeDAO, MissionDAO
+from ...utils.excel_import import ExcelTemplate
+from ..widgets.table_view import DataclassTableModel, TableColumn
+from ..widgets.pool_task import PoolTaskSignals, start_pool_task
+from ..widgets.import_runner import ImportRunner
+
+
+# 预先绑定的数值格式化函数，供表格单元格与结果列表中逐项调用
+_FMT_6F = "{:.6f}".format
+_FMT_E6 = "{:.6e}".format
+_FMT_4E = "{:.4e}".format
+
+# 节点表：行为FTANode
+_NODE_COLUMNS = (
+    TableColumn("ID", "id"),
+    TableColumn("名称", "name"),
+    TableColumn("类型", "node_type"),
+    TableColumn("门类型", lambda n: n.gate_type or ""),
+    TableColumn("概率", lambda n: _FMT_6F(n.probability) if n.probability else ""),
+)
+
+# 边表：行为 get_edges_with_names 返回的 (edge_id, parent_name, child_name)
+_EDGE_COLUMNS = (
+    TableColumn("ID", lambda e: e[0]),
+    TableColumn("父节点", lambda e: e[1]),
+    TableColumn("子节点", lambda e: e[2]),
+)
+
+# 结果文本的标题块
+_RULE = "=" * 50
+_ANALYSIS_HEADER = f"{_RULE}\nFTA分析结果\n{_RULE}"
+_SENSITIVITY_HEADER = f"{_RULE}\nFTA敏感度分析结果\n{_RULE}"
 
 
 class PageFTA(QWidget):
@@ -24,9 +56,26 @@ class PageFTA(QWidget):
         self.node_dao = FTANodeDAO()
         self.edge_dao = FTAEdgeDAO()
         self.mission_dao = MissionDAO()
-        self.fta_model = FTAModel()
+        self.fta_model = None  # 首次计算时创建
+        # 按任务缓存的节点/边列表，增删节点或边时失效
+        self._node_cache = {}
+        self._edge_cache = {}
+        # 数据延迟到页面首次显示时加载，之后由reload()标记失效
+        self._loaded = False
+        # 当前显示的任务；任务未变且数据未失效时refresh_data直接返回
+        self._last_mission_id = None
+        self._dirty = True
+        # 后台FTA计算
+        self._fta_signals = PoolTaskSignals(self)
+        self._fta_signals.done.connect(self._on_fta_done, Qt.QueuedConnection)
+        self._fta_signals.failed.connect(self._on_fta_failed, Qt.QueuedConnection)
+        # FTA结果缓存：键为 (mission_id, 图版本, 是否敏感度分析)，节点/边变化时版本递增
+        self._fta_cache = {}
+        self._graph_rev = 0
+        self._fta_pending_key = None
+        # 后台批量导入
+        self._import_runner = ImportRunner(self)
         self.setup_ui()
-        self.refresh_missions()
     
     def get_mission_id(self):
         """获取当前选中的任务ID"""
@@ -71,14 +120,12 @@ class PageFTA(QWidget):
         
         left_layout.addWidget(QLabel("<b>FTA节点</b>"))
         
-        self.node_table = QTableWidget()
-        self.node_table.setColumnCount(5)
-        self.node_table.setHorizontalHeaderLabels([
-            "ID", "名称", "类型", "门类型", "概率"
-        ])
+        self.node_model = DataclassTableModel([], _NODE_COLUMNS, self)
+        self.node_table = QTableView()
+        self.node_table.setModel(self.node_model)
         self.node_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.node_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.node_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.node_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.node_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         left_layout.addWidget(self.node_table)
         
         # 节点编辑
@@ -125,6 +172,16 @@ class PageFTA(QWidget):
         node_btn_layout.addWidget(self.btn_delete_node)
         node_edit_layout.addLayout(node_btn_layout)
         
+        import_btn_layout = QHBoxLayout()
+        self.btn_import_nodes = QPushButton("批量导入节点")
+        self.btn_import_nodes.clicked.connect(self._import_nodes)
+        import_btn_layout.addWidget(self.btn_import_nodes)
+        
+        self.btn_template = QPushButton("下载模板")
+        self.btn_template.clicked.connect(self._download_template)
+        import_btn_layout.addWidget(self.btn_template)
+        node_edit_layout.addLayout(import_btn_layout)
+        
         left_layout.addWidget(node_edit_group)
         splitter.addWidget(left_widget)
         
@@ -134,14 +191,12 @@ class PageFTA(QWidget):
         
         right_layout.addWidget(QLabel("<b>FTA边（父子关系）</b>"))
         
-        self.edge_table = QTableWidget()
-        self.edge_table.setColumnCount(3)
-        self.edge_table.setHorizontalHeaderLabels([
-            "ID", "父节点", "子节点"
-        ])
+        self.edge_model = DataclassTableModel([], _EDGE_COLUMNS, self)
+        self.edge_table = QTableView()
+        self.edge_table.setModel(self.edge_model)
         self.edge_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.edge_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.edge_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.edge_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.edge_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         right_layout.addWidget(self.edge_table)
         
         # 边编辑
@@ -188,7 +243,7 @@ class PageFTA(QWidget):
         analysis_layout.addStretch()
         
         self.btn_refresh = QPushButton("刷新")
-        self.btn_refresh.clicked.connect(self.refresh_data)
+        self.btn_refresh.clicked.connect(self.reload_data)
         analysis_layout.addWidget(self.btn_refresh)
         
         layout.addLayout(analysis_layout)
@@ -209,54 +264,78 @@ class PageFTA(QWidget):
             self.gate_type_combo.setEnabled(True)
             self.prob_spin.setEnabled(False)
     
+    def _invalidate_cache(self, mission_id=None):
+        """清除节点/边缓存（mission_id为None时清除全部任务），并标记需要重新显示"""
+        self._dirty = True
+        self._graph_rev += 1
+        self._fta_cache.clear()
+        if mission_id is None:
+            self._node_cache.clear()
+            self._edge_cache.clear()
+        else:
+            self._node_cache.pop(mission_id, None)
+            self._edge_cache.pop(mission_id, None)
+    
+    def showEvent(self, event):
+        """页面显示时加载尚未加载或已失效的数据（由showEvent驱动，导航切换无需再刷新本页）"""
+        super().showEvent(event)
+        if not self._loaded:
+            self.refresh_missions()
+    
+    def reload(self):
+        """外部数据变化时调用：页面可见则立即刷新，否则等下次显示时再加载"""
+        self._loaded = False
+        if self.isVisible():
+            self.refresh_missions()
+    
     def refresh_missions(self):
-        """刷新任务列表"""
-        self.mission_combo.clear()
+        """刷新任务列表（外部数据可能已变化，同时清除缓存）"""
+        self._invalidate_cache()
+        self._loaded = True
         missions = self.mission_dao.get_all()
-        for m in missions:
-            self.mission_combo.addItem(m.name, m.id)
+        # 重建下拉框期间屏蔽信号，填充完成后只刷新一次数据
+        with QSignalBlocker(self.mission_combo):
+            self.mission_combo.clear()
+            for m in missions:
+                self.mission_combo.addItem(m.name, m.id)
         self.refresh_data()
     
     def refresh_data(self):
         """刷新数据"""
         mission_id = self.get_mission_id()
+        if mission_id == self._last_mission_id and not self._dirty:
+            return
+        self._last_mission_id = mission_id
+        self._dirty = False
         if not mission_id:
-            self.node_table.setRowCount(0)
-            self.edge_table.setRowCount(0)
+            self.node_model.clear()
+            self.edge_model.clear()
             return
         
-        # 刷新节点表
-        nodes = self.node_dao.get_by_mission(mission_id)
-        self.node_table.setRowCount(len(nodes))
-        
-        self.parent_combo.clear()
-        self.child_combo.clear()
-        
-        for row, node in enumerate(nodes):
-            self.node_table.setItem(row, 0, QTableWidgetItem(str(node.id)))
-            self.node_table.setItem(row, 1, QTableWidgetItem(node.name))
-            self.node_table.setItem(row, 2, QTableWidgetItem(node.node_type))
-            self.node_table.setItem(row, 3, QTableWidgetItem(node.gate_type or ""))
-            self.node_table.setItem(row, 4, QTableWidgetItem(
-                f"{node.probability:.6f}" if node.probability else ""
-            ))
-            
-            # 填充下拉框
-            self.parent_combo.addItem(f"[{node.id}] {node.name}", node.id)
-            self.child_combo.addItem(f"[{node.id}] {node.name}", node.id)
-        
-        # 刷新边表
-        edges = self.edge_dao.get_edges_by_mission(mission_id)
-        self.edge_table.setRowCount(len(edges))
-        
-        node_dict = {n.id: n.name for n in nodes}
-        
-        for row, edge in enumerate(edges):
-            self.edge_table.setItem(row, 0, QTableWidgetItem(str(edge.id)))
-            parent_name = node_dict.get(edge.parent_id, str(edge.parent_id))
-            child_name = node_dict.get(edge.child_id, str(edge.child_id))
-            self.edge_table.setItem(row, 1, QTableWidgetItem(parent_name))
-            self.edge_table.setItem(row, 2, QTableWidgetItem(child_name))
+        # 刷新节点表（模型只为可见行取数，不再逐单元格创建表格项）
+        nodes = self._node_cache.get(mission_id)
+        if nodes is None:
+            nodes = self._node_cache[mission_id] = self.node_dao.get_by_mission(mission_id)
+        self.node_model.set_rows(nodes)
+        
+        # 填充下拉框（期间屏蔽信号）
+        labels = [f"[{node.id}] {node.name}" for node in nodes]
+        for combo in (self.parent_combo, self.child_combo):
+            with QSignalBlocker(combo):
+                combo.clear()
+                for label, node in zip(labels, nodes):
+                    combo.addItem(label, node.id)
+        
+        # 刷新边表（父/子节点名称已由DAO连接查询得到）
+        edges = self._edge_cache.get(mission_id)
+        if edges is None:
+            edges = self._edge_cache[mission_id] = self.edge_dao.get_edges_with_names(mission_id)
+        self.edge_model.set_rows(edges)
+    
+    def reload_data(self):
+        """丢弃当前任务的缓存并从数据库重新加载"""
+        self._invalidate_cache(self.get_mission_id())
+        self.refresh_data()
     
     def add_node(self):
         """添加节点"""
@@ -274,15 +353,16 @@ class PageFTA(QWidget):
         gate_type = self.gate_type_combo.currentText() or None
         probability = self.prob_spin.value() if node_type == "BASIC" else None
         
-        self.node_dao.insert(
+        self.node_dao.create(FTANode(
             mission_id=mission_id,
             name=name,
             node_type=node_type,
             gate_type=gate_type,
             probability=probability
-        )
+        ))
         
         self.node_name_edit.clear()
+        self._invalidate_cache(mission_id)
         self.refresh_data()
         QMessageBox.information(self, "成功", f"节点 '{name}' 已添加")
     
@@ -293,9 +373,8 @@ class PageFTA(QWidget):
             QMessageBox.warning(self, "警告", "请先选择要删除的节点")
             return
         
-        row = selected_rows[0].row()
-        node_id = int(self.node_table.item(row, 0).text())
-        name = self.node_table.item(row, 1).text()
+        node = self.node_model.row_at(selected_rows[0].row())
+        node_id, name = node.id, node.name
         
         reply = QMessageBox.question(
             self, "确认删除",
@@ -305,6 +384,7 @@ class PageFTA(QWidget):
         
         if reply == QMessageBox.Yes:
             self.node_dao.delete(node_id)
+            self._invalidate_cache(self.get_mission_id())
             self.refresh_data()
     
     def add_edge(self):
@@ -320,7 +400,8 @@ class PageFTA(QWidget):
             QMessageBox.warning(self, "警告", "父节点和子节点不能相同")
             return
         
-        self.edge_dao.insert(parent_id, child_id)
+        self.edge_dao.create(FTAEdge(parent_id=parent_id, child_id=child_id))
+        self._invalidate_cache(self.get_mission_id())
         self.refresh_data()
         QMessageBox.information(self, "成功", "边已添加")
     
@@ -331,84 +412,130 @@ class PageFTA(QWidget):
             QMessageBox.warning(self, "警告", "请先选择要删除的边")
             return
         
-        row = selected_rows[0].row()
-        edge_id = int(self.edge_table.item(row, 0).text())
+        edge_id = self.edge_model.row_at(selected_rows[0].row())[0]
         
         self.edge_dao.delete(edge_id)
+        self._invalidate_cache(self.get_mission_id())
+        self.refresh_data()
+    
+    def _download_template(self):
+        """下载FTA节点导入模板"""
+        filename, _ = QFileDialog.getSaveFileName(
+            self, "保存FTA节点导入模板",
+            os.path.join(os.getcwd(), "FTA节点导入模板.xlsx"),
+            "Excel文件 (*.xlsx)"
+        )
+        if filename:
+            template = ExcelTemplate.get_fta_template()
+            if ExcelTemplate.save_template(template, filename):
+                QMessageBox.information(self, "成功", f"模板已保存到:\n{filename}")
+            else:
+                QMessageBox.warning(self, "错误", "保存模板失败")
+    
+    def _import_nodes(self):
+        """批量导入FTA节点与边（在后台线程中完成解析与入库）"""
+        self._import_runner.start('fta', "选择FTA节点数据文件", "FTA节点", self._on_imported)
+    
+    def _on_imported(self):
+        """导入成功后刷新节点与边"""
+        self._invalidate_cache()
         self.refresh_data()
     
     def run_analysis(self):
         """运行FTA分析"""
+        self._start_fta(sensitivity=False)
+    
+    def run_sensitivity(self):
+        """运行敏感度分析"""
+        self._start_fta(sensitivity=True)
+    
+    def _start_fta(self, sensitivity: bool):
+        """在线程池中启动FTA计算（结果已缓存时直接显示），计算期间禁用分析按钮"""
         mission_id = self.get_mission_id()
         if not mission_id:
             QMessageBox.warning(self, "警告", "请先选择任务")
             return
         
-        result = self.fta_model.run({
-            "mission_id": mission_id,
-            "params": {}
-        })
-        
-        if not result.success:
-            self.result_text.setPlainText(f"分析失败：{result.error_message}")
+        key = (mission_id, self._graph_rev, sensitivity)
+        cached = self._fta_cache.get(key)
+        if cached is not None:
+            self._on_fta_done(sensitivity, cached)
             return
         
-        data = result.data
-        output = []
-        output.append("=" * 50)
-        output.append("FTA分析结果")
-        output.append("=" * 50)
-        
-        if "top_event" in data:
-            te = data["top_event"]
-            output.append(f"顶事件: {te['name']}")
-            output.append(f"  计算概率: {te['probability']:.6e}")
-            output.append(f"  似然度等级: L = {te['likelihood']}")
-            output.append(f"  风险等级: {te['risk_level']}")
-        
-        if "intermediate_gates" in data and data["intermediate_gates"]:
-            output.append("\n中间门概率:")
-            for gate in data["intermediate_gates"]:
-                output.append(f"  {gate['name']} ({gate['gate_type']}): {gate['probability']:.6e}")
-        
-        if "basic_events" in data:
-            output.append(f"\n基本事件数: {len(data['basic_events'])}")
-        
-        self.result_text.setPlainText("\n".join(output))
+        self._fta_pending_key = key
+        params = {"run_sensitivity": True} if sensitivity else {}
+        self.btn_calc.setEnabled(False)
+        self.btn_sensitivity.setEnabled(False)
+        self.result_text.setPlainText("正在计算...")
+        if self.fta_model is None:
+            from ...models.fta import FTAModel
+            self.fta_model = FTAModel()
+        # FTAModel.run 自行捕获异常并返回 success=False 的结果
+        start_pool_task(self._fta_signals, partial(
+            self.fta_model.run, {"mission_id": mission_id, "params": params}
+        ), tag=sensitivity)
     
-    def run_sensitivity(self):
-        """运行敏感度分析"""
-        mission_id = self.get_mission_id()
-        if not mission_id:
-            QMessageBox.warning(self, "警告", "请先选择任务")
-            return
+    def _on_fta_done(self, sensitivity: bool, result):
+        """FTA计算完成：恢复按钮、缓存并显示结果"""
+        self.btn_calc.setEnabled(True)
+        self.btn_sensitivity.setEnabled(True)
         
-        result = self.fta_model.run({
-            "mission_id": mission_id,
-            "params": {"run_sensitivity": True}
-        })
+        # 计算期间节点/边若已变化（图版本不同），结果作废不缓存
+        key, self._fta_pending_key = self._fta_pending_key, None
+        if key is not None and result.success and key[1] == self._graph_rev:
+            self._fta_cache[key] = result
         
         if not result.success:
             self.result_text.setPlainText(f"分析失败：{result.error_message}")
             return
         
-        data = result.data
-        output = []
-        output.append("=" * 50)
-        output.append("FTA敏感度分析结果")
-        output.append("=" * 50)
-        
-        if "sensitivity" in data:
-            sens = data["sensitivity"]
-            if sens.get("factors"):
-                output.append(f"基准顶事件概率: {sens.get('base_prob', 0):.6e}")
-                output.append("\n各基本事件敏感度（按影响排序）:")
-                
-                for factor in sens["factors"][:10]:
-                    output.append(
-                        f"  {factor['name']}: "
-                        f"变化范围 [{factor['prob_minus']:.6e}, {factor['prob_plus']:.6e}], "
-                        f"影响度 {factor['impact']:.4e}"
-                    )
-        
-        self.result_text.setPlainText("\n".join(output))
+        if sensitivity:
+            self._show_sensitivity(result.data)
+        else:
+            self._show_analysis(result.data)
+    
+    def _on_fta_failed(self, sensitivity: bool, error: Exception):
+        """FTA计算异常：恢复按钮并显示错误"""
+        self.btn_calc.setEnabled(True)
+        self.btn_sensitivity.setEnabled(True)
+        self._fta_pending_key = None
+        self.result_text.setPlainText(f"分析失败：{error}")
+    
+    def _show_analysis(self, data: dict):
+        """显示FTA分析结果"""
+        nodes = data["node_results"]
+        gates = "\n".join(
+            f"  {n['name']} ({n['gate_type']}): {_FMT_E6(n['probability'])}"
+            for n in nodes if n["node_type"] == "INTERMEDIATE"
+        )
+        basic_count = sum(1 for n in nodes if n["node_type"] == "BASIC")
+        
+        text = (
+            f"{_ANALYSIS_HEADER}\n"
+            f"顶事件: {data['top_event_name']}\n"
+            f"  计算概率: {data['top_event_probability']:.6e}\n"
+            f"  似然度等级: L = {data['likelihood_level']}\n"
+            f"  风险等级: {data['risk_level']}"
+        )
+        if gates:
+            text += f"\n\n中间门概率:\n{gates}"
+        self.result_text.setPlainText(f"{text}\n\n基本事件数: {basic_count}")
+    
+    def _show_sensitivity(self, data: dict):
+        """显示FTA敏感度分析结果"""
+        factors = data["sensitivity"]
+        if not factors:
+            self.result_text.setPlainText(_SENSITIVITY_HEADER)
+            return
+        
+        body = "\n".join(
+            f"  {f['node_name']}: "
+            f"变化范围 [{_FMT_E6(f['minus_prob'])}, {_FMT_E6(f['plus_prob'])}], "
+            f"影响度 {_FMT_4E(f['impact_score'])}"
+            for f in factors[:10]
+        )
+        self.result_text.setPlainText(
+            f"{_SENSITIVITY_HEADER}\n"
+            f"基准顶事件概率: {data['top_event_probability']:.6e}\n"
+            f"\n各基本事件敏感度（按影响排序）:\n{body}"
+        )
@@ -8,10 +8,40 @@ from PyQt5.QtWidgets import (
     QTextEdit, QMessageBox, QHeaderView, QComboBox, 
     QGroupBox, QListWidget, QListWidgetItem, QSplitter
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QSignalBlocker, QItemSelection, QItemSelectionModel
 import json
 
-from ...db.dao import FusionRuleDAO, IndicatorDAO, MissionDAO
+import numpy as np
+
+from ...db.dao import FusionRuleDAO, IndicatorDAO, IndicatorValueDAO, MissionDAO
+
+
+def _to_float(value) -> float:
+    """指标取值（文本）转为浮点数，缺失或非数值按0处理"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _fuse_values(values: np.ndarray, method: str, weights=None) -> float:
+    """
+    按融合方法计算融合结果（向量化，可在批量/扫描场景中重复调用）
+    
+    Args:
+        values: 输入指标取值（非空float64数组）
+        method: weighted_sum/mean/max/min，未知方法按mean处理
+        weights: 权重（dict按值的顺序或list），仅weighted_sum使用；
+                 为空时按mean处理，数量不足时其余权重取 1/n
+    """
+    if method == "weighted_sum" and isinstance(weights, (dict, list)) and weights:
+        w_list = list(weights.values()) if isinstance(weights, dict) else weights
+        w = np.full(values.size, 1.0 / values.size)
+        given = np.asarray(w_list[:values.size], dtype=np.float64)
+        w[:given.size] = given
+        return float(np.dot(values, w))
+    reducer = {"max": np.max, "min": np.min}.get(method, np.mean)
+    return float(reducer(values))
 
 
 class PageFusion(QWidget):
@@ -22,9 +52,21 @@ class PageFusion(QWidget):
         self._mission_id_getter = mission_id_getter
         self.fusion_dao = FusionRuleDAO()
         self.indicator_dao = IndicatorDAO()
+        self.value_dao = IndicatorValueDAO()
         self.mission_dao = MissionDAO()
+        # 最近一次refresh_data加载的规则（按ID索引），供选中规则时直接查找
+        self._rules_by_id = {}
+        # 各规则解析后的输入指标ID列表（每次刷新只解析一次JSON）
+        self._input_ids_by_id = {}
+        # 指标目录（与任务无关）与按任务缓存的指标取值，重新加载时失效
+        self._indicators = None
+        self._value_cache = {}
+        # 数据延迟到页面首次显示时加载，之后由reload()标记失效
+        self._loaded = False
+        # 当前显示的任务；任务未变且数据未失效时refresh_data直接返回
+        self._last_mission_id = None
+        self._dirty = True
         self.setup_ui()
-        self.refresh_missions()
     
     def get_mission_id(self):
         """获取当前选中的任务ID"""
@@ -141,7 +183,7 @@ class PageFusion(QWidget):
         btn_layout.addStretch()
         
         self.btn_refresh = QPushButton("刷新")
-        self.btn_refresh.clicked.connect(self.refresh_data)
+        self.btn_refresh.clicked.connect(self.reload_data)
         btn_layout.addWidget(self.btn_refresh)
         
         layout.addLayout(btn_layout)
@@ -151,47 +193,87 @@ class PageFusion(QWidget):
         self.result_label.setWordWrap(True)
         layout.addWidget(self.result_label)
     
+    def showEvent(self, event):
+        """页面显示时加载尚未加载或已失效的数据（由showEvent驱动，导航切换无需再刷新本页）"""
+        super().showEvent(event)
+        if not self._loaded:
+            self.refresh_missions()
+    
+    def reload(self):
+        """外部数据变化时调用：页面可见则立即刷新，否则等下次显示时再加载"""
+        self._loaded = False
+        if self.isVisible():
+            self.refresh_missions()
+    
+    def _invalidate_cache(self):
+        """清除指标目录与取值缓存，并标记需要重新显示"""
+        self._indicators = None
+        self._value_cache.clear()
+        self._dirty = True
+    
     def refresh_missions(self):
-        """刷新任务列表"""
-        self.mission_combo.clear()
+        """刷新任务列表（外部数据可能已变化，同时清除缓存）"""
+        self._loaded = True
+        self._invalidate_cache()
         missions = self.mission_dao.get_all()
-        for m in missions:
-            self.mission_combo.addItem(m.name, m.id)
+        # 重建下拉框期间屏蔽信号，填充完成后只刷新一次数据
+        with QSignalBlocker(self.mission_combo):
+            self.mission_combo.clear()
+            for m in missions:
+                self.mission_combo.addItem(m.name, m.id)
         self.refresh_data()
     
     def refresh_data(self):
         """刷新数据"""
         mission_id = self.get_mission_id()
+        if mission_id == self._last_mission_id and not self._dirty:
+            return
+        self._last_mission_id = mission_id
+        self._dirty = False
         if not mission_id:
+            self._rules_by_id = {}
+            self._input_ids_by_id = {}
             self.table.setRowCount(0)
             self.indicator_list.clear()
             return
         
         # 刷新融合规则列表
         rules = self.fusion_dao.get_by_mission(mission_id)
+        self._rules_by_id = {r.id: r for r in rules}
+        self._input_ids_by_id = {}
         self.table.setRowCount(len(rules))
         
         for row, rule in enumerate(rules):
-            self.table.setItem(row, 0, QTableWidgetItem(str(rule.id)))
+            id_item = QTableWidgetItem(str(rule.id))
+            id_item.setData(Qt.UserRole, rule.id)
+            self.table.setItem(row, 0, id_item)
             self.table.setItem(row, 1, QTableWidgetItem(rule.output_indicator_name))
             self.table.setItem(row, 2, QTableWidgetItem(rule.method))
             
-            # 计算输入指标数量
+            # 解析输入指标ID（缓存供选中规则时使用）并显示数量
             try:
                 input_ids = json.loads(rule.input_indicator_ids)
-                count = len(input_ids) if isinstance(input_ids, list) else 0
-            except:
-                count = 0
-            self.table.setItem(row, 3, QTableWidgetItem(str(count)))
-        
-        # 刷新可用指标列表
+                if not isinstance(input_ids, list):
+                    input_ids = []
+            except (ValueError, TypeError):
+                input_ids = []
+            self._input_ids_by_id[rule.id] = input_ids
+            self.table.setItem(row, 3, QTableWidgetItem(str(len(input_ids))))
+        
+        # 刷新可用指标列表（指标目录在各任务间共用，只在重新加载时查询）
+        if self._indicators is None:
+            self._indicators = self.indicator_dao.get_all()
         self.indicator_list.clear()
-        indicators = self.indicator_dao.get_all()
-        for ind in indicators:
+        for ind in self._indicators:
             item = QListWidgetItem(f"[{ind.id}] {ind.name}")
             item.setData(Qt.UserRole, ind.id)
             self.indicator_list.addItem(item)
     
+    def reload_data(self):
+        """从数据库重新加载当前任务的数据"""
+        self._invalidate_cache()
+        self.refresh_data()
+    
     def on_rule_selected(self):
         """规则选中时填充编辑区"""
         selected_rows = self.table.selectionModel().selectedRows()
@@ -199,11 +281,9 @@ class PageFusion(QWidget):
             return
         
         row = selected_rows[0].row()
-        rule_id = int(self.table.item(row, 0).text())
+        rule_id = self.table.item(row, 0).data(Qt.UserRole)
         
-        mission_id = self.get_mission_id()
-        rules = self.fusion_dao.get_by_mission(mission_id)
-        rule = next((r for r in rules if r.id == rule_id), None)
+        rule = self._rules_by_id.get(rule_id)
         
         if not rule:
             return
@@ -214,16 +294,15 @@ class PageFusion(QWidget):
         if idx >= 0:
             self.method_combo.setCurrentIndex(idx)
         
-        # 选中输入指标
-        try:
-            input_ids = json.loads(rule.input_indicator_ids)
-            if isinstance(input_ids, list):
-                for i in range(self.indicator_list.count()):
-                    item = self.indicator_list.item(i)
-                    ind_id = item.data(Qt.UserRole)
-                    item.setSelected(ind_id in input_ids)
-        except:
-            pass
+        # 选中输入指标：先收集为一个选区，再一次性替换当前选择（只触发一次选择变化）
+        id_set = set(self._input_ids_by_id.get(rule_id, []))
+        model = self.indicator_list.model()
+        selection = QItemSelection()
+        for i in range(self.indicator_list.count()):
+            if self.indicator_list.item(i).data(Qt.UserRole) in id_set:
+                index = model.index(i, 0)
+                selection.select(index, index)
+        self.indicator_list.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect)
         
         if rule.weights_json:
             self.weights_edit.setText(rule.weights_json)
@@ -258,7 +337,7 @@ class PageFusion(QWidget):
         if weights_json:
             try:
                 json.loads(weights_json)
-            except:
+            except ValueError:
                 QMessageBox.warning(self, "警告", "权重JSON格式无效")
                 return
         
@@ -273,6 +352,7 @@ class PageFusion(QWidget):
         self.fusion_dao.create(rule)
         
         self.clear_inputs()
+        self._dirty = True
         self.refresh_data()
         QMessageBox.information(self, "成功", f"融合规则 '{output_name}' 已添加")
     
@@ -284,7 +364,7 @@ class PageFusion(QWidget):
             return
         
         row = selected_rows[0].row()
-        rule_id = int(self.table.item(row, 0).text())
+        rule_id = self.table.item(row, 0).data(Qt.UserRole)
         name = self.table.item(row, 1).text()
         
         reply = QMessageBox.question(
@@ -296,6 +376,7 @@ class PageFusion(QWidget):
         if reply == QMessageBox.Yes:
             self.fusion_dao.delete(rule_id)
             self.clear_inputs()
+            self._dirty = True
             self.refresh_data()
     
     def test_fusion(self):
@@ -312,16 +393,20 @@ class PageFusion(QWidget):
         
         method = self.method_combo.currentText()
         
-        # 获取选中指标的值
+        # 获取选中指标在当前任务下的取值（按列表顺序，与权重顺序对应）
+        selected_items.sort(key=self.indicator_list.row)
         input_ids = [item.data(Qt.UserRole) for item in selected_items]
-        indicators = self.indicator_dao.get_all()
-        values = []
-        
-        for ind in indicators:
-            if ind.id in input_ids:
-                values.append(ind.value if ind.value else 0)
+        value_by_id = self._value_cache.get(mission_id)
+        if value_by_id is None:
+            value_by_id = self._value_cache[mission_id] = {
+                v.indicator_id: v.value for v in self.value_dao.get_by_mission(mission_id)
+            }
+        values = np.fromiter(
+            (_to_float(value_by_id.get(i)) for i in input_ids),
+            dtype=np.float64, count=len(input_ids)
+        )
         
-        if not values:
+        if not values.size:
             self.result_label.setText("无可用数据")
             return
         
@@ -331,29 +416,14 @@ class PageFusion(QWidget):
         if weights_text:
             try:
                 weights = json.loads(weights_text)
-            except:
+            except ValueError:
                 pass
         
-        if method == "mean":
-            result = sum(values) / len(values)
-        elif method == "max":
-            result = max(values)
-        elif method == "min":
-            result = min(values)
-        elif method == "weighted_sum" and weights:
-            # 简化：按顺序应用权重
-            w_list = list(weights.values())
-            total = 0
-            for i, v in enumerate(values):
-                w = w_list[i] if i < len(w_list) else 1.0 / len(values)
-                total += v * w
-            result = total
-        else:
-            result = sum(values) / len(values)
+        result = _fuse_values(values, method, weights)
         
         self.result_label.setText(
             f"<b>测试结果:</b><br>"
-            f"输入值: {values}<br>"
+            f"输入值: {values.tolist()}<br>"
             f"融合方法: {method}<br>"
             f"融合结果: <span style='color:blue;font-size:16px;'>{result:.4f}</span>"
         )
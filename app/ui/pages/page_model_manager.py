@@ -6,14 +6,75 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QComboBox, QGroupBox, QTextEdit, QScrollArea,
     QSpinBox, QDoubleSpinBox, QCheckBox, QLineEdit,
-    QFormLayout, QMessageBox, QTabWidget, QTableWidget,
-    QTableWidgetItem, QHeaderView
+    QFormLayout, QMessageBox, QTabWidget, QTableView,
+    QAbstractItemView, QHeaderView
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QSignalBlocker
+from datetime import datetime
 import json
+import traceback
+
+try:
+    import orjson
+except ImportError:  # 可选依赖，未安装时使用标准库json
+    orjson = None
 
 from ...models.base import ModelRegistry, ParamType
-from ...db.dao import ModelConfigDAO, MissionDAO
+from ...db.dao import ModelConfig, ModelConfigDAO, MissionDAO
+from ..widgets.table_view import DataclassTableModel, TableColumn
+from ..widgets.pool_task import PoolTaskSignals, start_pool_task
+
+
+# 模型信息表：行为 registry.list_models() 的 (model_id, info) 项
+_MODEL_COLUMNS = (
+    TableColumn("模型ID", lambda m: m[0]),
+    TableColumn("名称", lambda m: m[1]["name"]),
+    TableColumn("类别", lambda m: m[1].get("category", "")),
+    TableColumn("描述", lambda m: m[1].get("description", "")),
+)
+
+def _to_json(data, indent: bool = False) -> str:
+    """
+    序列化为JSON文本（中文不转义，无法序列化的对象转为str）
+    
+    安装了orjson时使用orjson；dataclass同样按str输出，与标准库json的结果保持一致。
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option).decode()
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False, default=str)
+
+
+def _format_result(result) -> str:
+    """把ModelResult格式化为结果文本"""
+    if not result.success:
+        return f"运行失败:\n{result.error_message}"
+    
+    output = []
+    output.append(f"模型: {result.model_name}")
+    output.append(f"状态: 成功")
+    output.append("=" * 50)
+    output.append("结果数据:")
+    output.append(_to_json(result.data, indent=True))
+    
+    # 安全地处理recommendations属性
+    if hasattr(result, 'recommendations') and result.recommendations:
+        output.append("\n建议:")
+        for rec in result.recommendations:
+            output.append(f"  • {rec}")
+    
+    return "\n".join(output)
+
+
+# 配置表：行为ModelConfig
+_CONFIG_COLUMNS = (
+    TableColumn("ID", "id"),
+    TableColumn("模型", "model_id"),
+    TableColumn("参数", lambda c: c.params_json or ""),
+    TableColumn("更新时间", lambda c: c.updated_at or ""),
+)
 
 
 class PageModelManager(QWidget):
@@ -27,9 +88,22 @@ class PageModelManager(QWidget):
         self.registry = ModelRegistry()
         self.param_widgets = {}  # 存储参数控件
         self.current_model = None
+        # 已注册模型在进程内基本不变，只在注册表变化时重建模型列表
+        self._models_cache = None
+        self._model_combo_index = {}  # model_id -> model_combo中的索引
+        self._widget_pool = {}  # (参数类型, 参数名) -> 参数控件，切换模型时复用
+        # 后台模型运行
+        self._run_signals = PoolTaskSignals(self)
+        self._run_signals.done.connect(self._on_model_done, Qt.QueuedConnection)
+        self._run_signals.failed.connect(self._on_model_failed, Qt.QueuedConnection)
         self.setup_ui()
         self.refresh_missions()
     
+    def showEvent(self, event):
+        """页面显示时刷新模型列表（首次显示时才加载模型实现，不占用启动时间）"""
+        super().showEvent(event)
+        self.refresh_models()
+    
     def get_mission_id(self):
         """获取当前选中的任务ID"""
         if self.mission_combo.currentData() is not None:
@@ -125,12 +199,12 @@ class PageModelManager(QWidget):
         
         info_layout.addWidget(QLabel("<b>已注册模型列表:</b>"))
         
-        self.model_table = QTableWidget()
-        self.model_table.setColumnCount(4)
-        self.model_table.setHorizontalHeaderLabels([
-            "模型ID", "名称", "类别", "描述"
-        ])
+        self.model_info_model = DataclassTableModel([], _MODEL_COLUMNS, self)
+        self.model_table = QTableView()
+        self.model_table.setModel(self.model_info_model)
         self.model_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.model_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.model_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         info_layout.addWidget(self.model_table)
         
         tabs.addTab(info_tab, "模型信息")
@@ -141,12 +215,12 @@ class PageModelManager(QWidget):
         
         history_layout.addWidget(QLabel("<b>保存的模型配置:</b>"))
         
-        self.config_table = QTableWidget()
-        self.config_table.setColumnCount(4)
-        self.config_table.setHorizontalHeaderLabels([
-            "ID", "模型", "配置名称", "创建时间"
-        ])
+        self.config_model = DataclassTableModel([], _CONFIG_COLUMNS, self)
+        self.config_table = QTableView()
+        self.config_table.setModel(self.config_model)
         self.config_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.config_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.config_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         history_layout.addWidget(self.config_table)
         
         history_btn_layout = QHBoxLayout()
@@ -167,44 +241,40 @@ class PageModelManager(QWidget):
     
     def refresh_missions(self):
         """刷新任务列表"""
-        self.mission_combo.clear()
         missions = self.mission_dao.get_all()
-        for m in missions:
-            self.mission_combo.addItem(m.name, m.id)
-        self.refresh_models()
+        # 重建下拉框期间屏蔽信号，填充完成后只刷新一次配置列表
+        with QSignalBlocker(self.mission_combo):
+            self.mission_combo.clear()
+            for m in missions:
+                self.mission_combo.addItem(m.name, m.id)
+        self.refresh_configs()
     
     def refresh_models(self):
-        """刷新模型列表"""
-        self.model_combo.clear()
-        models = self.registry.list_models()
-        
-        self.model_table.setRowCount(len(models))
-        
-        for row, (model_id, info) in enumerate(models.items()):
-            self.model_combo.addItem(f"{info['name']} ({model_id})", model_id)
-            
-            self.model_table.setItem(row, 0, QTableWidgetItem(model_id))
-            self.model_table.setItem(row, 1, QTableWidgetItem(info["name"]))
-            self.model_table.setItem(row, 2, QTableWidgetItem(info.get("category", "")))
-            self.model_table.setItem(row, 3, QTableWidgetItem(info.get("description", "")))
+        """刷新模型列表（注册的模型未变化时直接返回）"""
+        if (self._models_cache is not None
+                and list(self._models_cache) == self.registry.get_model_ids()):
+            return
         
-        self.refresh_configs()
+        models = self.registry.list_models()
+        self._models_cache = models
+        
+        # 填充期间屏蔽信号，完成后只为当前模型构建一次参数面板
+        with QSignalBlocker(self.model_combo):
+            self.model_combo.clear()
+            for model_id, info in models.items():
+                self.model_combo.addItem(f"{info['name']} ({model_id})", model_id)
+        self.model_info_model.set_rows(models.items())
+        self._model_combo_index = {mid: i for i, mid in enumerate(models)}
+        self.on_model_selected(self.model_combo.currentText())
     
     def refresh_configs(self):
         """刷新配置列表"""
         mission_id = self.get_mission_id()
         if not mission_id:
-            self.config_table.setRowCount(0)
+            self.config_model.clear()
             return
         
-        configs = self.config_dao.get_all()
-        self.config_table.setRowCount(len(configs))
-        
-        for row, config in enumerate(configs):
-            self.config_table.setItem(row, 0, QTableWidgetItem(str(config.id)))
-            self.config_table.setItem(row, 1, QTableWidgetItem(config.model_id))
-            self.config_table.setItem(row, 2, QTableWidgetItem(config.config_name or ""))
-            self.config_table.setItem(row, 3, QTableWidgetItem(config.created_at or ""))
+        self.config_model.set_rows(self.config_dao.get_all())
     
     def on_model_selected(self, text: str):
         """模型选择变化时"""
@@ -231,12 +301,14 @@ class PageModelManager(QWidget):
         self.build_param_panel()
     
     def build_param_panel(self):
-        """构建动态参数面板"""
-        # 清空现有控件
-        while self.param_layout.count():
-            item = self.param_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        """构建动态参数面板（按 (参数类型, 参数名) 复用已创建的控件）"""
+        # 移出现有行：标签删除，参数控件隐藏后留在控件池中
+        while self.param_layout.rowCount():
+            row = self.param_layout.takeRow(0)
+            if row.labelItem is not None and row.labelItem.widget():
+                row.labelItem.widget().deleteLater()
+            if row.fieldItem is not None and row.fieldItem.widget():
+                row.fieldItem.widget().hide()
         
         self.param_widgets.clear()
         
@@ -247,7 +319,14 @@ class PageModelManager(QWidget):
         params = self.current_model.param_schema()
         
         for spec in params:
-            widget = self.create_param_widget(spec)
+            key = (spec.param_type, spec.name)
+            widget = self._widget_pool.get(key)
+            if widget is None:
+                widget = self.create_param_widget(spec)
+                self._widget_pool[key] = widget
+            else:
+                self.apply_param_spec(widget, spec)
+                widget.show()
             self.param_widgets[spec.name] = widget
             self.param_layout.addRow(f"{spec.label}:", widget)
     
@@ -255,48 +334,42 @@ class PageModelManager(QWidget):
         """根据参数规格创建控件"""
         if spec.param_type == ParamType.INT:
             widget = QSpinBox()
-            widget.setRange(
-                spec.min_value if spec.min_value is not None else -999999,
-                spec.max_value if spec.max_value is not None else 999999
-            )
-            widget.setValue(spec.default if spec.default is not None else 0)
-            widget.setToolTip(spec.description or "")
-            return widget
-        
         elif spec.param_type == ParamType.FLOAT:
             widget = QDoubleSpinBox()
+            widget.setDecimals(4)
+        elif spec.param_type == ParamType.BOOL:
+            widget = QCheckBox()
+        elif spec.param_type == ParamType.ENUM:
+            widget = QComboBox()
+        else:  # STRING
+            widget = QLineEdit()
+        self.apply_param_spec(widget, spec)
+        return widget
+    
+    def apply_param_spec(self, widget, spec):
+        """按参数规格设置控件的范围、选项、默认值与提示（新建与复用的控件共用）"""
+        if spec.param_type in (ParamType.INT, ParamType.FLOAT):
             widget.setRange(
                 spec.min_value if spec.min_value is not None else -999999,
                 spec.max_value if spec.max_value is not None else 999999
             )
-            widget.setDecimals(4)
-            widget.setValue(spec.default if spec.default is not None else 0.0)
-            widget.setToolTip(spec.description or "")
-            return widget
+            widget.setValue(spec.default if spec.default is not None else 0)
         
         elif spec.param_type == ParamType.BOOL:
-            widget = QCheckBox()
             widget.setChecked(spec.default if spec.default is not None else False)
-            widget.setToolTip(spec.description or "")
-            return widget
         
-        elif spec.param_type == ParamType.CHOICE:
-            widget = QComboBox()
-            if spec.choices:
-                widget.addItems(spec.choices)
-            if spec.default:
-                idx = widget.findText(spec.default)
-                if idx >= 0:
-                    widget.setCurrentIndex(idx)
-            widget.setToolTip(spec.description or "")
-            return widget
+        elif spec.param_type == ParamType.ENUM:
+            items = [widget.itemText(i) for i in range(widget.count())]
+            if items != spec.enum_values:
+                widget.clear()
+                widget.addItems(spec.enum_values)
+            if spec.default in spec.enum_values:
+                widget.setCurrentIndex(spec.enum_values.index(spec.default))
         
         else:  # STRING
-            widget = QLineEdit()
-            if spec.default:
-                widget.setText(str(spec.default))
-            widget.setToolTip(spec.description or "")
-            return widget
+            widget.setText(str(spec.default) if spec.default else "")
+        
+        widget.setToolTip(spec.description or "")
     
     def get_current_params(self) -> dict:
         """获取当前参数值"""
@@ -316,7 +389,7 @@ class PageModelManager(QWidget):
                 params[spec.name] = widget.value()
             elif spec.param_type == ParamType.BOOL:
                 params[spec.name] = widget.isChecked()
-            elif spec.param_type == ParamType.CHOICE:
+            elif spec.param_type == ParamType.ENUM:
                 params[spec.name] = widget.currentText()
             else:
                 params[spec.name] = widget.text()
@@ -344,7 +417,7 @@ class PageModelManager(QWidget):
                 widget.setValue(float(value))
             elif spec.param_type == ParamType.BOOL:
                 widget.setChecked(bool(value))
-            elif spec.param_type == ParamType.CHOICE:
+            elif spec.param_type == ParamType.ENUM:
                 idx = widget.findText(str(value))
                 if idx >= 0:
                     widget.setCurrentIndex(idx)
@@ -364,38 +437,27 @@ class PageModelManager(QWidget):
         
         params = self.get_current_params()
         
+        self.btn_run.setEnabled(False)
         self.result_text.setPlainText("正在运行...")
         
-        # 运行模型
+        # 在线程池中运行模型，运行期间禁用运行按钮
         context = {
             "mission_id": mission_id,
             "params": params
         }
-        
-        try:
-            result = self.current_model.run(context)
-            
-            if result.success:
-                output = []
-                output.append(f"模型: {result.model_name}")
-                output.append(f"状态: 成功")
-                output.append("=" * 50)
-                output.append("结果数据:")
-                output.append(json.dumps(result.data, indent=2, ensure_ascii=False, default=str))
-                
-                # 安全地处理recommendations属性
-                if hasattr(result, 'recommendations') and result.recommendations:
-                    output.append("\n建议:")
-                    for rec in result.recommendations:
-                        output.append(f"  • {rec}")
-                
-                self.result_text.setPlainText("\n".join(output))
-            else:
-                self.result_text.setPlainText(f"运行失败:\n{result.error_message}")
-        
-        except Exception as e:
-            import traceback
-            self.result_text.setPlainText(f"运行异常:\n{str(e)}\n{traceback.format_exc()}")
+        model = self.current_model
+        start_pool_task(self._run_signals, lambda: _format_result(model.run(context)))
+    
+    def _on_model_done(self, _tag, text: str):
+        """模型运行完成：恢复按钮并显示结果"""
+        self.btn_run.setEnabled(True)
+        self.result_text.setPlainText(text)
+    
+    def _on_model_failed(self, _tag, error: Exception):
+        """模型运行异常：恢复按钮并显示异常信息"""
+        self.btn_run.setEnabled(True)
+        tb = "".join(traceback.format_exception(type(error), error, error.__traceback__))
+        self.result_text.setPlainText(f"运行异常:\n{str(error)}\n{tb}")
     
     def save_config(self):
         """保存当前配置"""
@@ -409,17 +471,14 @@ class PageModelManager(QWidget):
             return
         
         params = self.get_current_params()
-        params_json = json.dumps(params, ensure_ascii=False)
+        params_json = _to_json(params)
         
-        # 使用模型名称作为配置名
-        config_name = f"{self.current_model.model_name}_config"
-        
-        self.config_dao.insert(
-            mission_id=mission_id,
+        # 每个模型保存一份配置（model_id唯一），已存在时覆盖
+        self.config_dao.upsert(ModelConfig(
             model_id=self.current_model.model_id,
-            config_name=config_name,
-            params_json=params_json
-        )
+            params_json=params_json,
+            updated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        ))
         
         self.refresh_configs()
         QMessageBox.information(self, "成功", "配置已保存")
@@ -431,24 +490,20 @@ class PageModelManager(QWidget):
             QMessageBox.warning(self, "警告", "请先在历史配置中选择一个配置")
             return
         
-        row = selected_rows[0].row()
-        config_id = int(self.config_table.item(row, 0).text())
-        model_id = self.config_table.item(row, 1).text()
+        selected = self.config_model.row_at(selected_rows[0].row())
+        config_id, model_id = selected.id, selected.model_id
         
-        # 获取配置
-        mission_id = self.get_mission_id()
-        configs = self.config_dao.get_all()
-        config = next((c for c in configs if c.id == config_id), None)
+        # 按主键获取配置
+        config = self.config_dao.get_by_id(config_id)
         
         if not config:
             QMessageBox.warning(self, "警告", "配置不存在")
             return
         
         # 切换到对应模型
-        for i in range(self.model_combo.count()):
-            if self.model_combo.itemData(i) == model_id:
-                self.model_combo.setCurrentIndex(i)
-                break
+        idx = self._model_combo_index.get(model_id)
+        if idx is not None:
+            self.model_combo.setCurrentIndex(idx)
         
         # 加载参数
         if config.params_json:
@@ -466,8 +521,7 @@ class PageModelManager(QWidget):
             QMessageBox.warning(self, "警告", "请先选择要删除的配置")
             return
         
-        row = selected_rows[0].row()
-        config_id = int(self.config_table.item(row, 0).text())
+        config_id = self.config_model.row_at(selected_rows[0].row()).id
         
         reply = QMessageBox.question(
             self, "确认删除",
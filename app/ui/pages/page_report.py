@@ -9,15 +9,30 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, QUrl
 from PyQt5.QtGui import QDesktopServices
+from functools import lru_cache
 from typing import Optional
 import json
 import os
+import shutil
 from pathlib import Path
 
 from ...db.dao import Mission, MissionDAO, ResultSnapshot, ResultSnapshotDAO
 from ...reports.report_builder import ReportBuilder
 
 
+@lru_cache(maxsize=32)
+def _parse_result_json(snapshot_id: int, result_json: str) -> dict:
+    """
+    解析快照的结果JSON（带缓存，来回切换快照时不再重复解析）
+    
+    返回的字典为多次调用共享，调用方只读不改。解析失败时返回空字典。
+    """
+    try:
+        return json.loads(result_json)
+    except (TypeError, ValueError):
+        return {}
+
+
 class ReportPage(QWidget):
     """报告导出页面"""
     
@@ -222,10 +237,7 @@ class ReportPage(QWidget):
             return
         
         # 解析JSON
-        try:
-            result_data = json.loads(self.current_snapshot.result_json)
-        except:
-            result_data = {}
+        result_data = _parse_result_json(self.current_snapshot.id, self.current_snapshot.result_json)
         
         # 显示基本信息
         info_items = [
@@ -283,10 +295,13 @@ class ReportPage(QWidget):
                 mission
             )
             
-            # 显示预览
-            with open(self.report_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            self.preview_browser.setHtml(html_content)
+            # 显示预览：直接从文件加载（相对路径的资源按报告所在目录解析）；
+            # 同一快照重新生成时路径不变，setSource不会重新读取，需显式reload
+            url = QUrl.fromLocalFile(self.report_path)
+            if self.preview_browser.source() == url:
+                self.preview_browser.reload()
+            else:
+                self.preview_browser.setSource(url)
             
             self.btn_open.setEnabled(True)
             self.btn_save_as.setEnabled(True)
@@ -319,10 +334,7 @@ class ReportPage(QWidget):
         
         if file_path:
             try:
-                with open(self.report_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                shutil.copyfile(self.report_path, file_path)
                 QMessageBox.information(self, "成功", f"报告已保存到：{file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "错误", f"保存失败：{str(e)}")
@@ -0,0 +1,191 @@
+"""
+后台数据导入
+Background Excel/CSV Import - 各页面共用的导入线程、进度对话框与结果汇总
+"""
+from PyQt5.QtWidgets import QWidget, QMessageBox, QFileDialog, QProgressDialog
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QThread
+from typing import Callable, Iterator, List, Optional
+import os
+
+from ...db import get_db
+from ...utils.excel_import import ExcelImporter, DataBatchImporter, DB_CHUNK_ROWS
+
+
+class ImportWorker(QThread):
+    """数据导入工作线程 - 在后台完成文件解析和数据库写入"""
+
+    # 解析方法名, 入库方法名（iter_* 解析方法逐块产出已校验的行，边解析边入库）
+    STEPS = {
+        'missions': ('import_missions', 'batch_import_missions'),
+        'categories': ('import_indicator_categories', 'batch_import_indicator_categories'),
+        'indicators': ('import_indicators', 'batch_import_indicators'),
+        'risk_events': ('import_risk_events', 'batch_import_risk_events'),
+        'fmea': ('iter_fmea_items', 'batch_import_fmea_items'),
+        'fta': ('import_fta_nodes', 'batch_import_fta_nodes'),
+    }
+
+    # 整体一次入库的类型：FTA节点按名称解析父节点，父节点可能位于文件中任意位置
+    WHOLE_BATCH = {'fta'}
+
+    progress = pyqtSignal(int, int)               # (当前行数, 总行数)
+    done = pyqtSignal(str, int, int, list, list)  # (类型, 成功数, 解析数, 解析错误, 数据库错误)
+    error = pyqtSignal(str)
+
+    def __init__(self, kind: str, filepaths: List[str]):
+        super().__init__()
+        self.kind = kind
+        self.filepaths = filepaths
+
+    def _parse_chunks(self, importer: ExcelImporter, parse_name: str,
+                      filepath: str) -> Iterator[list]:
+        """逐块产出一个文件中已校验的行；非 iter_* 的解析方法整体作为一块"""
+        parse = getattr(importer, parse_name)
+        if parse_name.startswith('iter_'):
+            yield from parse(filepath, progress_cb=self.progress.emit)
+        else:
+            rows, _ = parse(filepath, progress_cb=self.progress.emit)
+            yield rows
+
+    def run(self):
+        n_parsed, success_count = 0, 0
+        errors, db_errors = [], []
+        try:
+            parse_name, import_name = self.STEPS[self.kind]
+            importer = ExcelImporter()
+            batch_import = getattr(DataBatchImporter(), import_name)
+            batch_rows = DB_CHUNK_ROWS if self.kind not in self.WHOLE_BATCH else None
+            db = get_db()
+
+            # 每解析出一块即写入数据库，只累计计数与错误信息，不保留已入库的行；
+            # 每 DB_CHUNK_ROWS 条一个事务，写锁只在批内持有，其他线程的写入不必等到导入结束
+            multi = len(self.filepaths) > 1
+            for filepath in self.filepaths:
+                for rows in self._parse_chunks(importer, parse_name, filepath):
+                    step = batch_rows or len(rows)
+                    for start in range(0, len(rows), step):
+                        batch = rows[start:start + step]
+                        offset = n_parsed
+                        n_parsed += len(batch)
+                        with db.transaction():
+                            count, batch_errors = batch_import(
+                                batch, progress_cb=lambda cur, total: self.progress.emit(
+                                    offset + cur, offset + total))
+                        success_count += count
+                        db_errors.extend(batch_errors)
+
+                file_errors = importer.errors
+                if multi:
+                    name = os.path.basename(filepath)
+                    file_errors = [f"[{name}] {e}" for e in file_errors]
+                errors.extend(file_errors)
+
+            self.done.emit(self.kind, success_count, n_parsed, errors, db_errors)
+        except Exception as e:
+            if success_count:
+                # 此前的批次已提交，仍汇报结果以便页面刷新
+                db_errors.append(f"导入中断: {str(e)}")
+                self.done.emit(self.kind, success_count, n_parsed, errors, db_errors)
+            else:
+                self.error.emit(str(e))
+
+
+class ImportRunner(QObject):
+    """
+    页面侧的导入流程：选择文件、显示进度、启动ImportWorker并汇总结果
+
+    同一时间只运行一个导入任务（各页面共用），导入成功后调用页面传入的刷新回调。
+    """
+
+    _active_worker: Optional[ImportWorker] = None
+
+    def __init__(self, parent: QWidget):
+        super().__init__(parent)
+        self._parent = parent
+        self._progress: Optional[QProgressDialog] = None
+        self._label = ""
+        self._db_label = ""
+        self._on_imported: Optional[Callable[[], None]] = None
+
+    def start(self, kind: str, title: str, label: str,
+              on_imported: Callable[[], None], db_label: str = "数据库错误"):
+        """
+        选择文件（可多选）并在后台线程中执行解析与入库
+
+        Args:
+            kind: ImportWorker.STEPS 中的导入类型
+            title: 文件选择对话框标题
+            label: 结果中的数据名称（如"FMEA记录"）
+            on_imported: 至少成功导入一条时调用的刷新回调
+            db_label: 数据库错误一栏的标题
+        """
+        worker = ImportRunner._active_worker
+        if worker is not None and worker.isRunning():
+            QMessageBox.warning(self._parent, "警告", "已有导入任务正在进行，请稍候")
+            return
+
+        filenames, _ = QFileDialog.getOpenFileNames(
+            self._parent, title, os.getcwd(),
+            "Excel/CSV文件 (*.xlsx *.xls *.csv)"
+        )
+        if not filenames:
+            return
+
+        self._label = label
+        self._db_label = db_label
+        self._on_imported = on_imported
+
+        self._progress = QProgressDialog(f"正在导入{label}...", None, 0, 0, self._parent)
+        self._progress.setWindowTitle("导入中")
+        self._progress.setWindowModality(Qt.WindowModal)
+        self._progress.setMinimumDuration(300)
+
+        worker = ImportWorker(kind, filenames)
+        worker.progress.connect(self._on_progress)
+        worker.done.connect(self._on_done)
+        worker.error.connect(self._on_error)
+        ImportRunner._active_worker = worker
+        worker.start()
+
+    def _on_progress(self, current: int, total: int):
+        """导入进度更新"""
+        if self._progress is not None:
+            self._progress.setMaximum(total)
+            self._progress.setValue(current)
+
+    def _close_progress(self):
+        if self._progress is not None:
+            self._progress.close()
+            self._progress = None
+
+    def _on_done(self, kind: str, success_count: int, total: int,
+                 errors: list, db_errors: list):
+        """导入完成：刷新页面并显示结果"""
+        self._close_progress()
+
+        # 解析与入库结果合并为一个对话框，图标按最严重的情况选择
+        if total == 0 and errors:
+            msg = "文件解析失败:\n" + "\n".join(errors[:5])
+        else:
+            msg = f"成功导入 {success_count}/{total} 条{self._label}"
+            if errors:
+                msg += f"\n\n解析警告 ({len(errors)}):\n" + "\n".join(errors[:3])
+            if db_errors:
+                msg += f"\n\n{self._db_label} ({len(db_errors)}):\n" + "\n".join(db_errors[:3])
+
+        if success_count == 0:
+            icon = QMessageBox.Critical
+        elif errors or db_errors:
+            icon = QMessageBox.Warning
+        else:
+            icon = QMessageBox.Information
+
+        if success_count > 0 and self._on_imported is not None:
+            self._on_imported()
+
+        box = QMessageBox(icon, "导入结果", msg, parent=self._parent)
+        box.exec_()
+
+    def _on_error(self, message: str):
+        """导入线程异常"""
+        self._close_progress()
+        QMessageBox.critical(self._parent, "错误", f"导入过程出错:\n{message}")
@@ -5,11 +5,12 @@ Matplotlib Widget for PyQt5 Integration
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 import matplotlib
 import numpy as np
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 
 # 设置中文字体 - 优化配置避免标题显示问题
 matplotlib.rcParams['font.sans-serif'] = ['Microsoft YaHei', 'SimHei', 'STSong', 'Arial Unicode MS', 'DejaVu Sans']
@@ -40,6 +41,13 @@ class MatplotlibWidget(QWidget):
         
         # 窗口resize时标记需要重绘
         self._need_redraw = False
+        # 是否已绘制过有效数据（未绘制的图表无需重绘或保存）
+        self._has_data = False
+    
+    @property
+    def has_data(self) -> bool:
+        """图表是否包含有效数据"""
+        return self._has_data
     
     def resizeEvent(self, event):
         """窗口大小变化时的处理"""
@@ -50,13 +58,14 @@ class MatplotlibWidget(QWidget):
     def showEvent(self, event):
         """窗口显示时的处理"""
         super().showEvent(event)
-        if self._need_redraw:
-            self.canvas.draw()
+        if self._need_redraw and self._has_data:
+            self.canvas.draw_idle()
             self._need_redraw = False
     
     def clear(self):
         """清空图表"""
         self.figure.clear()
+        self._has_data = False
         self.canvas.draw()
     
     def draw(self):
@@ -156,6 +165,7 @@ class RiskMatrixChart(MatplotlibWidget):
         ax.legend(handles=legend_elements, loc='upper left', 
                  bbox_to_anchor=(1.02, 1), fontsize=9)
         
+        self._has_data = True
         self.draw()
 
 
@@ -217,6 +227,7 @@ class TopNBarChart(MatplotlibWidget):
         ax.invert_yaxis()  # 最高分在顶部
         ax.set_xlim(0, max(values) * 1.15 if values else 10)
         
+        self._has_data = bool(values)
         self.draw()
 
 
@@ -262,6 +273,7 @@ class SensitivityBarChart(MatplotlibWidget):
         ax.invert_yaxis()
         ax.set_xlim(0, max(impact_scores) * 1.15 if impact_scores else 10)
         
+        self._has_data = bool(factor_names)
         self.draw()
 
 
@@ -271,7 +283,7 @@ class HistogramChart(MatplotlibWidget):
     def __init__(self, parent=None):
         super().__init__(parent, width=7, height=5)
     
-    def plot_histogram(self, data: List[float], 
+    def plot_histogram(self, data: Union[np.ndarray, List[float]], 
                        title: str = "分布直方图",
                        xlabel: str = "值",
                        ylabel: str = "频次",
@@ -281,7 +293,7 @@ class HistogramChart(MatplotlibWidget):
         绘制直方图
         
         Args:
-            data: 数据列表
+            data: 原始样本（NumPy数组或列表），由ax.hist一次分箱
             title: 图表标题
             xlabel: X轴标签
             ylabel: Y轴标签
@@ -291,13 +303,13 @@ class HistogramChart(MatplotlibWidget):
         self.figure.clear()
         ax = self.figure.add_subplot(111)
         
-        if not data:
+        data_array = np.asarray(data)
+        if data_array.size == 0:
             ax.text(0.5, 0.5, '无数据', ha='center', va='center', fontsize=14)
+            self._has_data = False
             self.draw()
             return
         
-        data_array = np.array(data)
-        
         # 绘制直方图
         n, bins_edges, patches = ax.hist(data_array, bins=bins, 
                                           color='#888888', edgecolor='black',
@@ -327,6 +339,7 @@ class HistogramChart(MatplotlibWidget):
                    bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
                    fontsize=9)
         
+        self._has_data = True
         self.draw()
 
 
@@ -337,14 +350,16 @@ class FTATreeChart(MatplotlibWidget):
         super().__init__(parent, width=10, height=8)
     
     def plot_fta_tree(self, nodes: List[Dict], edges: List[Tuple[int, int]],
-                      title: str = "故障树结构图"):
+                      title: str = "故障树结构图", id_key: str = "id"):
         """
         绘制故障树结构图
         
         Args:
-            nodes: 节点列表 [{"id", "name", "node_type", "gate_type", "probability"}]
+            nodes: 节点列表 [{"id", "name", "node_type", "gate_type", "probability"}]，
+                   可直接传入FTA模型的node_results（配合id_key="node_id"）
             edges: 边列表 [(parent_id, child_id), ...]
             title: 图表标题
+            id_key: 节点字典中节点ID的键名
         """
         self.figure.clear()
         ax = self.figure.add_subplot(111)
@@ -352,6 +367,7 @@ class FTATreeChart(MatplotlibWidget):
         if not nodes:
             ax.text(0.5, 0.5, '无故障树数据', ha='center', va='center', fontsize=14)
             ax.axis('off')
+            self._has_data = False
             self.draw()
             return
         
@@ -360,10 +376,10 @@ class FTATreeChart(MatplotlibWidget):
             
             # 构建图
             G = nx.DiGraph()
-            node_dict = {n["id"]: n for n in nodes}
+            node_dict = {n.get(id_key, 0): n for n in nodes}
             
-            for n in nodes:
-                G.add_node(n["id"], **n)
+            for node_id, n in node_dict.items():
+                G.add_node(node_id, **n)
             
             for parent_id, child_id in edges:
                 if parent_id in node_dict and child_id in node_dict:
@@ -458,6 +474,7 @@ class FTATreeChart(MatplotlibWidget):
             # 如果出错，显示错误信息
             self._plot_simple_tree(ax, nodes, edges, title, str(e))
         
+        self._has_data = True
         self.draw()
     
     def _hierarchy_pos(self, G, root, width=1., vert_gap=0.15, vert_loc=0, xcenter=0.5):
@@ -516,6 +533,7 @@ class FTAContributionChart(MatplotlibWidget):
             ax = self.figure.add_subplot(111)
             ax.text(0.5, 0.5, '无贡献度数据', ha='center', va='center', fontsize=14)
             ax.axis('off')
+            self._has_data = False
             self.draw()
             return
         
@@ -576,6 +594,7 @@ class FTAContributionChart(MatplotlibWidget):
         
         # 调整整体布局，确保标题和标签完整显示
         self.figure.subplots_adjust(top=0.90, bottom=0.08, left=0.18, right=0.82, wspace=0.35)
+        self._has_data = True
         self.draw()
 
 
@@ -608,6 +627,7 @@ class FTASensitivityChart(MatplotlibWidget):
         if not names:
             ax.text(0.5, 0.5, '无敏感性分析数据', ha='center', va='center', fontsize=14)
             ax.axis('off')
+            self._has_data = False
             self.draw()
             return
         
@@ -639,6 +659,7 @@ class FTASensitivityChart(MatplotlibWidget):
         # 调整布局，确保标题和标签完整显示
         self.figure.subplots_adjust(top=0.90, bottom=0.15, left=0.18, right=0.95)
         
+        self._has_data = True
         self.draw()
 
 
@@ -667,6 +688,7 @@ class AHPRadarChart(MatplotlibWidget):
             ax = self.figure.add_subplot(111)
             ax.text(0.5, 0.5, '无AHP数据', ha='center', va='center', fontsize=14)
             ax.axis('off')
+            self._has_data = False
             self.draw()
             return
         
@@ -710,6 +732,7 @@ class AHPRadarChart(MatplotlibWidget):
         
         # 调整布局，确保标题和图例完整显示
         self.figure.subplots_adjust(top=0.86, bottom=0.05, left=0.1, right=0.78)
+        self._has_data = True
         self.draw()
 
 
@@ -738,6 +761,7 @@ class AHPContributionChart(MatplotlibWidget):
             ax = self.figure.add_subplot(111)
             ax.text(0.5, 0.5, '无AHP贡献度数据', ha='center', va='center', fontsize=14)
             ax.axis('off')
+            self._has_data = False
             self.draw()
             return
         
@@ -793,6 +817,7 @@ class AHPContributionChart(MatplotlibWidget):
         ax.set_ylim(0, max(total_score * 1.1, sum(values) * 1.1))
         
         self.figure.tight_layout()
+        self._has_data = True
         self.draw()
     
     def plot_horizontal_bar(self, indicator_names: List[str],
@@ -816,6 +841,7 @@ class AHPContributionChart(MatplotlibWidget):
             ax = self.figure.add_subplot(111)
             ax.text(0.5, 0.5, '无AHP数据', ha='center', va='center', fontsize=14)
             ax.axis('off')
+            self._has_data = False
             self.draw()
             return
         
@@ -855,4 +881,68 @@ class AHPContributionChart(MatplotlibWidget):
         
         # 调整布局，确保Y轴标签完整显示
         self.figure.subplots_adjust(left=0.25, right=0.95, top=0.90, bottom=0.1)
+        self._has_data = True
         self.draw()
+
+
+class OffscreenChart:
+    """
+    离屏图表：画到独立的Agg Figure上，不创建Qt组件，可在工作线程中绘制与保存
+
+    子类直接复用对应图表组件的绘图方法（它们只用到 figure、_has_data 与 draw）。
+    """
+    
+    def __init__(self, width: int, height: int, dpi: int = 100):
+        self.figure = Figure(figsize=(width, height), dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self._has_data = False
+    
+    @property
+    def has_data(self) -> bool:
+        """图表是否包含有效数据"""
+        return self._has_data
+    
+    def draw(self):
+        """整理布局（实际渲染在保存时进行）"""
+        self.figure.tight_layout(pad=1.5, h_pad=1.0, w_pad=1.0, rect=(0, 0, 1, 0.96))
+    
+    def save_figure(self, filepath: str, dpi: int = 150):
+        """保存为PNG（按内容裁剪，图外图例不被截断；使用最低压缩级别）"""
+        self.figure.savefig(filepath, dpi=dpi, bbox_inches='tight', pad_inches=0.3,
+                            pil_kwargs={"compress_level": 1})
+
+
+class OffscreenRiskMatrixChart(OffscreenChart):
+    """离屏风险矩阵热力图"""
+    
+    plot_matrix = RiskMatrixChart.plot_matrix
+    
+    def __init__(self):
+        super().__init__(7, 6)
+
+
+class OffscreenTopNBarChart(OffscreenChart):
+    """离屏Top-N条形图"""
+    
+    plot_top_risks = TopNBarChart.plot_top_risks
+    
+    def __init__(self):
+        super().__init__(8, 5)
+
+
+class OffscreenSensitivityBarChart(OffscreenChart):
+    """离屏敏感性分析条形图"""
+    
+    plot_sensitivity = SensitivityBarChart.plot_sensitivity
+    
+    def __init__(self):
+        super().__init__(9, 5)
+
+
+class OffscreenHistogramChart(OffscreenChart):
+    """离屏直方图"""
+    
+    plot_histogram = HistogramChart.plot_histogram
+    
+    def __init__(self):
+        super().__init__(7, 5)
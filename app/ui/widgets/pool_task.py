@@ -0,0 +1,47 @@
+"""
+线程池任务
+QThreadPool Task - 在后台线程中运行计算，通过信号把结果交回界面线程
+"""
+from PyQt5.QtCore import pyqtSignal, QObject, QRunnable, QThreadPool
+from typing import Any, Callable
+
+
+class PoolTaskSignals(QObject):
+    """
+    后台任务的完成信号
+
+    以界面组件为父对象创建，连接的槽在界面线程中排队执行。
+    """
+
+    # (任务标签, 返回值)
+    done = pyqtSignal(object, object)
+    # (任务标签, 异常)
+    failed = pyqtSignal(object, object)
+
+
+class PoolTask(QRunnable):
+    """
+    在QThreadPool中运行一个无参可调用对象
+
+    可调用对象只做计算/查询，不访问界面组件；标签原样随信号返回，
+    供接收方区分任务或丢弃过期的结果。
+    """
+
+    def __init__(self, signals: PoolTaskSignals, fn: Callable[[], Any], tag: Any = None):
+        super().__init__()
+        self._signals = signals
+        self._fn = fn
+        self._tag = tag
+
+    def run(self):
+        try:
+            value = self._fn()
+        except Exception as e:
+            self._signals.failed.emit(self._tag, e)
+            return
+        self._signals.done.emit(self._tag, value)
+
+
+def start_pool_task(signals: PoolTaskSignals, fn: Callable[[], Any], tag: Any = None):
+    """在全局线程池中运行 fn，完成后发出 signals.done / signals.failed"""
+    QThreadPool.globalInstance().start(PoolTask(signals, fn, tag))
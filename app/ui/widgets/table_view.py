@@ -3,13 +3,15 @@
 Generic Table View Widget
 """
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QTableView,
     QPushButton, QLineEdit, QLabel, QHeaderView, QMessageBox,
     QAbstractItemView, QComboBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QColor
-from typing import List, Dict, Any, Callable, Optional
+from PyQt5.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QBrush, QColor
+from typing import List, Dict, Any, Callable, Optional, Sequence
+from collections import namedtuple
+from contextlib import contextmanager
 
 
 class TableViewWidget(QWidget):
@@ -102,9 +104,7 @@ class TableViewWidget(QWidget):
         self._refresh_table()
     
     def _refresh_table(self, filter_text: str = ""):
-        """刷新表格显示"""
-        self.table.setRowCount(0)
-        
+        """刷新表格显示（复用已有单元格对象，只更新文本与背景）"""
         filtered_data = self.data
         if filter_text:
             filter_text = filter_text.lower()
@@ -119,19 +119,20 @@ class TableViewWidget(QWidget):
         for row_idx, row_data in enumerate(filtered_data):
             for col_idx, col in enumerate(self.columns):
                 value = row_data.get(col['key'], '')
-                item = QTableWidgetItem(str(value) if value is not None else '')
-                
-                # 存储行ID
-                if col_idx == 0:
-                    item.setData(Qt.UserRole, row_data.get(self.id_column))
                 
                 # 根据值着色
+                brush = _NO_BRUSH
                 if col.get('color_func'):
                     color = col['color_func'](value)
                     if color:
-                        item.setBackground(QColor(color))
+                        brush = QBrush(QColor(color))
+                
+                item = set_cell(self.table, row_idx, col_idx,
+                                str(value) if value is not None else '', brush)
                 
-                self.table.setItem(row_idx, col_idx, item)
+                # 存储行ID
+                if col_idx == 0:
+                    item.setData(Qt.UserRole, row_data.get(self.id_column))
         
         self.status_label.setText(f"共 {len(filtered_data)} 条记录（总 {len(self.data)} 条）")
     
@@ -215,16 +216,15 @@ class FilterableTableWidget(TableViewWidget):
             self._refresh_table(self.search_input.text())
         else:
             filtered = [row for row in self.data if row.get(self.filter_key) == filter_value]
-            self.table.setRowCount(0)
             self.table.setRowCount(len(filtered))
             
             for row_idx, row_data in enumerate(filtered):
                 for col_idx, col in enumerate(self.columns):
                     value = row_data.get(col['key'], '')
-                    item = QTableWidgetItem(str(value) if value is not None else '')
+                    item = set_cell(self.table, row_idx, col_idx,
+                                    str(value) if value is not None else '', _NO_BRUSH)
                     if col_idx == 0:
                         item.setData(Qt.UserRole, row_data.get(self.id_column))
-                    self.table.setItem(row_idx, col_idx, item)
             
             self.status_label.setText(f"共 {len(filtered)} 条记录")
     
@@ -233,6 +233,197 @@ class FilterableTableWidget(TableViewWidget):
         return self.filter_combo.currentData() if hasattr(self, 'filter_combo') else None
 
 
+# 表格列定义
+#   header: 表头文字
+#   value: 显示值的取法 —— 属性名、callable(row)，或 None 表示行号（从1开始）
+#   role_map: 可选，{Qt角色: callable(row)}，如 {Qt.BackgroundRole: ...}
+TableColumn = namedtuple("TableColumn", "header value role_map", defaults=(None, None))
+
+
+class DataclassTableModel(QAbstractTableModel):
+    """
+    只读对象列表表格模型
+    配合QTableView使用：行直接引用结果对象（dataclass、字典或元组），
+    按列定义取值；视图只为可见行调用data()，不再为每个单元格创建QTableWidgetItem。
+    显示文本在set_rows时一次格式化，data()只做索引。
+    """
+    
+    def __init__(self, rows: Sequence[Any], columns: Sequence[TableColumn], parent=None):
+        super().__init__(parent)
+        self._columns = [TableColumn(*c) for c in columns]
+        self._formatters = [self._make_formatter(c.value) for c in self._columns]
+        self._rows: List[Any] = []
+        self._cells: List[List[str]] = []
+        self._load(rows)
+    
+    @staticmethod
+    def _make_formatter(value) -> Callable[[int, Any], str]:
+        """把列的取值定义转换为 (行号, 行对象) -> 显示文本"""
+        if value is None:
+            return lambda r, row: str(r + 1)
+        if isinstance(value, str):
+            return lambda r, row: str(getattr(row, value))
+        return lambda r, row: str(value(row))
+    
+    def _load(self, rows: Sequence[Any]):
+        self._rows = list(rows)
+        formatters = self._formatters
+        self._cells = [
+            [fmt(r, row) for fmt in formatters]
+            for r, row in enumerate(self._rows)
+        ]
+    
+    def set_rows(self, rows: Sequence[Any]):
+        """
+        替换表格数据
+        
+        行数不变时（如重复评估同一任务）只比较格式化后的单元格文本，
+        仅对发生变化的行发出dataChanged，全部相同则视图无需任何重绘；
+        行数变化时整体重置模型。角色取值（如等级背景色）视为由显示数据决定。
+        """
+        rows = list(rows)
+        old_cells = self._cells
+        if len(rows) != len(old_cells):
+            self.beginResetModel()
+            self._load(rows)
+            self.endResetModel()
+            return
+        
+        self._load(rows)
+        changed = [r for r, (old, new) in enumerate(zip(old_cells, self._cells)) if old != new]
+        if changed:
+            self.dataChanged.emit(
+                self.index(changed[0], 0),
+                self.index(changed[-1], len(self._columns) - 1)
+            )
+    
+    def append_rows(self, rows: Sequence[Any]):
+        """在末尾追加行（如fetchMore分批加载），只格式化新增的行"""
+        rows = list(rows)
+        if not rows:
+            return
+        start = len(self._rows)
+        formatters = self._formatters
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self._cells.extend(
+            [fmt(r, row) for fmt in formatters]
+            for r, row in enumerate(rows, start)
+        )
+        self.endInsertRows()
+    
+    def replace_row(self, r: int, row: Any):
+        """替换单行，只重新格式化并通知该行"""
+        self._rows[r] = row
+        self._cells[r] = [fmt(r, row) for fmt in self._formatters]
+        self.dataChanged.emit(self.index(r, 0), self.index(r, len(self._columns) - 1))
+    
+    def remove_row(self, r: int):
+        """删除单行（若有行号列，其后各行重新编号）"""
+        self.beginRemoveRows(QModelIndex(), r, r)
+        del self._rows[r]
+        del self._cells[r]
+        self.endRemoveRows()
+        if r < len(self._rows) and any(c.value is None for c in self._columns):
+            formatters = self._formatters
+            for i in range(r, len(self._rows)):
+                self._cells[i] = [fmt(i, self._rows[i]) for fmt in formatters]
+            self.dataChanged.emit(
+                self.index(r, 0),
+                self.index(len(self._rows) - 1, len(self._columns) - 1)
+            )
+    
+    def clear(self):
+        """清空数据"""
+        self.set_rows([])
+    
+    def row_at(self, r: int) -> Any:
+        """返回第r行对应的行对象"""
+        return self._rows[r]
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        r, c = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            return self._cells[r][c]
+        role_map = self._columns[c].role_map
+        if role_map:
+            getter = role_map.get(role)
+            if getter is not None:
+                return getter(self._rows[r])
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._columns[section].header
+        return super().headerData(section, orientation, role)
+
+
+@contextmanager
+def frozen_table(table: QTableView):
+    """
+    批量填充表格期间暂停重绘、信号、排序与按内容调整列宽
+    
+    适用于QTableWidget与QTableView。填充期间表头各列暂时固定宽度，
+    退出时恢复原有的调整模式（如ResizeToContents只在最后计算一次），
+    再整体刷新一次视口。
+    
+    用法:
+        with frozen_table(table):
+            table.setRowCount(n)
+            for ...: table.setItem(...)
+    """
+    header = table.horizontalHeader()
+    modes = [header.sectionResizeMode(i) for i in range(header.count())]
+    was_sorting = table.isSortingEnabled()
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    table.setSortingEnabled(False)
+    header.setSectionResizeMode(QHeaderView.Fixed)
+    try:
+        yield table
+    finally:
+        for i, mode in enumerate(modes[:header.count()]):
+            header.setSectionResizeMode(i, mode)
+        table.setSortingEnabled(was_sorting)
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+        table.viewport().update()
+
+
+# 无背景（清除复用单元格上残留的背景色）
+_NO_BRUSH = QBrush()
+
+
+def set_cell(table: QTableWidget, row: int, col: int, text: str,
+             brush: Optional[QBrush] = None) -> QTableWidgetItem:
+    """
+    设置QTableWidget单元格文本，复用已存在的单元格对象
+    
+    重复刷新行数不变的表格时只调用setText，不再为每个单元格新建QTableWidgetItem；
+    行数缩减时多余的单元格由setRowCount释放。
+    
+    Args:
+        brush: 可选背景画刷；传入空QBrush()可清除原有背景
+    """
+    item = table.item(row, col)
+    if item is None:
+        item = QTableWidgetItem(text)
+        table.setItem(row, col, item)
+    else:
+        item.setText(text)
+    if brush is not None:
+        item.setBackground(brush)
+    return item
+
+
 def get_risk_level_color(level: str) -> str:
     """根据风险等级返回颜色"""
     colors = {
@@ -2,17 +2,58 @@
 Excel/CSV 数据导入导出工具
 Excel/CSV Data Import/Export Utilities
 """
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Callable, Iterator
 from datetime import datetime
 import os
 
 from ..db.dao import (
-    Mission, Indicator, RiskEvent, FMEAItem,
-    MissionDAO, IndicatorDAO, RiskEventDAO, FMEAItemDAO
+    Mission, Indicator, RiskEvent, FMEAItem, FTANode, FTAEdge,
+    MissionDAO, IndicatorDAO, RiskEventDAO, FMEAItemDAO, FTANodeDAO, FTAEdgeDAO
 )
 
 
+# 进度回调: (当前行数, 总行数)
+ProgressCallback = Optional[Callable[[int, int], None]]
+
+# 进度上报间隔（行），避免跨线程信号过于频繁
+PROGRESS_STEP = 100
+
+# CSV分块读取的行数，大文件不必一次性整体载入
+CSV_CHUNK_ROWS = 10000
+
+# 批量写库时每次executemany的条数
+DB_CHUNK_ROWS = 1000
+
+
+def _report_progress(progress_cb: ProgressCallback, current: int, total: int):
+    """按间隔调用进度回调（最后一行总会上报）"""
+    if progress_cb and (current % PROGRESS_STEP == 0 or current == total):
+        progress_cb(current, total)
+
+
+def _read_table(filepath: str) -> pd.DataFrame:
+    """读取Excel/CSV为DataFrame"""
+    if filepath.endswith('.csv'):
+        return pd.read_csv(filepath)
+    return pd.read_excel(filepath, engine='openpyxl')
+
+
+def _iter_table_chunks(filepath: str, chunksize: int = CSV_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """
+    分块读取Excel/CSV
+    
+    CSV按 chunksize 行流式读取，各块的索引连续递增（行号不变）；
+    Excel不支持流式读取，整体作为一块返回。
+    """
+    if filepath.endswith('.csv'):
+        with pd.read_csv(filepath, chunksize=chunksize) as reader:
+            yield from reader
+    else:
+        yield _read_table(filepath)
+
+
 class ExcelTemplate:
     """Excel模板定义和生成器"""
     
@@ -83,6 +124,20 @@ class ExcelTemplate:
             '检测度D(1-10)': [2, 3, 1]
         })
     
+    @staticmethod
+    def get_fta_template() -> pd.DataFrame:
+        """
+        获取FTA节点导入模板（父节点列填写同一任务内已有或同批导入的节点名称）
+        """
+        return pd.DataFrame({
+            '任务名称': ['锅炉年度检修', '锅炉年度检修', '锅炉年度检修', '锅炉年度检修'],
+            '节点名称': ['锅炉爆炸', '超压未泄放', '安全阀失灵', '压力表失效'],
+            '类型': ['TOP', 'INTERMEDIATE', 'BASIC', 'BASIC'],
+            '门类型': ['OR', 'AND', '', ''],
+            '概率': [None, None, 0.01, 0.05],
+            '父节点': ['', '锅炉爆炸', '超压未泄放', '超压未泄放']
+        })
+    
     @staticmethod
     def save_template(df: pd.DataFrame, filepath: str) -> bool:
         """
@@ -103,58 +158,110 @@ class ExcelTemplate:
             return False
 
 
+def _text(df: pd.DataFrame, col: str, default: Optional[str] = '') -> pd.Series:
+    """可选文本列：去除首尾空白，列缺失或单元格为空时取 default"""
+    if col not in df.columns:
+        return pd.Series(default, index=df.index, dtype=object)
+    values = df[col]
+    result = values.map(str).str.strip().astype(object)
+    result[values.isna()] = default
+    return result
+
+
+def _required_text(df: pd.DataFrame, col: str) -> pd.Series:
+    """必填文本列：str(x).strip()，空单元格得到 'nan' 供后续校验"""
+    return df[col].map(str).str.strip()
+
+
+def _is_blank(values: pd.Series) -> pd.Series:
+    return values.isin(('', 'nan'))
+
+
+def _truncated_int(df: pd.DataFrame, col: str) -> pd.Series:
+    """数值列截断取整（同 int(float(x))），无法解析的为NaN"""
+    return np.trunc(pd.to_numeric(df[col], errors='coerce').replace([np.inf, -np.inf], np.nan))
+
+
+def _first_errors(index: pd.Index, checks: List[Tuple[pd.Series, str]]) -> pd.Series:
+    """按顺序应用校验，返回每行命中的第一条错误信息（无错误为空串）"""
+    if not checks:
+        return pd.Series('', index=index, dtype=object)
+    return pd.Series(
+        np.select([mask.to_numpy(dtype=bool) for mask, _ in checks],
+                  [msg for _, msg in checks], default=''),
+        index=index
+    )
+
+
 class ExcelImporter:
-    """Excel数据导入器"""
+    """
+    Excel数据导入器
+    
+    读入DataFrame后按列向量化完成清洗与校验，
+    只在最后一步把合法行转换为字典/数据对象。
+    """
     
     def __init__(self):
         self.errors: List[str] = []
     
-    def import_missions(self, filepath: str) -> Tuple[List[Mission], List[str]]:
+    def _read(self, filepath: str, required_cols: set) -> Optional[pd.DataFrame]:
+        """读取文件并校验必需列，失败时记录错误并返回None"""
+        df = _read_table(filepath)
+        if not required_cols.issubset(df.columns):
+            missing = required_cols - set(df.columns)
+            self.errors.append(f"缺少必需列: {', '.join(missing)}")
+            return None
+        return df
+    
+    def _read_chunks(self, filepath: str, required_cols: set) -> Iterator[pd.DataFrame]:
+        """分块读取文件，首块校验必需列，缺列时记录错误并停止"""
+        for n, df in enumerate(_iter_table_chunks(filepath)):
+            if n == 0 and not required_cols.issubset(df.columns):
+                missing = required_cols - set(df.columns)
+                self.errors.append(f"缺少必需列: {', '.join(missing)}")
+                return
+            yield df
+    
+    def _collect_errors(self, df: pd.DataFrame,
+                        checks: List[Tuple[pd.Series, str]]) -> pd.Series:
+        """记录各行错误信息（按行号顺序），返回合法行掩码"""
+        row_errors = _first_errors(df.index, checks)
+        bad = row_errors[row_errors != '']
+        self.errors.extend(f"第{int(idx) + 2}行: {msg}" for idx, msg in bad.items())
+        return row_errors == ''
+    
+    def import_missions(self, filepath: str,
+                        progress_cb: ProgressCallback = None) -> Tuple[List[Mission], List[str]]:
         """
         从Excel/CSV导入任务数据
         
         Args:
             filepath: 文件路径
+            progress_cb: 进度回调 (当前行数, 总行数)，可选
             
         Returns:
             Tuple[成功解析的任务列表, 错误信息列表]
         """
         self.errors = []
-        missions = []
         
         try:
-            # 读取文件
-            if filepath.endswith('.csv'):
-                df = pd.read_csv(filepath)
-            else:
-                df = pd.read_excel(filepath, engine='openpyxl')
-            
-            # 验证必需列
-            required_cols = {'任务名称'}
-            if not required_cols.issubset(df.columns):
-                missing = required_cols - set(df.columns)
-                self.errors.append(f"缺少必需列: {', '.join(missing)}")
+            df = self._read(filepath, {'任务名称'})
+            if df is None or df.empty:
                 return [], self.errors
             
-            # 解析每一行
-            for idx, row in df.iterrows():
-                try:
-                    row_num = int(idx) + 2  # type: ignore
-                    name = str(row['任务名称']).strip()
-                    if not name or name == 'nan':
-                        self.errors.append(f"第{row_num}行: 任务名称不能为空")
-                        continue
-                    
-                    mission = Mission(
-                        name=name,
-                        date=str(row.get('日期', datetime.now().strftime('%Y-%m-%d'))).strip(),
-                        desc=str(row.get('描述', '')).strip() if pd.notna(row.get('描述')) else ''
-                    )
-                    missions.append(mission)
-                    
-                except Exception as e:
-                    row_num = int(idx) + 2  # type: ignore
-                    self.errors.append(f"第{row_num}行解析失败: {str(e)}")
+            name = _required_text(df, '任务名称')
+            if '日期' in df.columns:
+                date = df['日期'].map(str).str.strip()
+            else:
+                date = pd.Series(datetime.now().strftime('%Y-%m-%d'), index=df.index)
+            desc = _text(df, '描述')
+            
+            valid = self._collect_errors(df, [(_is_blank(name), "任务名称不能为空")])
+            missions = [
+                Mission(name=n, date=d, desc=ds)
+                for n, d, ds in zip(name[valid], date[valid], desc[valid])
+            ]
+            _report_progress(progress_cb, len(df), len(df))
             
             return missions, self.errors
             
@@ -162,7 +269,8 @@ class ExcelImporter:
             self.errors.append(f"读取文件失败: {str(e)}")
             return [], self.errors
     
-    def import_indicator_categories(self, filepath: str) -> Tuple[List[Dict], List[str]]:
+    def import_indicator_categories(self, filepath: str,
+                                    progress_cb: ProgressCallback = None) -> Tuple[List[Dict], List[str]]:
         """
         从Excel/CSV导入指标分类数据
         
@@ -170,41 +278,20 @@ class ExcelImporter:
             Tuple[分类字典列表, 错误信息列表]
         """
         self.errors = []
-        categories = []
         
         try:
-            # 读取文件
-            if filepath.endswith('.csv'):
-                df = pd.read_csv(filepath)
-            else:
-                df = pd.read_excel(filepath, engine='openpyxl')
-            
-            # 验证必需列
-            required_cols = {'分类名称'}
-            if not required_cols.issubset(df.columns):
-                missing = required_cols - set(df.columns)
-                self.errors.append(f"缺少必需列: {', '.join(missing)}")
+            df = self._read(filepath, {'分类名称'})
+            if df is None or df.empty:
                 return [], self.errors
             
-            # 解析每一行
-            for idx, row in df.iterrows():
-                try:
-                    row_num = int(idx) + 2  # type: ignore
-                    name = str(row['分类名称']).strip()
-                    if not name or name == 'nan':
-                        self.errors.append(f"第{row_num}行: 分类名称不能为空")
-                        continue
-                    
-                    category_data = {
-                        'name': name,
-                        'desc': str(row.get('描述', '')).strip() if pd.notna(row.get('描述')) else ''
-                    }
-                    
-                    categories.append(category_data)
-                    
-                except Exception as e:
-                    row_num = int(idx) + 2  # type: ignore
-                    self.errors.append(f"第{row_num}行解析失败: {str(e)}")
+            out = pd.DataFrame({
+                'name': _required_text(df, '分类名称'),
+                'desc': _text(df, '描述')
+            })
+            
+            valid = self._collect_errors(df, [(_is_blank(out['name']), "分类名称不能为空")])
+            categories = out[valid].to_dict('records')
+            _report_progress(progress_cb, len(df), len(df))
             
             return categories, self.errors
             
@@ -212,7 +299,8 @@ class ExcelImporter:
             self.errors.append(f"读取文件失败: {str(e)}")
             return [], self.errors
     
-    def import_indicators(self, filepath: str) -> Tuple[List[Dict], List[str]]:
+    def import_indicators(self, filepath: str,
+                          progress_cb: ProgressCallback = None) -> Tuple[List[Dict], List[str]]:
         """
         从Excel/CSV导入指标数据
         
@@ -220,47 +308,29 @@ class ExcelImporter:
             Tuple[指标字典列表(包含分类信息), 错误信息列表]
         """
         self.errors = []
-        indicators = []
         
         try:
-            # 读取文件
-            if filepath.endswith('.csv'):
-                df = pd.read_csv(filepath)
+            df = self._read(filepath, {'指标名称'})
+            if df is None or df.empty:
+                return [], self.errors
+            
+            if '值类型' in df.columns:
+                value_type = df['值类型'].map(str).str.strip()
+                # 验证值类型
+                value_type = value_type.where(value_type.isin(('numeric', 'text')), 'numeric')
             else:
-                df = pd.read_excel(filepath, engine='openpyxl')
+                value_type = pd.Series('numeric', index=df.index)
             
-            # 验证必需列
-            required_cols = {'指标名称'}
-            if not required_cols.issubset(df.columns):
-                missing = required_cols - set(df.columns)
-                self.errors.append(f"缺少必需列: {', '.join(missing)}")
-                return [], self.errors
+            out = pd.DataFrame({
+                'name': _required_text(df, '指标名称'),
+                'category_name': _text(df, '分类名称', default=None),
+                'unit': _text(df, '单位'),
+                'value_type': value_type
+            })
             
-            # 解析每一行
-            for idx, row in df.iterrows():
-                try:
-                    row_num = int(idx) + 2  # type: ignore
-                    name = str(row['指标名称']).strip()
-                    if not name or name == 'nan':
-                        self.errors.append(f"第{row_num}行: 指标名称不能为空")
-                        continue
-                    
-                    indicator_data = {
-                        'name': name,
-                        'category_name': str(row.get('分类名称', '')).strip() if pd.notna(row.get('分类名称')) else None,
-                        'unit': str(row.get('单位', '')).strip() if pd.notna(row.get('单位')) else '',
-                        'value_type': str(row.get('值类型', 'numeric')).strip()
-                    }
-                    
-                    # 验证值类型
-                    if indicator_data['value_type'] not in ['numeric', 'text']:
-                        indicator_data['value_type'] = 'numeric'
-                    
-                    indicators.append(indicator_data)
-                    
-                except Exception as e:
-                    row_num = int(idx) + 2  # type: ignore
-                    self.errors.append(f"第{row_num}行解析失败: {str(e)}")
+            valid = self._collect_errors(df, [(_is_blank(out['name']), "指标名称不能为空")])
+            indicators = out[valid].to_dict('records')
+            _report_progress(progress_cb, len(df), len(df))
             
             return indicators, self.errors
             
@@ -268,7 +338,8 @@ class ExcelImporter:
             self.errors.append(f"读取文件失败: {str(e)}")
             return [], self.errors
     
-    def import_risk_events(self, filepath: str) -> Tuple[List[Dict], List[str]]:
+    def import_risk_events(self, filepath: str,
+                           progress_cb: ProgressCallback = None) -> Tuple[List[Dict], List[str]]:
         """
         从Excel/CSV导入风险事件数据
         
@@ -276,65 +347,36 @@ class ExcelImporter:
             Tuple[风险事件字典列表(包含任务名称), 错误信息列表]
         """
         self.errors = []
-        events = []
         
         try:
-            # 读取文件
-            if filepath.endswith('.csv'):
-                df = pd.read_csv(filepath)
-            else:
-                df = pd.read_excel(filepath, engine='openpyxl')
-            
-            # 验证必需列
-            required_cols = {'任务名称', '事件名称', '可能性(1-5)', '严重度(1-5)'}
-            if not required_cols.issubset(df.columns):
-                missing = required_cols - set(df.columns)
-                self.errors.append(f"缺少必需列: {', '.join(missing)}")
+            df = self._read(filepath, {'任务名称', '事件名称', '可能性(1-5)', '严重度(1-5)'})
+            if df is None or df.empty:
                 return [], self.errors
             
-            # 解析每一行
-            for idx, row in df.iterrows():
-                try:
-                    row_num = int(idx) + 2  # type: ignore
-                    mission_name = str(row['任务名称']).strip()
-                    event_name = str(row['事件名称']).strip()
-                    
-                    if not mission_name or mission_name == 'nan':
-                        self.errors.append(f"第{row_num}行: 任务名称不能为空")
-                        continue
-                    if not event_name or event_name == 'nan':
-                        self.errors.append(f"第{row_num}行: 事件名称不能为空")
-                        continue
-                    
-                    # 读取和验证可能性和严重度
-                    try:
-                        likelihood = int(float(row['可能性(1-5)']))
-                        severity = int(float(row['严重度(1-5)']))
-                    except (ValueError, TypeError):
-                        self.errors.append(f"第{row_num}行: 可能性或严重度必须是数字")
-                        continue
-                    
-                    if not (1 <= likelihood <= 5):
-                        self.errors.append(f"第{row_num}行: 可能性必须在1-5之间")
-                        continue
-                    if not (1 <= severity <= 5):
-                        self.errors.append(f"第{row_num}行: 严重度必须在1-5之间")
-                        continue
-                    
-                    event_data = {
-                        'mission_name': mission_name,
-                        'name': event_name,
-                        'hazard_type': str(row.get('危险类型', '')).strip() if pd.notna(row.get('危险类型')) else '',
-                        'desc': str(row.get('描述', '')).strip() if pd.notna(row.get('描述')) else '',
-                        'likelihood': likelihood,
-                        'severity': severity
-                    }
-                    
-                    events.append(event_data)
-                    
-                except Exception as e:
-                    row_num = int(idx) + 2  # type: ignore
-                    self.errors.append(f"第{row_num}行解析失败: {str(e)}")
+            mission_name = _required_text(df, '任务名称')
+            event_name = _required_text(df, '事件名称')
+            likelihood = _truncated_int(df, '可能性(1-5)')
+            severity = _truncated_int(df, '严重度(1-5)')
+            
+            valid = self._collect_errors(df, [
+                (_is_blank(mission_name), "任务名称不能为空"),
+                (_is_blank(event_name), "事件名称不能为空"),
+                (likelihood.isna() | severity.isna(), "可能性或严重度必须是数字"),
+                (~likelihood.between(1, 5), "可能性必须在1-5之间"),
+                (~severity.between(1, 5), "严重度必须在1-5之间"),
+            ])
+            
+            out = pd.DataFrame({
+                'mission_name': mission_name,
+                'name': event_name,
+                'hazard_type': _text(df, '危险类型'),
+                'desc': _text(df, '描述'),
+                'likelihood': likelihood,
+                'severity': severity
+            })[valid]
+            out = out.astype({'likelihood': int, 'severity': int})
+            events = out.to_dict('records')
+            _report_progress(progress_cb, len(df), len(df))
             
             return events, self.errors
             
@@ -342,82 +384,119 @@ class ExcelImporter:
             self.errors.append(f"读取文件失败: {str(e)}")
             return [], self.errors
     
-    def import_fmea_items(self, filepath: str) -> Tuple[List[Dict], List[str]]:
+    def import_fmea_items(self, filepath: str,
+                          progress_cb: ProgressCallback = None) -> Tuple[List[Dict], List[str]]:
         """
         从Excel/CSV导入FMEA数据
         
         Returns:
             Tuple[FMEA字典列表(包含任务名称), 错误信息列表]
         """
+        fmea_items: List[Dict] = []
+        for chunk in self.iter_fmea_items(filepath, progress_cb):
+            fmea_items.extend(chunk)
+        return fmea_items, self.errors
+    
+    def iter_fmea_items(self, filepath: str,
+                        progress_cb: ProgressCallback = None) -> Iterator[List[Dict]]:
+        """
+        分块解析FMEA数据，逐块产出已校验的FMEA字典列表
+        
+        CSV按 CSV_CHUNK_ROWS 行流式读取，调用方逐块入库时内存中只保留当前一块；
+        错误信息在迭代过程中记录到 self.errors。
+        """
         self.errors = []
-        fmea_items = []
         
         try:
-            # 读取文件
-            if filepath.endswith('.csv'):
-                df = pd.read_csv(filepath)
-            else:
-                df = pd.read_excel(filepath, engine='openpyxl')
+            n_rows = 0
+            for df in self._read_chunks(filepath, {'任务名称', '失效模式', '严重度S(1-10)',
+                                                   '发生度O(1-10)', '检测度D(1-10)'}):
+                if df.empty:
+                    continue
+                n_rows += len(df)
+                _report_progress(progress_cb, n_rows, n_rows)
+                yield self._parse_fmea_frame(df)
             
-            # 验证必需列
-            required_cols = {'任务名称', '失效模式', '严重度S(1-10)', '发生度O(1-10)', '检测度D(1-10)'}
-            if not required_cols.issubset(df.columns):
-                missing = required_cols - set(df.columns)
-                self.errors.append(f"缺少必需列: {', '.join(missing)}")
+        except Exception as e:
+            self.errors.append(f"读取文件失败: {str(e)}")
+    
+    def _parse_fmea_frame(self, df: pd.DataFrame) -> List[Dict]:
+        """校验并转换一块FMEA数据，返回合法行的字典列表"""
+        mission_name = _required_text(df, '任务名称')
+        failure_mode = _required_text(df, '失效模式')
+        s_score = _truncated_int(df, '严重度S(1-10)')
+        o_score = _truncated_int(df, '发生度O(1-10)')
+        d_score = _truncated_int(df, '检测度D(1-10)')
+        
+        valid = self._collect_errors(df, [
+            (_is_blank(mission_name), "任务名称不能为空"),
+            (_is_blank(failure_mode), "失效模式不能为空"),
+            (s_score.isna() | o_score.isna() | d_score.isna(), "SOD评分必须是数字"),
+            (~s_score.between(1, 10), "严重度S必须在1-10之间"),
+            (~o_score.between(1, 10), "发生度O必须在1-10之间"),
+            (~d_score.between(1, 10), "检测度D必须在1-10之间"),
+        ])
+        
+        out = pd.DataFrame({
+            'mission_name': mission_name,
+            'system': _text(df, '系统/子系统'),
+            'failure_mode': failure_mode,
+            'effect': _text(df, '失效影响'),
+            'cause': _text(df, '失效原因'),
+            'control': _text(df, '控制措施'),
+            'S': s_score,
+            'O': o_score,
+            'D': d_score
+        })[valid]
+        out = out.astype({'S': int, 'O': int, 'D': int})
+        return out.to_dict('records')
+    
+    def import_fta_nodes(self, filepath: str,
+                         progress_cb: ProgressCallback = None) -> Tuple[List[Dict], List[str]]:
+        """
+        从Excel/CSV导入FTA节点（可选父节点列用于同时建立边）
+        
+        Returns:
+            Tuple[节点字典列表(包含任务名称、父节点名称), 错误信息列表]
+        """
+        self.errors = []
+        
+        try:
+            df = self._read(filepath, {'任务名称', '节点名称', '类型'})
+            if df is None or df.empty:
                 return [], self.errors
             
-            # 解析每一行
-            for idx, row in df.iterrows():
-                try:
-                    row_num = int(idx) + 2  # type: ignore
-                    mission_name = str(row['任务名称']).strip()
-                    failure_mode = str(row['失效模式']).strip()
-                    
-                    if not mission_name or mission_name == 'nan':
-                        self.errors.append(f"第{row_num}行: 任务名称不能为空")
-                        continue
-                    if not failure_mode or failure_mode == 'nan':
-                        self.errors.append(f"第{row_num}行: 失效模式不能为空")
-                        continue
-                    
-                    # 读取和验证SOD评分
-                    try:
-                        s_score = int(float(row['严重度S(1-10)']))
-                        o_score = int(float(row['发生度O(1-10)']))
-                        d_score = int(float(row['检测度D(1-10)']))
-                    except (ValueError, TypeError):
-                        self.errors.append(f"第{row_num}行: SOD评分必须是数字")
-                        continue
-                    
-                    if not (1 <= s_score <= 10):
-                        self.errors.append(f"第{row_num}行: 严重度S必须在1-10之间")
-                        continue
-                    if not (1 <= o_score <= 10):
-                        self.errors.append(f"第{row_num}行: 发生度O必须在1-10之间")
-                        continue
-                    if not (1 <= d_score <= 10):
-                        self.errors.append(f"第{row_num}行: 检测度D必须在1-10之间")
-                        continue
-                    
-                    fmea_data = {
-                        'mission_name': mission_name,
-                        'system': str(row.get('系统/子系统', '')).strip() if pd.notna(row.get('系统/子系统')) else '',
-                        'failure_mode': failure_mode,
-                        'effect': str(row.get('失效影响', '')).strip() if pd.notna(row.get('失效影响')) else '',
-                        'cause': str(row.get('失效原因', '')).strip() if pd.notna(row.get('失效原因')) else '',
-                        'control': str(row.get('控制措施', '')).strip() if pd.notna(row.get('控制措施')) else '',
-                        'S': s_score,
-                        'O': o_score,
-                        'D': d_score
-                    }
-                    
-                    fmea_items.append(fmea_data)
-                    
-                except Exception as e:
-                    row_num = int(idx) + 2  # type: ignore
-                    self.errors.append(f"第{row_num}行解析失败: {str(e)}")
+            mission_name = _required_text(df, '任务名称')
+            node_name = _required_text(df, '节点名称')
+            node_type = _required_text(df, '类型').str.upper()
+            gate_type = _text(df, '门类型').str.upper()
+            if '概率' in df.columns:
+                probability = pd.to_numeric(df['概率'], errors='coerce')
+            else:
+                probability = pd.Series(np.nan, index=df.index)
+            is_basic = node_type == 'BASIC'
+            
+            valid = self._collect_errors(df, [
+                (_is_blank(mission_name), "任务名称不能为空"),
+                (_is_blank(node_name), "节点名称不能为空"),
+                (~node_type.isin(('TOP', 'INTERMEDIATE', 'BASIC')), "类型必须是TOP/INTERMEDIATE/BASIC"),
+                (~gate_type.isin(('', 'AND', 'OR')), "门类型必须是AND/OR或留空"),
+                (is_basic & ~probability.between(0, 1), "BASIC节点的概率必须在0-1之间"),
+            ])
             
-            return fmea_items, self.errors
+            out = pd.DataFrame({
+                'mission_name': mission_name,
+                'name': node_name,
+                'node_type': node_type,
+                'gate_type': gate_type.where(gate_type != '', None),
+                'probability': probability.where(is_basic).astype(object),
+                'parent_name': _text(df, '父节点')
+            })[valid]
+            out.loc[out['probability'].isna(), 'probability'] = None
+            nodes = out.to_dict('records')
+            _report_progress(progress_cb, len(df), len(df))
+            
+            return nodes, self.errors
             
         except Exception as e:
             self.errors.append(f"读取文件失败: {str(e)}")
@@ -432,8 +511,11 @@ class DataBatchImporter:
         self.indicator_dao = IndicatorDAO()
         self.risk_event_dao = RiskEventDAO()
         self.fmea_dao = FMEAItemDAO()
+        self.fta_node_dao = FTANodeDAO()
+        self.fta_edge_dao = FTAEdgeDAO()
     
-    def batch_import_missions(self, missions: List[Mission]) -> Tuple[int, List[str]]:
+    def batch_import_missions(self, missions: List[Mission],
+                              progress_cb: ProgressCallback = None) -> Tuple[int, List[str]]:
         """
         批量导入任务到数据库
         
@@ -443,7 +525,9 @@ class DataBatchImporter:
         success_count = 0
         errors = []
         
-        for mission in missions:
+        total = len(missions)
+        for n, mission in enumerate(missions, 1):
+            _report_progress(progress_cb, n, total)
             try:
                 self.mission_dao.create(mission)
                 success_count += 1
@@ -452,7 +536,8 @@ class DataBatchImporter:
         
         return success_count, errors
     
-    def batch_import_indicator_categories(self, categories: List[Dict]) -> Tuple[int, List[str]]:
+    def batch_import_indicator_categories(self, categories: List[Dict],
+                                          progress_cb: ProgressCallback = None) -> Tuple[int, List[str]]:
         """
         批量导入指标分类到数据库
         
@@ -468,7 +553,9 @@ class DataBatchImporter:
         # 获取现有分类名称以避免重复
         existing_names = {cat.name for cat in category_dao.get_all()}
         
-        for cat_data in categories:
+        total = len(categories)
+        for n, cat_data in enumerate(categories, 1):
+            _report_progress(progress_cb, n, total)
             try:
                 cat_name = cat_data['name']
                 
@@ -491,7 +578,50 @@ class DataBatchImporter:
         
         return success_count, errors
     
-    def batch_import_indicators(self, indicators: List[Dict]) -> Tuple[int, List[str]]:
+    def batch_upsert_categories(self, categories: List[Tuple[str, str]],
+                                errors: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        批量写入指标分类（已存在的跳过）
+        
+        整批写入失败时（已由保存点撤销）记录到 errors 并逐条写入，
+        写入失败的分类不出现在返回结果中。
+        
+        Args:
+            categories: 已去重的 [(分类名称, 描述), ...]
+            errors: 可选，收集错误信息的列表
+            
+        Returns:
+            Dict[分类名称, 分类ID]（包含原有分类）
+        """
+        from ..db.dao import IndicatorCategoryDAO, IndicatorCategory
+        category_dao = IndicatorCategoryDAO()
+        existing = {cat.name: cat.id for cat in category_dao.get_all()}
+        
+        new_categories = [
+            IndicatorCategory(name=name, desc=desc)
+            for name, desc in categories if name not in existing
+        ]
+        if not new_categories:
+            return existing
+        
+        try:
+            new_ids = category_dao.create_many(new_categories)
+            for cat, cat_id in zip(new_categories, new_ids):
+                existing[cat.name] = cat_id
+        except Exception as e:
+            if errors is not None:
+                errors.append(f"批量创建指标分类失败，改为逐条创建: {str(e)}")
+            for cat in new_categories:
+                try:
+                    existing[cat.name] = category_dao.create(cat)
+                except Exception as e:
+                    if errors is not None:
+                        errors.append(f"创建指标分类 '{cat.name}' 失败: {str(e)}")
+        
+        return existing
+    
+    def batch_import_indicators(self, indicators: List[Dict],
+                                progress_cb: ProgressCallback = None) -> Tuple[int, List[str]]:
         """
         批量导入指标到数据库（自动创建不存在的分类）
         
@@ -501,25 +631,21 @@ class DataBatchImporter:
         success_count = 0
         errors = []
         
-        # 获取现有分类
-        from ..db.dao import IndicatorCategoryDAO, IndicatorCategory
-        category_dao = IndicatorCategoryDAO()
-        existing_categories = {cat.name: cat.id for cat in category_dao.get_all()}
+        # 先在内存中按名称去重，再一次性补齐缺失分类
+        category_names = {
+            ind['category_name']: "自动创建于导入"
+            for ind in indicators if ind.get('category_name')
+        }
+        existing_categories = self.batch_upsert_categories(list(category_names.items()), errors)
         
-        for ind_data in indicators:
+        total = len(indicators)
+        for n, ind_data in enumerate(indicators, 1):
+            _report_progress(progress_cb, n, total)
             try:
-                # 处理分类
-                category_id = None
-                if ind_data.get('category_name'):
-                    cat_name = ind_data['category_name']
-                    if cat_name not in existing_categories:
-                        # 创建新分类
-                        new_cat = IndicatorCategory(name=cat_name, desc=f"自动创建于导入")
-                        cat_id = category_dao.create(new_cat)
-                        existing_categories[cat_name] = cat_id
-                        category_id = cat_id
-                    else:
-                        category_id = existing_categories[cat_name]
+                category_name = ind_data.get('category_name')
+                if category_name and category_name not in existing_categories:
+                    raise ValueError(f"分类 '{category_name}' 创建失败")
+                category_id = existing_categories.get(category_name)
                 
                 # 创建指标
                 indicator = Indicator(
@@ -536,7 +662,8 @@ class DataBatchImporter:
         
         return success_count, errors
     
-    def batch_import_risk_events(self, events: List[Dict]) -> Tuple[int, List[str]]:
+    def batch_import_risk_events(self, events: List[Dict],
+                                 progress_cb: ProgressCallback = None) -> Tuple[int, List[str]]:
         """
         批量导入风险事件到数据库（根据任务名称关联）
         
@@ -550,7 +677,9 @@ class DataBatchImporter:
         missions = self.mission_dao.get_all()
         mission_map = {m.name: m.id for m in missions}
         
-        for event_data in events:
+        total = len(events)
+        for n, event_data in enumerate(events, 1):
+            _report_progress(progress_cb, n, total)
             try:
                 mission_name = event_data['mission_name']
                 
@@ -578,7 +707,8 @@ class DataBatchImporter:
         
         return success_count, errors
     
-    def batch_import_fmea_items(self, fmea_items: List[Dict]) -> Tuple[int, List[str]]:
+    def batch_import_fmea_items(self, fmea_items: List[Dict],
+                                progress_cb: ProgressCallback = None) -> Tuple[int, List[str]]:
         """
         批量导入FMEA条目到数据库（根据任务名称关联）
         
@@ -592,7 +722,11 @@ class DataBatchImporter:
         missions = self.mission_dao.get_all()
         mission_map = {m.name: m.id for m in missions}
         
-        for fmea_data in fmea_items:
+        # 在内存中完成任务关联与构造，每 DB_CHUNK_ROWS 条批量写入一次
+        pending: List[FMEAItem] = []
+        total = len(fmea_items)
+        for n, fmea_data in enumerate(fmea_items, 1):
+            _report_progress(progress_cb, n, total)
             try:
                 mission_name = fmea_data['mission_name']
                 
@@ -603,8 +737,7 @@ class DataBatchImporter:
                 
                 mission_id: int = mission_map[mission_name]  # type: ignore
                 
-                # 创建FMEA条目
-                fmea_item = FMEAItem(
+                pending.append(FMEAItem(
                     mission_id=mission_id,
                     system=fmea_data.get('system', ''),
                     failure_mode=fmea_data['failure_mode'],
@@ -614,11 +747,94 @@ class DataBatchImporter:
                     S=fmea_data['S'],
                     O=fmea_data['O'],
                     D=fmea_data['D']
-                )
-                self.fmea_dao.create(fmea_item)
-                success_count += 1
+                ))
                 
             except Exception as e:
                 errors.append(f"导入FMEA '{fmea_data['failure_mode']}' 失败: {str(e)}")
+            
+            if len(pending) >= DB_CHUNK_ROWS:
+                success_count += self._bulk_create_fmea(pending, errors)
+                pending = []
+        
+        success_count += self._bulk_create_fmea(pending, errors)
+        
+        return success_count, errors
+    
+    def _bulk_create_fmea(self, items: List[FMEAItem], errors: List[str]) -> int:
+        """批量写入一组FMEA条目；整批失败时回滚并逐条写入以定位失败条目"""
+        try:
+            return self.fmea_dao.bulk_create(items)
+        except Exception:
+            success_count = 0
+            for fmea_item in items:
+                try:
+                    self.fmea_dao.create(fmea_item)
+                    success_count += 1
+                except Exception as e:
+                    errors.append(f"导入FMEA '{fmea_item.failure_mode}' 失败: {str(e)}")
+            return success_count
+    
+    def batch_import_fta_nodes(self, nodes: List[Dict],
+                               progress_cb: ProgressCallback = None) -> Tuple[int, List[str]]:
+        """
+        批量导入FTA节点与边到数据库（根据任务名称关联）
+        
+        节点按任务一次性批量写入，随后按名称解析父节点
+        （同一任务中已有的节点或本批新节点），所有边再用一次executemany写入。
+        
+        Returns:
+            Tuple[成功导入的节点数量, 错误信息列表]
+        """
+        success_count = 0
+        errors = []
+        
+        # 获取现有任务映射
+        missions = self.mission_dao.get_all()
+        mission_map = {m.name: m.id for m in missions}
+        
+        # 按任务分组，保持文件中的顺序
+        by_mission: Dict[int, List[Dict]] = {}
+        total = len(nodes)
+        for n, node_data in enumerate(nodes, 1):
+            _report_progress(progress_cb, n, total)
+            mission_name = node_data['mission_name']
+            if mission_name not in mission_map:
+                errors.append(f"导入节点 '{node_data['name']}' 失败: 找不到任务 '{mission_name}'")
+                continue
+            by_mission.setdefault(mission_map[mission_name], []).append(node_data)
+        
+        edges: List[FTAEdge] = []
+        for mission_id, rows in by_mission.items():
+            name_to_id = {n.name: n.id for n in self.fta_node_dao.get_by_mission(mission_id)}
+            try:
+                new_ids = self.fta_node_dao.create_many([
+                    FTANode(
+                        mission_id=mission_id,
+                        name=row['name'],
+                        node_type=row['node_type'],
+                        gate_type=row.get('gate_type'),
+                        probability=row.get('probability')
+                    )
+                    for row in rows
+                ])
+            except Exception as e:
+                errors.append(f"导入任务 {mission_id} 的FTA节点失败: {str(e)}")
+                continue
+            success_count += len(new_ids)
+            name_to_id.update((row['name'], node_id) for row, node_id in zip(rows, new_ids))
+            
+            for row, node_id in zip(rows, new_ids):
+                parent_name = row.get('parent_name')
+                if not parent_name:
+                    continue
+                if parent_name not in name_to_id:
+                    errors.append(f"节点 '{row['name']}' 的父节点 '{parent_name}' 不存在，未建立边")
+                    continue
+                edges.append(FTAEdge(parent_id=name_to_id[parent_name], child_id=node_id))
+        
+        try:
+            self.fta_edge_dao.bulk_create(edges)
+        except Exception as e:
+            errors.append(f"导入FTA边失败: {str(e)}")
         
         return success_count, errors